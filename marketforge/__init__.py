@@ -0,0 +1,6 @@
+"""
+MarketForge | SHARED LIBRARY
+
+Importable building blocks used by the stage scripts under scripts/.
+Scripts stay standalone; anything shared between stages lives here.
+"""
@@ -0,0 +1,7 @@
+"""python -m marketforge → same as the `marketforge` command."""
+
+import sys
+
+from marketforge.cli import main
+
+sys.exit(main())
@@ -0,0 +1,266 @@
+"""
+MarketForge | CHANGE-DATA-CAPTURE DELTA FEED
+
+✔ Every appender run gets a run sequence number (monotonic, shared by
+  all datasets, safe under the parallel DAG runner)
+✔ Only rows INSERTED (I) or REPLACED (U) in a master are emitted;
+  re-appending an identical day emits nothing
+✔ One Parquet file per dataset + trade date + run:
+
+    data/delta/<dataset>/<YYYYMMDD>/<seq>.parquet
+
+✔ data/delta/manifest.jsonl → one line per run (seq, dataset, rows,
+  trade dates, files), written in seq order
+✔ spill= → captured rows are parked on disk per trade date until the
+  run closes (low-memory appender mode), same files as in RAM
+✔ snapshot() → manifest line {"snapshot": true} when a tool rewrote a
+  whole master (bulk rebuild): consumers reload that dataset instead
+  of applying row deltas
+
+Consumers: read manifest lines with seq > last applied, then upsert each
+file's rows into their copy on the dataset's dedup keys (MASTERS), in
+row order (last row wins). CDC_SEQ / CDC_OP columns say where a row
+came from.
+"""
+
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+import json
+import os
+import shutil
+import pandas as pd
+
+from marketforge import dates
+from marketforge.io import file_lock
+from marketforge.masters import MASTERS
+from marketforge.settings import DATA
+
+DELTA = DATA / "delta"
+SEQ_FILE = DELTA / "SEQUENCE"
+MANIFEST = DELTA / "manifest.jsonl"
+LOCK_FILE = DELTA / ".lock"
+
+
+# ==================================================
+# SEQUENCE (CROSS-PROCESS)
+# ==================================================
+def _locked():
+    return file_lock(LOCK_FILE)
+
+
+def last_seq() -> int:
+    return int(SEQ_FILE.read_text()) if SEQ_FILE.exists() else 0
+
+
+def _next_seq() -> int:
+    seq = last_seq() + 1
+    tmp = SEQ_FILE.with_name(f".SEQUENCE.{os.getpid()}.tmp")
+    tmp.write_text(str(seq))
+    os.replace(tmp, SEQ_FILE)
+    return seq
+
+
+# ==================================================
+# CHANGED ROWS
+# ==================================================
+def _row_hash(df: pd.DataFrame) -> pd.Index:
+    return pd.Index(pd.util.hash_pandas_object(df, index=False).to_numpy())
+
+
+def changed_rows(
+    old: pd.DataFrame,
+    new: pd.DataFrame,
+    keys: list,
+    date_col: str,
+) -> pd.DataFrame:
+    """
+    Rows of `new` that an upsert into `old` actually inserts or changes,
+    tagged CDC_OP = I / U. Only old rows on or after the first new trade
+    date are compared (keys always include the date).
+    """
+    new = new.drop_duplicates(subset=keys, keep="last")
+
+    if new.empty:
+        return new.assign(CDC_OP=pd.Series(dtype="object"))
+
+    if old.empty:
+        return new.assign(CDC_OP="I")
+
+    old = old[dates.key(old[date_col]) >= dates.key(new[date_col]).min()]
+    cols = [c for c in new.columns if c in old.columns]
+
+    same = _row_hash(new[cols]).isin(_row_hash(old[cols]))
+    known = _row_hash(new[keys]).isin(_row_hash(old[keys]))
+
+    out = new[~same].copy()
+    out["CDC_OP"] = ["U" if k else "I" for k in known[~same]]
+    return out
+
+
+# ==================================================
+# PER-RUN FEED
+# ==================================================
+class DeltaFeed:
+    def __init__(
+        self,
+        dataset: str,
+        keys: list | None = None,
+        date_col: str | None = None,
+        spill: Path | None = None,
+    ):
+        spec = MASTERS.get(dataset, {})
+
+        self.dataset = dataset
+        self.keys = keys or spec["dedup"]
+        self.date_col = date_col or spec["date_col"]
+        self.parts = []
+
+        # spill → captured rows go to spill/<YYYYMMDD>/ instead of RAM
+        self.spill = spill
+        self.spilled = 0
+        if spill is not None:
+            if spill.exists():
+                shutil.rmtree(spill)
+            spill.mkdir(parents=True)
+
+    def capture(self, old: pd.DataFrame | None, new: pd.DataFrame) -> int:
+        """Record what upserting `new` into `old` changes. Returns row count."""
+        if old is None:
+            old = new.iloc[0:0]
+
+        delta = changed_rows(old, new, self.keys, self.date_col)
+        if delta.empty:
+            return 0
+
+        if self.spill is None:
+            self.parts.append(delta)
+            return len(delta)
+
+        for d, part in delta.groupby(dates.key(delta[self.date_col]), sort=False):
+            out = self.spill / str(d) / f"{self.spilled:08d}.pkl"
+            out.parent.mkdir(exist_ok=True)
+            part.to_pickle(out)
+            self.spilled += 1
+        return len(delta)
+
+    def _days(self):
+        """(trade date, rows) in date order, capture order within a day."""
+        if self.spill is None:
+            if self.parts:
+                delta = pd.concat(self.parts, ignore_index=True)
+                yield from delta.groupby(dates.key(delta[self.date_col]), sort=True)
+            return
+
+        for d in sorted(self.spill.iterdir(), key=lambda p: int(p.name)):
+            yield int(d.name), pd.concat(
+                (pd.read_pickle(p) for p in sorted(d.glob("*.pkl"))),
+                ignore_index=True,
+            )
+
+    def close(self) -> dict:
+        """Take the next seq, write delta files, append the manifest line."""
+        started = datetime.now().isoformat(timespec="seconds")
+
+        with _locked():
+            seq = _next_seq()
+            files = []
+            days = []
+            counts = {"rows": 0, "inserted": 0, "replaced": 0}
+
+            for d, part in self._days():
+                part.insert(0, "CDC_SEQ", seq)
+
+                out = DELTA / self.dataset / str(d) / f"{seq:08d}.parquet"
+                out.parent.mkdir(parents=True, exist_ok=True)
+                part.to_parquet(out, index=False)
+                files.append(out.relative_to(DELTA).as_posix())
+                days.append(int(d))
+
+                counts["rows"] += len(part)
+                counts["inserted"] += int((part["CDC_OP"] == "I").sum())
+                counts["replaced"] += int((part["CDC_OP"] == "U").sum())
+
+            entry = {
+                "seq": seq,
+                "dataset": self.dataset,
+                "created": started,
+                "keys": self.keys,
+                **counts,
+                "trade_dates": days,
+                "files": files,
+            }
+
+            with open(MANIFEST, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry) + "\n")
+
+        if self.spill is not None:
+            shutil.rmtree(self.spill)
+
+        print(
+            f" Delta feed    : seq {seq} | {entry['rows']} rows "
+            f"(I {entry['inserted']} / U {entry['replaced']})"
+        )
+        return entry
+
+
+@contextmanager
+def feed(
+    dataset: str,
+    keys: list | None = None,
+    date_col: str | None = None,
+    spill: Path | None = None,
+):
+    """
+    with cdc.feed("options") as delta:
+        delta.capture(old, g)
+
+    The run is published (seq + manifest) only if the block succeeds;
+    a failed block publishes nothing and leaves no spill behind.
+    spill → captured rows wait on disk (bounded-memory appender runs).
+    """
+    f = DeltaFeed(dataset, keys, date_col, spill)
+    try:
+        yield f
+    except BaseException:
+        if spill is not None:
+            shutil.rmtree(spill, ignore_errors=True)    # unpublished run → no leftovers
+        raise
+    f.close()
+
+
+def snapshot(dataset: str, note: str = "") -> dict:
+    """Record that `dataset` was rewritten wholesale (no row deltas)."""
+    with _locked():
+        seq = _next_seq()
+        entry = {
+            "seq": seq,
+            "dataset": dataset,
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "snapshot": True,
+            "note": note,
+            "rows": 0,
+            "trade_dates": [],
+            "files": [],
+        }
+        DELTA.mkdir(parents=True, exist_ok=True)
+        with open(MANIFEST, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+
+    print(f" Delta feed    : seq {seq} | {dataset} snapshot — consumers reload it")
+    return entry
+
+
+def read_manifest(after: int = 0, dataset: str | None = None) -> list:
+    """Manifest entries with seq > `after` (what a consumer still has to apply)."""
+    if not MANIFEST.exists():
+        return []
+
+    out = []
+    for line in MANIFEST.read_text(encoding="utf-8").splitlines():
+        if not line.strip():
+            continue
+        e = json.loads(line)
+        if e["seq"] > after and (dataset is None or e["dataset"] == dataset):
+            out.append(e)
+    return out
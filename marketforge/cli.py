@@ -0,0 +1,215 @@
+"""
+MarketForge | COMMAND LINE
+
+    marketforge download fo
+    marketforge clean options
+    marketforge append options
+    marketforge run clean_options append_options analytics_options
+    marketforge pipeline --branch fo
+    marketforge watch
+    marketforge catchup --dry-run
+    marketforge status
+
+Only stdlib is imported up front. A stage's own heavy imports (pandas,
+numpy, requests) load when that stage runs, so `status` / `stages`
+answer in milliseconds. `run` executes several stages in ONE
+interpreter: pandas & friends are imported once and reused.
+
+Stage names and scripts come from scripts/run_pipeline.py (STAGES),
+so the CLI and the DAG orchestrator never drift apart.
+
+The stages run from the checkout's scripts/ folder, which a regular
+`pip install .` does not ship: install editable (`pip install -e .`)
+or use `python -m marketforge` inside the checkout.
+"""
+
+from pathlib import Path
+import argparse
+import json
+import runpy
+import sys
+import time
+import traceback
+
+CODE_ROOT = Path(__file__).resolve().parents[1]
+SCRIPTS = CODE_ROOT / "scripts"
+
+# non-DAG tools: command → (script, help)
+TOOLS = {
+    "pipeline": ("run_pipeline.py", "DAG run of all branches (parallel, skip-unchanged)"),
+    "watch": ("watch_pipeline.py", "run a branch chain as soon as its raw file lands"),
+    "catchup": ("catch_up.py", "fetch + replay every session missing from the masters"),
+    "schedule": ("downloader/00_schedule_downloads.py", "download each dataset the moment NSE publishes it"),
+    "poll": ("downloader/01_poll_indices_intraday.py", "intraday allIndices poller + EOD index file"),
+    "rebuild": ("append/05_rebuild_masters.py", "bulk rebuild masters from processed files"),
+    "compact": ("append/06_compact_masters.py", "re-sort / dedup drifted master files (quiet window)"),
+    "serve": ("serve_shared_masters.py", "publish masters in shared memory for worker processes"),
+    "check": ("99_check_master_last_rows.py", "print last row of every master"),
+    "generate": ("bench/generate_nse_data.py", "write synthetic NSE raw files"),
+    "bench": ("bench/run_benchmarks.py", "per-stage throughput on synthetic data"),
+    "gate": ("bench/regression_gate.py", "E2E performance regression gate"),
+    "stub": ("bench/nse_stub_server.py", "local allIndices stub server for offline tests"),
+}
+
+# ==================================================
+# STAGE TABLE (LAZY)
+# ==================================================
+_stages = None
+
+
+def stages() -> dict:
+    """STAGES from run_pipeline.py (stdlib-only module, cheap to load)."""
+    global _stages
+    if _stages is None:
+        _stages = runpy.run_path(str(SCRIPTS / "run_pipeline.py"), run_name="run_pipeline")["STAGES"]
+    return _stages
+
+
+def verbs() -> dict:
+    """{"clean": {"options": "clean_options", ...}, ...}"""
+    out = {}
+    for name in stages():
+        verb, target = name.split("_", 1)
+        out.setdefault(verb, {})[target] = name
+    return out
+
+# ==================================================
+# RUN A SCRIPT IN THIS INTERPRETER
+# ==================================================
+def run_script(rel: str, argv: list = (), stage: str | None = None) -> int:
+    """stage → run under metrics.stage(stage), one metrics record per run."""
+    script = SCRIPTS / rel
+    saved = sys.argv
+    sys.argv = [str(script), *argv]
+
+    try:
+        if stage is None:
+            runpy.run_path(str(script), run_name="__main__")
+        else:
+            from marketforge import metrics
+            metrics.run(stage, script, argv)
+    except SystemExit as e:
+        if e.code not in (None, 0):
+            return e.code if isinstance(e.code, int) else 1
+    finally:
+        sys.argv = saved
+
+    return 0
+
+
+def run_stages(names: list) -> int:
+    table = stages()
+
+    unknown = [n for n in names if n not in table]
+    if unknown:
+        print(f" Unknown stage(s): {', '.join(unknown)} — see `marketforge stages`")
+        return 2
+
+    for name in names:
+        print(f"\n==> {name}")
+        start = time.perf_counter()
+
+        try:
+            code = run_script(table[name]["script"], stage=name)
+        except Exception:
+            traceback.print_exc()
+            code = 1
+
+        print(f"==> {name} {'OK' if code == 0 else 'FAILED'} in {time.perf_counter() - start:.1f}s")
+
+        if code != 0:
+            return code
+
+    return 0
+
+# ==================================================
+# CHEAP COMMANDS (NO PANDAS)
+# ==================================================
+def cmd_stages() -> int:
+    for name, s in stages().items():
+        after = ", ".join(s["after"]) or "-"
+        print(f" {name:<20} {s['branch']:<8} {s['script']:<48} after: {after}")
+    return 0
+
+
+def cmd_status() -> int:
+    from marketforge.settings import DATA, LOGS
+
+    print(f" Root : {DATA.parent}")
+
+    state_file = DATA / "state" / "pipeline_state.json"
+    state = json.loads(state_file.read_text()) if state_file.exists() else {}
+
+    runs = sorted((LOGS / "pipeline").glob("run_*.json"))
+    last = json.loads(runs[-1].read_text()) if runs else None
+
+    print(f" Last pipeline run : {runs[-1].name if runs else 'never'}")
+
+    by_stage = {r["stage"]: r for r in (last or {}).get("stages", [])}
+
+    print(f"\n {'STAGE':<20}{'LAST STATUS':<13}{'WALL s':>8}  LAST SUCCESS")
+    for name in stages():
+        r = by_stage.get(name, {})
+        wall = f"{r['wall_s']:.1f}" if "wall_s" in r else "-"
+        ok = state.get(name, {}).get("finished", "-")
+        print(f" {name:<20}{r.get('status', '-'):<13}{wall:>8}  {ok}")
+
+    return 0
+
+# ==================================================
+# PARSER
+# ==================================================
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="marketforge", description="MarketForge NSE data engine")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    for verb, targets in verbs().items():
+        p = sub.add_parser(verb, help=f"{verb} stage ({', '.join(targets)})")
+        p.add_argument("target", choices=sorted(targets) + ["all"])
+
+    p = sub.add_parser("run", help="run several stages in one interpreter")
+    p.add_argument("stage", nargs="+")
+
+    sub.add_parser("stages", help="list stages and dependencies")
+    sub.add_parser("status", help="last pipeline run + last success per stage")
+
+    for name, (_, help_) in TOOLS.items():
+        p = sub.add_parser(name, help=help_, add_help=False)
+        p.add_argument("args", nargs=argparse.REMAINDER)
+
+    return parser
+
+
+def main(argv: list | None = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+
+    if not (SCRIPTS / "run_pipeline.py").exists():
+        print(
+            f" marketforge: stage scripts not found in {SCRIPTS}\n"
+            " The CLI runs the checkout's scripts/ folder — install with "
+            "`pip install -e .` from the repository, or run `python -m marketforge` there."
+        )
+        return 2
+
+    # tools own their flags → pass everything through untouched
+    if argv and argv[0] in TOOLS:
+        return run_script(TOOLS[argv[0]][0], argv[1:])
+
+    args = build_parser().parse_args(argv)
+
+    if args.cmd == "stages":
+        return cmd_stages()
+
+    if args.cmd == "status":
+        return cmd_status()
+
+    if args.cmd == "run":
+        return run_stages(args.stage)
+
+    targets = verbs()[args.cmd]
+    names = list(targets.values()) if args.target == "all" else [targets[args.target]]
+    return run_stages(names)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,123 @@
+"""
+MarketForge | TRADE DATE KEY (YYYYMMDD INT)
+
+Every master keys its rows on one integer column:
+
+    TRADE_DATE = 20240105          # int32, ordering == date ordering
+
+    df[df["TRADE_DATE"] >= dates.of(since)]        # filter, no parsing
+    eq.merge(mto, on=["TRADE_DATE", "SYMBOL_ID"])  # join, no parsing
+
+✔ key()          date-like Series (datetime, date, ISO / NSE strings,
+                 YYYYMMDD ints) → int32 YYYYMMDD — used ONCE, where raw
+                 NSE dates enter (cleaners, migration); text is parsed
+                 per value (ISO, then day-first), so mixed layouts in
+                 one column all convert
+✔ days()         YYYYMMDD → days since 1970-01-01 (int32), pure integer
+                 arithmetic — for day counts (time to expiry, gaps)
+✔ of() / to_date() / to_datetime() for the few places that need real dates
+✔ from_name()    trade date in a daily file name (YYYYMMDD or NSE's
+                 DDMMYYYY) — orders files by date, not by mtime
+✔ Nullable input (bad / missing dates) → Int32 <NA>, callers drop them
+
+YYYYMMDD rather than an epoch-day ordinal: MTO / F&O / indices masters
+already store it, it stays readable in CSV masters and file names, and
+days() gives the ordinal when arithmetic is needed.
+"""
+
+from datetime import date
+import re
+
+import numpy as np
+import pandas as pd
+
+DTYPE = "int32"
+
+
+# ==================================================
+# → KEY
+# ==================================================
+def _from_datetime(s: pd.Series) -> pd.Series:
+    return s.dt.year * 10000 + s.dt.month * 100 + s.dt.day
+
+
+def _parse(txt: pd.Series) -> pd.Series:
+    """
+    Per-value parse: ISO first ("2024-01-05", "2024-01-05 00:00:00" mixed
+    in one column), then day-first NSE forms ("05-Jan-2024", "05/01/2024")
+    for whatever is left. Never one format inferred from the first row.
+    """
+    ts = pd.to_datetime(txt, format="ISO8601", errors="coerce")
+    rest = ts.isna() & txt.notna() & (txt != "")
+    if rest.any():
+        ts = ts.copy()
+        ts[rest] = pd.to_datetime(txt[rest], format="mixed", dayfirst=True, errors="coerce")
+    return ts
+
+
+def key(s: pd.Series, fmt: str | None = None) -> pd.Series:
+    """int32 YYYYMMDD (Int32 when some values are not dates)."""
+    if pd.api.types.is_datetime64_any_dtype(s):
+        k = _from_datetime(s)
+    elif pd.api.types.is_numeric_dtype(s):
+        k = pd.to_numeric(s, errors="coerce")
+    else:
+        txt = s.astype("string").str.strip()
+        digits = txt.str.fullmatch(r"\d{8}(\.0+)?").fillna(False)
+
+        if fmt is None and digits.all():
+            k = pd.to_numeric(txt.str[:8], errors="coerce")     # already keys
+        elif fmt is not None:
+            k = _from_datetime(pd.to_datetime(txt, format=fmt, errors="coerce"))
+        else:
+            k = _from_datetime(_parse(txt))
+
+    if k.isna().any():
+        return k.astype("Int32")
+    return k.astype(DTYPE)
+
+
+def of(d: date) -> int:
+    return d.year * 10000 + d.month * 100 + d.day
+
+
+def _valid(y: int, m: int, d: int) -> bool:
+    try:
+        return 1990 <= y <= 2100 and bool(date(y, m, d))
+    except ValueError:
+        return False
+
+
+def from_name(name: str) -> int:
+    """YYYYMMDD from mto_20240105.csv / foDDMMYYYY / optidxDDMMYYYY.csv (0 = none)."""
+    for g in re.findall(r"(?<!\d)(\d{8})(?!\d)", name):
+        if _valid(int(g[:4]), int(g[4:6]), int(g[6:])):
+            return int(g)
+        if _valid(int(g[4:]), int(g[2:4]), int(g[:2])):
+            return int(g[4:] + g[2:4] + g[:2])
+    return 0
+
+# ==================================================
+# KEY →
+# ==================================================
+def days(k) -> np.ndarray:
+    """YYYYMMDD → days since epoch (int32), no string parsing."""
+    k = np.asarray(k, dtype="int64")
+    y, md = np.divmod(k, 10000)
+    m, d = np.divmod(md, 100)
+
+    months = ((y - 1970) * 12 + (m - 1)).astype("datetime64[M]")
+    return (months.astype("datetime64[D]").astype("int64") + d - 1).astype(DTYPE)
+
+
+def to_datetime(k) -> pd.Series:
+    s = k if isinstance(k, pd.Series) else pd.Series(k)
+    return pd.Series(
+        days(s).astype("datetime64[D]").astype("datetime64[ns]"),
+        index=s.index, name=s.name,
+    )
+
+
+def to_date(k: int) -> date:
+    k = int(k)
+    return date(k // 10000, k // 100 % 100, k % 100)
@@ -0,0 +1,122 @@
+"""
+MarketForge | FIXED-POINT PRICE ENCODING (PAISE)
+
+Parquet twins can store prices as scaled integers instead of float64:
+
+    fixed.write_parquet(df, path)     # OPEN 1234.55 → 123455 (int32)
+    df = fixed.read_parquet(path)     # → 1234.55 float64 again, bit-exact
+
+✔ Price columns (PRICE_COLS) → paise, int32 when the range fits, else int64
+✔ A column is encoded ONLY if every value round-trips exactly
+  (paise / 100 == original float) — anything off the paise grid stays float
+✔ Original dtype kept in the file's schema metadata → read returns the
+  frame the writer had (int strikes stay int, floats stay float64)
+✔ Encoded columns: DELTA_BINARY_PACKED + zstd — masters are sorted by
+  date / strike, so neighbouring prices differ by a few ticks and pack
+  into a few bits per value
+✔ Files without the metadata (float twins) read back unchanged
+
+Enabled for all master Parquet writes with MARKETFORGE_PRICE_ENCODING=paise
+(see settings.py); CSV masters stay plain text either way.
+"""
+
+from pathlib import Path
+import json
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+SCALE = 100     # rupees → paise
+META_KEY = b"marketforge.fixed"
+
+INT32_MAX = np.iinfo("int32").max
+
+PRICE_COLS = {
+    # equity / indices
+    "OPEN", "HIGH", "LOW", "CLOSE", "LAST", "PREVCLOSE",
+    # F&O
+    "OPEN_PRICE", "HI_PRICE", "LO_PRICE", "CLOSE_PRICE", "SETTLE_PRICE",
+    "STRIKE_PRICE", "UNDERLYING",
+}
+
+
+# ==================================================
+# ENCODE / DECODE (IN MEMORY)
+# ==================================================
+def to_paise(s: pd.Series) -> pd.Series | None:
+    """Series in paise, or None if any value would not round-trip exactly."""
+    v = pd.to_numeric(s, errors="coerce").to_numpy(dtype="float64")
+    ok = ~np.isnan(v)
+
+    p = np.rint(v[ok] * SCALE)
+    if not np.array_equal(p / SCALE, v[ok]):
+        return None
+
+    dtype = "int32" if not len(p) or np.abs(p).max() <= INT32_MAX else "int64"
+
+    full = np.zeros(len(v), dtype=dtype)
+    full[ok] = p
+    values = full if ok.all() else pd.arrays.IntegerArray(full, ~ok)    # NaN → <NA>
+    return pd.Series(values, index=s.index, name=s.name)
+
+
+def encode(df: pd.DataFrame) -> tuple:
+    """(frame with paise columns, {col: original dtype}) — input untouched."""
+    out = df.copy()
+    encoded = {}
+
+    for c in df.columns:
+        if c not in PRICE_COLS or not pd.api.types.is_numeric_dtype(df[c]):
+            continue
+        p = to_paise(df[c])
+        if p is not None:
+            encoded[c] = str(df[c].dtype)
+            out[c] = p
+
+    return out, encoded
+
+
+def decode(df: pd.DataFrame, encoded: dict) -> pd.DataFrame:
+    for c, dtype in encoded.items():
+        if c not in df.columns:
+            continue
+        v = df[c].astype("float64") / SCALE
+        df[c] = v if dtype == "float64" else v.astype(dtype)
+    return df
+
+# ==================================================
+# PARQUET
+# ==================================================
+def write_parquet(df: pd.DataFrame, path: Path, compression_level: int | None = None) -> dict:
+    """Write df with paise price columns; returns the encoded-column map."""
+    enc, encoded = encode(df)
+
+    table = pa.Table.from_pandas(enc, preserve_index=False)
+    meta = dict(table.schema.metadata or {})
+    meta[META_KEY] = json.dumps(encoded).encode()
+    table = table.replace_schema_metadata(meta)
+
+    pq.write_table(
+        table,
+        path,
+        compression="zstd",
+        compression_level=compression_level,
+        use_dictionary=[c for c in enc.columns if c not in encoded],
+        column_encoding={c: "DELTA_BINARY_PACKED" for c in encoded},
+    )
+    return encoded
+
+
+def read_parquet(path: Path, columns: list | None = None, decoded: bool = True) -> pd.DataFrame:
+    """
+    Read a master twin; paise columns come back as their original dtype.
+    decoded=False keeps them as int32 / int64 paise (half the memory of
+    float64 — for scans that only compare / sort / diff prices).
+    """
+    table = pq.read_table(path, columns=columns)
+    meta = table.schema.metadata or {}
+    encoded = json.loads(meta[META_KEY]) if META_KEY in meta else {}
+    df = table.to_pandas()
+    return decode(df, encoded) if decoded else df
@@ -0,0 +1,151 @@
+"""
+MarketForge | SAFE FILE WRITES
+
+✔ Write to a sibling temp file, then os.replace → readers never see
+  a half-written master
+✔ Skip-unchanged writes: a content digest of the merged frame is kept
+  per master folder (.digests.json); identical result → no CSV / Parquet
+  rewrite on reruns
+✔ Parquet twins honour settings.PRICE_ENCODING ("paise" → fixed-point
+  prices, marketforge/fixed.py)
+✔ zone_cols → per-block min / max sidecar written with the CSV
+  (marketforge/zones.py), rebuilt if missing even when the CSV is skipped
+✔ file_lock(): cross-process O_EXCL lock for small shared state files
+  (delta sequence, symbol registry) written by parallel appenders
+"""
+
+from contextlib import contextmanager
+from pathlib import Path
+import hashlib
+import json
+import os
+import time
+import pandas as pd
+
+from marketforge import fixed, zones
+from marketforge.settings import PRICE_ENCODING
+
+DIGEST_FILE = ".digests.json"
+
+
+LOCK_TIMEOUT = 30   # seconds to wait for another writer
+LOCK_STALE = 300    # lock older than this → writer died, take it over
+
+
+def _tmp_for(path: Path) -> Path:
+    return path.with_name(f".{path.name}.{os.getpid()}.tmp")
+
+
+def atomic_to_csv(df: pd.DataFrame, path: Path) -> None:
+    tmp = _tmp_for(path)
+    df.to_csv(tmp, index=False)
+    os.replace(tmp, path)
+
+
+def to_parquet(df: pd.DataFrame, path: Path) -> None:
+    if PRICE_ENCODING == "paise":
+        fixed.write_parquet(df, path)
+    else:
+        df.to_parquet(path, index=False)
+
+
+def atomic_to_parquet(df: pd.DataFrame, path: Path) -> None:
+    tmp = _tmp_for(path)
+    to_parquet(df, tmp)
+    os.replace(tmp, path)
+
+
+@contextmanager
+def file_lock(lock: Path, timeout: float = LOCK_TIMEOUT, stale: float = LOCK_STALE):
+    lock.parent.mkdir(parents=True, exist_ok=True)
+    deadline = time.monotonic() + timeout
+
+    while True:
+        try:
+            fd = os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            try:
+                if time.time() - lock.stat().st_mtime > stale:
+                    lock.unlink()
+                    continue
+            except FileNotFoundError:
+                continue
+            if time.monotonic() > deadline:
+                raise RuntimeError(f" Lock busy: {lock}")
+            time.sleep(0.05)
+
+    try:
+        os.close(fd)
+        yield
+    finally:
+        lock.unlink(missing_ok=True)
+
+
+# ==================================================
+# SKIP-UNCHANGED WRITES
+# ==================================================
+def frame_digest(df: pd.DataFrame) -> str:
+    """Row-order and column-name sensitive digest of the frame's values."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update("\x1f".join(map(str, df.columns)).encode())
+    h.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return h.hexdigest()
+
+
+def _stat(path: Path) -> list:
+    st = path.stat()
+    return [st.st_size, st.st_mtime_ns]
+
+
+def load_digests(folder: Path) -> dict:
+    f = folder / DIGEST_FILE
+    if not f.exists():
+        return {}
+    try:
+        return json.loads(f.read_text())
+    except ValueError:
+        return {}
+
+
+def save_digests(folder: Path, digests: dict) -> None:
+    f = folder / DIGEST_FILE
+    tmp = _tmp_for(f)
+    tmp.write_text(json.dumps(digests, separators=(",", ":"), sort_keys=True))
+    os.replace(tmp, f)
+
+
+def write_if_changed(
+    df: pd.DataFrame,
+    csv_path: Path,
+    digests: dict,
+    parquet_path: Path | None = None,
+    zone_cols: list | None = None,
+) -> bool:
+    """
+    Write CSV (+ Parquet twin, + zone map) only if the content differs
+    from the last write. A file touched outside this path (size / mtime
+    drift) is always rewritten. Returns True if anything was written.
+    """
+    digest = frame_digest(df)
+    entry = digests.get(csv_path.name)
+
+    if (
+        entry is not None
+        and entry["digest"] == digest
+        and csv_path.exists()
+        and _stat(csv_path) == entry["stat"]
+        and (parquet_path is None or parquet_path.exists())
+    ):
+        if zone_cols and not zones.fresh(csv_path):
+            zones.build(csv_path, df, zone_cols)
+        return False
+
+    atomic_to_csv(df, csv_path)
+    if parquet_path is not None:
+        atomic_to_parquet(df, parquet_path)
+    if zone_cols:
+        zones.build(csv_path, df, zone_cols)
+
+    digests[csv_path.name] = {"digest": digest, "stat": _stat(csv_path)}
+    return True
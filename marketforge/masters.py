@@ -0,0 +1,331 @@
+"""
+MarketForge | MASTER DATASET CONTRACTS
+
+One place that knows, for every master:
+- where its processed daily inputs live
+- how a daily file is normalized (same rules as the 04_append_* scripts)
+- dedup / sort keys
+- where per-symbol outputs go
+
+Used by bulk tools (rebuild, catch-up, compaction) that must treat
+all masters the same way.
+"""
+
+from datetime import date
+import csv
+
+import pandas as pd
+
+from marketforge.settings import ROOT
+from marketforge import dates, fixed
+from marketforge.zones import ZONE_COLS
+
+PROCESSED = ROOT / "data" / "processed"
+MASTER = ROOT / "data" / "master"
+
+
+# ==================================================
+# NORMALIZERS (MIRROR THE APPENDERS)
+# ==================================================
+def _upper_cols(df: pd.DataFrame) -> pd.DataFrame:
+    df.columns = (
+        df.columns.astype(str)
+        .str.strip()
+        .str.upper()
+    )
+    return df
+
+
+def _require(df: pd.DataFrame, cols: list, name: str) -> pd.DataFrame:
+    missing = set(cols) - set(df.columns)
+    if missing:
+        raise RuntimeError(f"Missing columns {sorted(missing)} in {name}")
+    return df[cols].copy()
+
+
+def _ints(df: pd.DataFrame, cols: list) -> None:
+    for c in cols:
+        df[c] = (
+            pd.to_numeric(df[c], errors="coerce")
+            .fillna(0)
+            .astype("int64")
+        )
+
+
+def _floats(df: pd.DataFrame, cols: list) -> None:
+    for c in cols:
+        df[c] = pd.to_numeric(df[c], errors="coerce").astype("float64")
+
+
+EQUITY_COLS = [
+    "TRADE_DATE", "SYMBOL", "SERIES",
+    "OPEN", "HIGH", "LOW", "CLOSE", "LAST", "PREVCLOSE",
+    "TOTTRDQTY", "TOTTRDVAL", "TOTALTRADES",
+    "ISIN",
+]
+
+
+def normalize_equity(df: pd.DataFrame, name: str) -> pd.DataFrame:
+    df = _upper_cols(df).rename(columns={"DATE": "TRADE_DATE"})    # pre-key daily files
+    df["SERIES"] = df["SERIES"].astype(str).str.strip()
+    df = _require(df[df["SERIES"] == "EQ"], EQUITY_COLS, name)
+
+    df["TRADE_DATE"] = dates.key(df["TRADE_DATE"])
+    df = df[df["TRADE_DATE"].notna()]
+
+    _floats(df, ["OPEN", "HIGH", "LOW", "CLOSE", "LAST", "PREVCLOSE", "TOTTRDVAL"])
+    _ints(df, ["TOTTRDQTY", "TOTALTRADES"])
+
+    df["SYMBOL"] = df["SYMBOL"].astype(str).str.strip()
+    return df
+
+
+MTO_COLS = [
+    "TRADE_DATE", "RECORD_TYPE", "SR_NO", "SYMBOL", "SERIES",
+    "TRADED_QTY", "DELIVERABLE_QTY", "DELIVERY_PCT",
+]
+
+
+def normalize_mto(df: pd.DataFrame, name: str) -> pd.DataFrame:
+    df = _require(_upper_cols(df), MTO_COLS, name)
+
+    df["TRADE_DATE"] = dates.key(df["TRADE_DATE"])
+    _ints(df, ["RECORD_TYPE", "SR_NO", "TRADED_QTY", "DELIVERABLE_QTY"])
+    _floats(df, ["DELIVERY_PCT"])
+
+    df["SYMBOL"] = df["SYMBOL"].astype(str).str.strip().str.upper()
+    df["SERIES"] = df["SERIES"].astype(str).str.strip()
+
+    return df[df["SERIES"] == "EQ"]
+
+
+FUTURES_COLS = [
+    "INSTRUMENT", "SYMBOL", "EXP_DATE",
+    "OPEN_PRICE", "HI_PRICE", "LO_PRICE", "CLOSE_PRICE",
+    "OPEN_INT", "TRD_VAL", "TRD_QTY", "NO_OF_CONT", "NO_OF_TRADE",
+    "TRADE_DATE",
+]
+
+OI_ALIASES = ["OPEN_INT*", "OPEN_INT", "OPNINTRST"]
+
+
+def normalize_futures(df: pd.DataFrame, name: str) -> pd.DataFrame:
+    df = _upper_cols(df)
+
+    oi_col = next((c for c in OI_ALIASES if c in df.columns), None)
+    if not oi_col:
+        raise RuntimeError(f"No OPEN INTEREST column found in {name}")
+    df = df.rename(columns={oi_col: "OPEN_INT"})
+
+    df = _require(df, FUTURES_COLS, name)
+
+    df["TRADE_DATE"] = pd.to_numeric(df["TRADE_DATE"], errors="coerce").astype("Int64")
+    df["EXP_DATE"] = pd.to_numeric(df["EXP_DATE"], errors="coerce").astype("Int64")
+
+    for c in ["OPEN_PRICE", "HI_PRICE", "LO_PRICE", "CLOSE_PRICE",
+              "OPEN_INT", "TRD_VAL", "TRD_QTY", "NO_OF_CONT", "NO_OF_TRADE"]:
+        df[c] = pd.to_numeric(df[c], errors="coerce")
+
+    df["SYMBOL"] = df["SYMBOL"].astype(str).str.strip()
+
+    return df[df["TRADE_DATE"].notna() & df["EXP_DATE"].notna()]
+
+
+OPTIONS_COLS = [
+    "INSTRUMENT", "SYMBOL", "TRADE_DATE", "EXP_DATE", "STRIKE_PRICE", "OPT_TYPE",
+    "OPEN_PRICE", "HI_PRICE", "LO_PRICE", "CLOSE_PRICE",
+    "OPEN_INT", "TRD_QTY", "NO_OF_CONT", "NO_OF_TRADE", "NOTION_VAL", "PR_VAL",
+]
+
+
+def normalize_options(df: pd.DataFrame, name: str) -> pd.DataFrame:
+    df = _require(_upper_cols(df), OPTIONS_COLS, name)
+
+    df["TRADE_DATE"] = pd.to_numeric(df["TRADE_DATE"], errors="coerce").astype("Int64")
+    df["EXP_DATE"] = pd.to_numeric(df["EXP_DATE"], errors="coerce").astype("Int64")
+    df["STRIKE_PRICE"] = pd.to_numeric(df["STRIKE_PRICE"], errors="coerce").astype("int64")
+
+    _floats(df, ["OPEN_PRICE", "HI_PRICE", "LO_PRICE", "CLOSE_PRICE", "PR_VAL"])
+    _ints(df, ["OPEN_INT", "TRD_QTY", "NO_OF_CONT", "NO_OF_TRADE", "NOTION_VAL"])
+
+    df["SYMBOL"] = df["SYMBOL"].astype(str).str.strip()
+    df["OPT_TYPE"] = df["OPT_TYPE"].astype(str).str.strip()
+
+    return df[df["TRADE_DATE"].notna() & df["EXP_DATE"].notna()]
+
+
+INDEX_COLS = ["TRADE_DATE", "SYMBOL", "OPEN", "HIGH", "LOW", "CLOSE"]
+
+
+def normalize_indices(df: pd.DataFrame, name: str) -> pd.DataFrame:
+    df = df[df["INDEX_NAME"] == "NIFTY 50"]
+
+    return pd.DataFrame({
+        "TRADE_DATE": df["TRADE_DATE"].astype("int64"),
+        "SYMBOL": "NIFTY",
+        "OPEN": df["OPEN"].astype("float64"),
+        "HIGH": df["HIGH"].astype("float64"),
+        "LOW": df["LOW"].astype("float64"),
+        "CLOSE": df["CLOSE"].astype("float64"),
+    })[INDEX_COLS]
+
+
+# ==================================================
+# MASTER REGISTRY
+# ==================================================
+# sources    → (processed dir, daily glob, master dir) per segment
+# date_col   → trade date column in the master (YYYYMMDD int, dates.py)
+# dedup/sort → keys used by the matching 04_append_* script
+# single     → whole master is one file (no per-symbol layout)
+# parquet    → master keeps a Parquet twin next to each CSV
+# create_new → appender may create new symbol files
+# tiered     → hot per-symbol file + immutable cold archive (tiers.py)
+# zones      → columns with per-block min / max sidecars (zones.py)
+MASTERS = {
+    "equity": {
+        "sources": [
+            (PROCESSED / "equity_daily", "BhavCopy_NSE_CM_*.csv",
+             MASTER / "Equity_stock_master"),
+        ],
+        "normalize": normalize_equity,
+        "date_col": "TRADE_DATE",
+        "dedup": ["SYMBOL", "TRADE_DATE"],
+        "sort": ["TRADE_DATE"],
+        "single": None,
+        "parquet": False,
+        "create_new": True,
+        "tiered": False,
+        "zones": None,
+    },
+    "mto": {
+        "sources": [
+            (PROCESSED / "equityDat_daily", "mto_*.csv",
+             MASTER / "EqiutyDat_master"),
+        ],
+        "normalize": normalize_mto,
+        "date_col": "TRADE_DATE",
+        "dedup": ["TRADE_DATE", "SYMBOL"],
+        "sort": ["TRADE_DATE"],
+        "single": None,
+        "parquet": False,
+        "create_new": False,
+        "tiered": False,
+        "zones": None,
+    },
+    "futures": {
+        "sources": [
+            (PROCESSED / "futures_daily" / "STOCKS", "futstk*.csv",
+             MASTER / "Futures_master" / "FUTSTK"),
+            (PROCESSED / "futures_daily" / "INDICES", "futidx*.csv",
+             MASTER / "Futures_master" / "FUTIDX"),
+        ],
+        "normalize": normalize_futures,
+        "date_col": "TRADE_DATE",
+        "dedup": ["SYMBOL", "TRADE_DATE", "EXP_DATE"],
+        "sort": ["TRADE_DATE", "EXP_DATE"],
+        "single": None,
+        "parquet": False,
+        "create_new": True,
+        "tiered": False,
+        "zones": ZONE_COLS,
+    },
+    "options": {
+        "sources": [
+            (PROCESSED / "options_daily" / "STOCKS", "*.csv",
+             MASTER / "option_master" / "STOCKS"),
+            (PROCESSED / "options_daily" / "INDICES", "*.csv",
+             MASTER / "option_master" / "INDICES"),
+        ],
+        "normalize": normalize_options,
+        "date_col": "TRADE_DATE",
+        "dedup": ["SYMBOL", "TRADE_DATE", "EXP_DATE", "STRIKE_PRICE", "OPT_TYPE"],
+        "sort": ["SYMBOL", "TRADE_DATE", "EXP_DATE", "STRIKE_PRICE", "OPT_TYPE"],
+        "single": None,
+        "parquet": True,
+        "create_new": True,
+        "tiered": True,
+        "zones": ZONE_COLS,
+    },
+    "indices": {
+        "sources": [
+            (PROCESSED / "indices_daily", "indices_ohlc_clean_*.csv",
+             MASTER / "Indices_master"),
+        ],
+        "normalize": normalize_indices,
+        "date_col": "TRADE_DATE",
+        "dedup": ["TRADE_DATE", "SYMBOL"],
+        "sort": ["TRADE_DATE"],
+        "single": "master_nifty.csv",
+        "parquet": False,
+        "create_new": True,
+        "tiered": False,
+        "zones": None,
+    },
+}
+
+
+# ==================================================
+# LAST DATE (CATCH-UP)
+# ==================================================
+def _as_date(v) -> date | None:
+    v = str(v).strip().split(".")[0]
+    if not v or v.lower() in ("nan", "<na>"):
+        return None
+    if v.isdigit() and len(v) == 8:
+        return date(int(v[:4]), int(v[4:6]), int(v[6:]))
+    ts = pd.to_datetime(v, errors="coerce")
+    return None if pd.isna(ts) else ts.date()
+
+
+def _tail_value(path, col: str):
+    """col of the LAST row, reading only the header + file tail."""
+    with open(path, "rb") as f:
+        header = next(csv.reader([f.readline().decode("utf-8-sig")]), [])
+        if col not in header:
+            return None
+
+        f.seek(0, 2)
+        size = f.tell()
+        f.seek(max(0, size - 8192))
+        lines = [ln for ln in f.read().decode("utf-8", "replace").splitlines() if ln.strip()]
+
+    if len(lines) < (2 if size <= 8192 else 1):
+        return None     # header only
+    row = next(csv.reader([lines[-1]]))
+    return row[header.index(col)] if len(row) == len(header) else None
+
+
+def _max_value(path, col: str, parquet: bool):
+    twin = path.with_suffix(".parquet")
+    if parquet and twin.exists():
+        s = fixed.read_parquet(twin, columns=[col])[col]
+    else:
+        s = pd.read_csv(path, usecols=[col], low_memory=False)[col]
+    return s.max() if len(s) else None
+
+
+def last_date(name: str) -> date | None:
+    """
+    Latest trade date in a master (None = no master yet).
+
+    Date-sorted masters → last line of each file (tail read);
+    symbol-sorted ones (options) → max of the date column (Parquet twin
+    when present).
+    """
+    spec = MASTERS[name]
+    col = spec["date_col"]
+    tail = spec["sort"][0] == col
+    best = None
+
+    for _, _, out_dir in spec["sources"]:
+        files = [out_dir / spec["single"]] if spec["single"] else sorted(out_dir.glob("*.csv"))
+
+        for f in files:
+            if not f.exists():
+                continue
+            v = _tail_value(f, col) if tail else _max_value(f, col, spec["parquet"])
+            d = _as_date(v) if v is not None else None
+            if d is not None and (best is None or d > best):
+                best = d
+
+    return best
@@ -0,0 +1,80 @@
+"""
+MarketForge | SORTED-MERGE UPSERT FOR MASTERS
+
+Masters are already sorted on their sort keys, and daily data lands at
+(or near) the end. Instead of
+
+    concat([old, new]).drop_duplicates(keys).sort_values(sort_keys)
+
+over the full history, merge_sorted():
+
+1. binary-searches the first old row that can overlap the new data
+2. dedups + sorts ONLY that overlapping tail together with the new rows
+3. concatenates the untouched head in front
+
+Result is identical to the concat path (new rows win on duplicate keys),
+without re-hashing / re-sorting years of history.
+"""
+
+import pandas as pd
+
+
+def _lead_key(old: pd.DataFrame, new: pd.DataFrame, sort_keys: list):
+    """First sort key that actually varies (SYMBOL is constant per file)."""
+    for k in sort_keys:
+        first = old[k].iloc[0]
+        if not (
+            first == old[k].iloc[-1]
+            and (new[k] == first).all()
+        ):
+            return k
+    return None
+
+
+def merge_sorted(
+    old: pd.DataFrame,
+    new: pd.DataFrame,
+    keys: list,
+    sort_keys: list,
+) -> pd.DataFrame:
+    """
+    Upsert `new` into `old` (already sorted by sort_keys).
+    Duplicate keys → row from `new` wins.
+    """
+    new = (
+        new.drop_duplicates(subset=keys, keep="last")
+        .sort_values(sort_keys, kind="mergesort")
+    )
+
+    if old.empty:
+        return new.reset_index(drop=True)
+
+    if new.empty:
+        return old.reset_index(drop=True)
+
+    lead = _lead_key(old, new, sort_keys)
+
+    # unsorted / corrupt history → safe full path
+    if lead is None or not old[lead].is_monotonic_increasing:
+        return (
+            pd.concat([old, new], ignore_index=True)
+            .drop_duplicates(subset=keys, keep="last")
+            .sort_values(sort_keys, kind="mergesort")
+            .reset_index(drop=True)
+        )
+
+    pos = int(old[lead].searchsorted(new[lead].iloc[0], side="left"))
+
+    head = old.iloc[:pos]
+    tail = old.iloc[pos:]
+
+    if tail.empty:
+        return pd.concat([head, new], ignore_index=True)
+
+    tail = (
+        pd.concat([tail, new], ignore_index=True)
+        .drop_duplicates(subset=keys, keep="last")
+        .sort_values(sort_keys, kind="mergesort")
+    )
+
+    return pd.concat([head, tail], ignore_index=True)
@@ -0,0 +1,302 @@
+"""
+MarketForge | STAGE METRICS
+
+Instrumentation any script can wrap around its work:
+
+    with metrics.stage("append_options") as m:
+        with m.phase("read") as p:
+            df = pd.read_csv(f)
+            p.rows += len(df)
+            p.bytes += f.stat().st_size
+
+✔ Wall time per phase (re-entering a phase accumulates)
+✔ Row / byte counters per phase → rows/s
+✔ Peak RSS per phase (background sampler) and for the whole run — own
+  watermark each, so nested phases and several stages sharing one
+  interpreter do not inherit each other's peaks
+✔ Optional cProfile / tracemalloc dumps (env switches below)
+✔ One JSON line per run → logs/metrics/<stage>.jsonl (trend over time)
+✔ Every DAG stage gets a record: run_pipeline and `marketforge run` start
+  each script through run() → stage(<stage name>); a script's own
+  stage() inside it joins that open stage (phases / counters land in
+  the same record, no second line)
+
+    python -m marketforge.metrics <stage> <script> [args]
+
+Env switches:
+    MARKETFORGE_PROFILE=1      → logs/metrics/profiles/<stage>_<ts>.prof
+    MARKETFORGE_TRACEMALLOC=1  → logs/metrics/profiles/<stage>_<ts>.mem.txt
+"""
+
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+import json
+import os
+import platform
+import runpy
+import sys
+import threading
+import time
+
+from marketforge.settings import LOGS
+
+METRICS_DIR = LOGS / "metrics"
+PROFILE_DIR = METRICS_DIR / "profiles"
+
+SAMPLE_EVERY = 0.05        # seconds between RSS samples
+
+_open = None               # Stage currently recording in this process
+
+# ==================================================
+# MEMORY
+# ==================================================
+try:
+    import psutil
+    _PROC = psutil.Process()
+except ImportError:
+    _PROC = None
+
+
+def current_rss() -> int | None:
+    """Resident set size in bytes (None if the platform gives no cheap way)."""
+    if _PROC is not None:
+        return _PROC.memory_info().rss
+
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def peak_rss() -> int | None:
+    """Process high-water mark in bytes."""
+    try:
+        import resource
+    except ImportError:
+        if _PROC is not None:
+            return getattr(_PROC.memory_info(), "peak_wset", None)
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class _Sampler(threading.Thread):
+    """
+    Polls RSS into every open watermark, so each phase — nested or not —
+    and each stage reports its own peak, not the process high-water mark.
+    """
+
+    def __init__(self):
+        super().__init__(daemon=True)
+        self._marks = {}
+        self._next = 0
+        self._lock = threading.Lock()
+        self._halt = threading.Event()
+
+    def _sample(self) -> None:
+        rss = current_rss()
+        if rss is None:
+            return
+        with self._lock:
+            for k, peak in self._marks.items():
+                if rss > peak:
+                    self._marks[k] = rss
+
+    def run(self):
+        while not self._halt.wait(SAMPLE_EVERY):
+            self._sample()
+
+    def watch(self) -> int:
+        """Open a watermark starting at the current RSS."""
+        with self._lock:
+            token = self._next
+            self._next += 1
+            self._marks[token] = current_rss() or 0
+        return token
+
+    def unwatch(self, token: int) -> int:
+        """Close a watermark → peak RSS seen while it was open."""
+        self._sample()
+        with self._lock:
+            return self._marks.pop(token)
+
+    def stop(self) -> None:
+        self._halt.set()
+
+# ==================================================
+# RECORDS
+# ==================================================
+class Phase:
+    __slots__ = ("wall_s", "calls", "rows", "bytes", "peak_rss")
+
+    def __init__(self):
+        self.wall_s = 0.0
+        self.calls = 0
+        self.rows = 0
+        self.bytes = 0
+        self.peak_rss = 0
+
+    def as_dict(self) -> dict:
+        return {
+            "wall_s": round(self.wall_s, 4),
+            "calls": self.calls,
+            "rows": self.rows,
+            "bytes": self.bytes,
+            "rows_per_s": round(self.rows / self.wall_s, 1) if self.wall_s else None,
+            "peak_rss": self.peak_rss or None,
+        }
+
+
+class Stage:
+    def __init__(self, name: str, sampler: _Sampler | None):
+        self.name = name
+        self.phases = {}
+        self.counters = {}
+        self._sampler = sampler
+
+    @contextmanager
+    def phase(self, name: str):
+        p = self.phases.setdefault(name, Phase())
+        token = self._sampler.watch() if self._sampler is not None else None
+
+        start = time.perf_counter()
+        try:
+            yield p
+        finally:
+            p.wall_s += time.perf_counter() - start
+            p.calls += 1
+
+            rss = self._sampler.unwatch(token) if token is not None else current_rss()
+            if rss:
+                p.peak_rss = max(p.peak_rss, rss)
+
+    def count(self, name: str, n: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + n
+
+
+def write_record(record: dict) -> Path:
+    METRICS_DIR.mkdir(parents=True, exist_ok=True)
+    out = METRICS_DIR / f"{record['stage']}.jsonl"
+
+    with open(out, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record) + "\n")
+
+    return out
+
+# ==================================================
+# ENTRY POINT
+# ==================================================
+@contextmanager
+def stage(name: str):
+    """
+    Wraps a whole script run. Writes its record even when the script
+    stops early via sys.exit(0) or fails (status = "failed"). Inside an
+    open stage it yields that stage instead of starting another record.
+    """
+    global _open
+    if _open is not None:
+        yield _open
+        return
+
+    profile = os.environ.get("MARKETFORGE_PROFILE") == "1"
+    trace = os.environ.get("MARKETFORGE_TRACEMALLOC") == "1"
+    stamp = datetime.now()
+
+    sampler = _Sampler() if current_rss() is not None else None
+    if sampler is not None:
+        whole = sampler.watch()
+        sampler.start()
+
+    if trace:
+        import tracemalloc
+        tracemalloc.start(25)
+
+    if profile:
+        import cProfile
+        prof = cProfile.Profile()
+        prof.enable()
+
+    m = _open = Stage(name, sampler)
+    status = "ok"
+    start = time.perf_counter()
+
+    try:
+        yield m
+    except SystemExit as e:
+        if e.code not in (None, 0):
+            status = "failed"
+        raise
+    except BaseException:
+        status = "failed"
+        raise
+    finally:
+        _open = None
+        wall = time.perf_counter() - start
+        tag = f"{name}_{stamp:%Y%m%d_%H%M%S}"
+
+        # this stage's own peak — ru_maxrss would carry the peak of any
+        # heavier stage run earlier in the same interpreter (`marketforge run`)
+        if sampler is not None:
+            run_peak = sampler.unwatch(whole)
+            sampler.stop()
+        else:
+            run_peak = peak_rss()
+
+        record = {
+            "stage": name,
+            "started": stamp.isoformat(timespec="seconds"),
+            "status": status,
+            "wall_s": round(wall, 4),
+            "peak_rss": run_peak,
+            "phases": {k: p.as_dict() for k, p in m.phases.items()},
+            "counters": m.counters,
+            "python": platform.python_version(),
+            "host": platform.node(),
+        }
+
+        if profile:
+            prof.disable()
+            PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+            prof_file = PROFILE_DIR / f"{tag}.prof"
+            prof.dump_stats(prof_file)
+            record["profile"] = str(prof_file)
+
+        if trace:
+            PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+            snap = tracemalloc.take_snapshot()
+            _, traced_peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            mem_file = PROFILE_DIR / f"{tag}.mem.txt"
+            mem_file.write_text(
+                "\n".join(str(s) for s in snap.statistics("lineno")[:50]),
+                encoding="utf-8",
+            )
+            record["tracemalloc_peak"] = traced_peak
+            record["tracemalloc"] = str(mem_file)
+
+        out = write_record(record)
+        print(f" Metrics → {out.name} | {wall:.2f}s | peak RSS {(record['peak_rss'] or 0) / 2**20:.0f} MB")
+
+# ==================================================
+# STAGE RUNNER
+# ==================================================
+def run(name: str, script: Path, argv: list = ()) -> None:
+    """Run a stage script as __main__ inside stage(name)."""
+    saved = sys.argv
+    sys.argv = [str(script), *argv]
+    try:
+        with stage(name):
+            runpy.run_path(str(script), run_name="__main__")
+    finally:
+        sys.argv = saved
+
+
+if __name__ == "__main__":
+    # via the package module, so the script's own `from marketforge import
+    # metrics` sees the stage opened here (not a second copy of this file)
+    from marketforge import metrics
+    metrics.run(sys.argv[1], Path(sys.argv[2]), sys.argv[3:])
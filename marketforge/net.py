@@ -0,0 +1,318 @@
+"""
+MarketForge | SHARED NSE FETCH LAYER
+
+Every download path goes through net.get():
+
+    r = net.get(url, headers=HEADERS, timeout=60)
+    if r.status_code == 200: ...            # 404 etc. = "not published"
+
+✔ Pooled keep-alive sessions (one per thread, shared cookie jar)
+✔ Per-host token bucket (req/s) — AIMD adaptive:
+    success        → rate += RATE_STEP, concurrency += 1 / concurrency
+    throttle / slow → rate × 0.5,       concurrency × 0.5
+✔ Per-host concurrency cap (threads beyond it wait, never error)
+✔ Jittered exponential backoff ("full jitter") on throttle / network error;
+  every attempt releases its concurrency slot, whatever it raised
+✔ Per-host circuit breaker: BREAKER_TRIPS throttles in a row → host paused
+  for a cooldown, then one half-open trial request
+✔ Limiter + breaker state is per HOST, not per process: kept in
+  data/state/net/<host>.json under io.file_lock, so the downloaders that
+  run_pipeline starts as parallel subprocesses share one budget (slots of
+  a process that died are pruned)
+✔ Throttle (403 / 429 / 503 / timeout / > SLOW_S) is NEVER reported as
+  "not available": after MAX_TRIES it raises NetError, so a lookback loop
+  stops instead of walking past a day that does exist
+
+Backfills: net.fetch_many(fn, items) runs fn over items on a thread pool
+sized to the host ceiling; the limiter decides the effective rate, so the
+pool runs as fast as the archive tolerates and slows down when it pushes
+back.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+import json
+import os
+import random
+import threading
+import time
+
+import requests
+
+from marketforge.io import file_lock
+from marketforge.settings import DATA
+
+# ==================================================
+# TUNING
+# ==================================================
+INITIAL_RATE = 2.0      # req/s per host at start
+MIN_RATE = 0.2
+MAX_RATE = 20.0
+RATE_STEP = 0.5         # additive increase per success
+BURST = 4               # bucket capacity (tokens)
+
+MAX_CONCURRENCY = 8     # per host ceiling (AIMD moves between 1 and this)
+
+MAX_TRIES = 6
+BACKOFF_BASE = 1.0      # seconds
+BACKOFF_CAP = 60.0
+
+SLOW_S = 15.0           # response slower than this = congestion signal
+BREAKER_TRIPS = 5       # consecutive throttles → open
+BREAKER_COOLDOWN = 120  # seconds open before a half-open trial
+
+THROTTLE_CODES = {403, 429, 503}
+
+STATE = DATA / "state" / "net"
+LEASE_S = 600           # an in-flight request older than this frees its slot
+
+# transient transport failures → backoff + retry; any other
+# RequestException (bad URL, redirect loop, ...) → NetError at once
+RETRY_ERRORS = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+    requests.exceptions.ContentDecodingError,
+)
+
+
+class NetError(RuntimeError):
+    """Host throttled / unreachable after all retries (NOT 'file missing')."""
+
+# ==================================================
+# PER-HOST STATE (SHARED BY ALL PROCESSES)
+# ==================================================
+def _alive(pid: int) -> bool:
+    if os.name == "nt":
+        return True     # no cheap probe; stale leases expire after LEASE_S
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+class Host:
+    """
+    Limiter + breaker for one host. The state lives in
+    data/state/net/<host>.json (io.file_lock), so parallel pipeline
+    stages downloading from NSE share one rate, one concurrency cap and
+    one breaker; threads of a process also wait on self.cond.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.cond = threading.Condition()
+        self.file = STATE / f"{name.replace(':', '_')}.json"
+        self.stats = {"ok": 0, "throttled": 0, "errors": 0, "breaker_opens": 0}
+
+    # ---------- SHARED STATE ----------
+    def _load(self, now: float) -> dict:
+        try:
+            st = json.loads(self.file.read_text())
+        except (FileNotFoundError, ValueError):
+            st = {}
+
+        st = {
+            "rate": INITIAL_RATE,       # token bucket
+            "tokens": float(BURST),
+            "stamp": now,
+            "limit": 2.0,               # adaptive concurrency
+            "leases": {},               # in-flight requests: lease id → [pid, expires]
+            "fails": 0,                 # circuit breaker
+            "open_until": 0.0,
+            "trial": "",                # lease of the half-open trial request
+            **st,
+        }
+
+        # requests of processes that died (or hung past LEASE_S) free their slot
+        st["leases"] = {
+            k: v for k, v in st["leases"].items() if v[1] > now and _alive(v[0])
+        }
+        if st["trial"] not in st["leases"]:
+            st["trial"] = ""
+        return st
+
+    def _save(self, st: dict) -> None:
+        tmp = self.file.with_name(f".{self.file.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(st))
+        os.replace(tmp, self.file)
+
+    @contextmanager
+    def _shared(self):
+        with file_lock(self.file.with_suffix(".lock")):
+            st = self._load(time.time())
+            yield st
+            self._save(st)
+
+    # ---------- ACQUIRE ----------
+    def acquire(self) -> str:
+        """Wait for a token and a concurrency slot; returns the lease id."""
+        lease = f"{os.getpid()}-{threading.get_ident()}-{time.monotonic_ns()}"
+
+        with self.cond:
+            while True:
+                with self._shared() as st:
+                    now = time.time()
+                    wait = 0.0
+
+                    if now < st["open_until"]:
+                        wait = st["open_until"] - now
+                    elif st["fails"] >= BREAKER_TRIPS and st["trial"]:
+                        wait = 0.5      # breaker cooled down → exactly one trial in flight
+                    elif len(st["leases"]) >= int(st["limit"]):
+                        wait = 0.5
+                    else:
+                        st["tokens"] = min(BURST, st["tokens"] + (now - st["stamp"]) * st["rate"])
+                        st["stamp"] = now
+                        if st["tokens"] < 1:
+                            wait = (1 - st["tokens"]) / st["rate"]
+                        else:
+                            st["tokens"] -= 1
+                            st["leases"][lease] = [os.getpid(), now + LEASE_S]
+                            if st["fails"] >= BREAKER_TRIPS:
+                                st["trial"] = lease
+                            return lease
+
+                # other processes release through the file → poll at least every 0.5 s
+                self.cond.wait(min(wait, 0.5))
+
+    # ---------- RELEASE + AIMD ----------
+    def release(self, lease: str, outcome: str) -> None:
+        with self.cond:
+            with self._shared() as st:
+                st["leases"].pop(lease, None)
+                st["trial"] = ""
+
+                if outcome == "ok":
+                    st["rate"] = min(MAX_RATE, st["rate"] + RATE_STEP)
+                    st["limit"] = min(MAX_CONCURRENCY, st["limit"] + 1 / st["limit"])
+                    st["fails"] = 0
+                    self.stats["ok"] += 1
+                else:
+                    st["rate"] = max(MIN_RATE, st["rate"] * 0.5)
+                    st["limit"] = max(1.0, st["limit"] * 0.5)
+                    st["fails"] += 1
+                    self.stats["throttled" if outcome == "throttled" else "errors"] += 1
+
+                    if st["fails"] >= BREAKER_TRIPS:
+                        st["open_until"] = time.time() + BREAKER_COOLDOWN
+                        self.stats["breaker_opens"] += 1
+                        print(f" [net] {self.name}: circuit OPEN for {BREAKER_COOLDOWN}s "
+                              f"({st['fails']} throttles in a row)")
+
+            self.cond.notify_all()
+
+    def snapshot(self) -> dict:
+        """Shared rate / concurrency + this process's own counters."""
+        with self._shared() as st:
+            return {"rate": round(st["rate"], 2), "concurrency": int(st["limit"]), **self.stats}
+
+
+_hosts = {}
+_hosts_lock = threading.Lock()
+_local = threading.local()
+_cookies = requests.cookies.RequestsCookieJar()   # NSE cookies shared by all threads
+
+
+def host(url: str) -> Host:
+    name = urlsplit(url).netloc
+    with _hosts_lock:
+        if name not in _hosts:
+            _hosts[name] = Host(name)
+        return _hosts[name]
+
+
+def session() -> requests.Session:
+    """Keep-alive session (one per thread — requests.Session is not thread-safe)."""
+    s = getattr(_local, "session", None)
+    if s is None:
+        s = _local.session = requests.Session()
+        s.cookies = _cookies
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=MAX_CONCURRENCY)
+        s.mount("http://", adapter)
+        s.mount("https://", adapter)
+    return s
+
+# ==================================================
+# FETCH
+# ==================================================
+def backoff(attempt: int) -> float:
+    return random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt))
+
+
+def request(method: str, url: str, tries: int = MAX_TRIES, **kwargs) -> requests.Response:
+    """
+    Request through the host limiter. Returns the response for any
+    non-throttle status (200, 404, ...). Raises NetError when the host
+    keeps throttling / failing after `tries` attempts (probes that have
+    their own cadence pass a small number).
+    """
+    h = host(url)
+    kwargs.setdefault("timeout", 30)
+    last = None
+
+    for attempt in range(tries):
+        lease = h.acquire()
+        start = time.monotonic()
+
+        try:
+            r = session().request(method, url, **kwargs)
+        except RETRY_ERRORS as e:
+            h.release(lease, "error")
+            last = f"{type(e).__name__}: {e}"
+        except requests.exceptions.RequestException as e:
+            h.release(lease, "error")
+            raise NetError(f" {url}: {type(e).__name__}: {e}") from e
+        except BaseException:
+            h.release(lease, "error")      # never leak a concurrency slot
+            raise
+        else:
+            slow = time.monotonic() - start > SLOW_S
+
+            if r.status_code in THROTTLE_CODES:
+                h.release(lease, "throttled")
+                last = f"HTTP {r.status_code}"
+            else:
+                h.release(lease, "throttled" if slow else "ok")
+                return r
+
+        if attempt == tries - 1:
+            break
+
+        wait = backoff(attempt)
+        print(f" [net] {h.name}: {last} — retry {attempt + 1}/{tries - 1} in {wait:.1f}s")
+        time.sleep(wait)
+
+    raise NetError(f" {url}: gave up after {tries} tries ({last})")
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    return request("GET", url, **kwargs)
+
+
+def head(url: str, **kwargs) -> requests.Response:
+    return request("HEAD", url, **kwargs)
+
+
+def warm(url: str, **kwargs) -> None:
+    """Hit the site root once so NSE sets its cookies (shared by all threads)."""
+    parts = urlsplit(url)
+    try:
+        get(f"{parts.scheme}://{parts.netloc}/", **kwargs)
+    except NetError as e:
+        print(f" [net] warm-up failed (continuing): {e}")
+
+
+def fetch_many(fn, items: list, workers: int = MAX_CONCURRENCY) -> list:
+    """[fn(item) ...] in order; effective rate/concurrency set by the limiter."""
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(fn, items))
+
+
+def stats() -> dict:
+    with _hosts_lock:
+        return {name: h.snapshot() for name, h in _hosts.items()}
@@ -0,0 +1,60 @@
+"""
+MarketForge | FIXED-SIZE COLUMNAR RING BUFFER
+
+Intraday snapshots land here instead of in a growing DataFrame:
+
+    ring = ColumnRing(65536, {"TS": "int64", "LAST": "float64", ...})
+    ring.push(TS=ts, LAST=last, ...)     # one snapshot = many rows
+    batch = ring.drain()                 # rows not yet flushed → dict of arrays
+
+✔ Preallocated numpy columns, no per-poll allocation growth
+✔ push() is vectorized (one snapshot of ~100 indices = one slice copy)
+✔ drain() returns unflushed rows in arrival order
+✔ Overrun (writer laps the flusher) drops the OLDEST rows, counted in
+  `dropped` — memory stays bounded no matter what
+"""
+
+import numpy as np
+
+
+class ColumnRing:
+    def __init__(self, capacity: int, schema: dict):
+        self.capacity = int(capacity)
+        self.cols = {name: np.zeros(self.capacity, dtype=dt) for name, dt in schema.items()}
+
+        self.written = 0    # rows ever pushed
+        self.flushed = 0    # rows ever drained
+        self.dropped = 0    # rows overwritten before drain
+
+    def __len__(self) -> int:
+        return self.written - self.flushed
+
+    def push(self, **values) -> None:
+        n = len(next(iter(values.values())))
+        if n == 0:
+            return
+        if n > self.capacity:
+            raise RuntimeError(f" Snapshot of {n} rows exceeds ring capacity {self.capacity}")
+
+        start = self.written % self.capacity
+        first = min(n, self.capacity - start)
+
+        for name, col in self.cols.items():
+            v = np.asarray(values[name], dtype=col.dtype)
+            col[start:start + first] = v[:first]
+            col[:n - first] = v[first:]
+
+        self.written += n
+
+        overrun = len(self) - self.capacity
+        if overrun > 0:
+            self.dropped += overrun
+            self.flushed += overrun
+
+    def drain(self) -> dict:
+        n = len(self)
+        start = self.flushed % self.capacity
+        idx = (start + np.arange(n)) % self.capacity
+
+        self.flushed += n
+        return {name: col[idx] for name, col in self.cols.items()}
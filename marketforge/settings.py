@@ -0,0 +1,34 @@
+"""
+MarketForge | GLOBAL SETTINGS
+
+ROOT is the project root (H:\\MarketForge in production). Every stage
+script resolves its data / logs folders from here.
+
+Set MARKETFORGE_ROOT to point the whole pipeline at another tree
+(benchmarks, synthetic data, dry runs) without touching the real data.
+
+MARKETFORGE_PRICE_ENCODING=paise stores master Parquet prices as
+fixed-point integers (marketforge/fixed.py); default "float".
+
+MARKETFORGE_HOT_MONTHS = expiry months kept in the hot option master
+(marketforge/tiers.py); older expiries live in the cold archive.
+
+MARKETFORGE_APPEND_MEMORY_MB > 0 switches the options appender to its
+chunked mode with that memory budget; 0 (default) loads all daily
+files at once.
+"""
+
+from pathlib import Path
+import os
+
+ROOT = Path(
+    os.environ.get("MARKETFORGE_ROOT")
+    or Path(__file__).resolve().parents[1]
+)
+
+DATA = ROOT / "data"
+LOGS = ROOT / "logs"
+
+PRICE_ENCODING = os.environ.get("MARKETFORGE_PRICE_ENCODING", "float")
+HOT_MONTHS = int(os.environ.get("MARKETFORGE_HOT_MONTHS", "3"))
+APPEND_MEMORY_MB = int(os.environ.get("MARKETFORGE_APPEND_MEMORY_MB", "0"))
@@ -0,0 +1,247 @@
+"""
+MarketForge | SHARED-MEMORY MASTERS (ZERO-COPY, REFCOUNTED)
+
+One loader process reads a master once; any number of workers map it:
+
+    # loader (scripts/serve_shared_masters.py)
+    seg = shm.publish(shm.segment_name("options", "NIFTY"), df)
+
+    # worker
+    with shm.attach(shm.segment_name("options", "NIFTY")) as s:
+        df = s.frame()              # columns are views into the segment
+        strikes = s["STRIKE_PRICE"]  # read-only numpy view
+
+✔ One POSIX / Windows shared-memory segment per (dataset, symbol):
+  JSON header + 64-byte aligned numpy columns → no per-worker copy,
+  RAM stays flat as workers are added
+✔ Text columns stored as category codes (pandas' own code width, so
+  the Categorical wraps the shared codes without a copy) + category list
+✔ Refcount = holder pids in data/state/shm/<name>.json (io.file_lock);
+  the last release unlinks the segment, holders that died without
+  releasing are pruned on the next attach / release
+✔ Segments are untracked by multiprocessing's resource tracker — the
+  refcount, not the first process to exit, decides when they go
+"""
+
+from multiprocessing import shared_memory
+import json
+import os
+import struct
+
+import numpy as np
+import pandas as pd
+
+from marketforge.io import file_lock
+from marketforge.settings import DATA
+
+STATE = DATA / "state" / "shm"
+PREFIX = "mf_"
+ALIGN = 64
+HEADER = struct.Struct("<Q")     # header length, then JSON header
+
+
+def segment_name(dataset: str, symbol: str) -> str:
+    return f"{PREFIX}{dataset}_{symbol}".replace(" ", "_").replace("&", "and")
+
+# ==================================================
+# REFCOUNT (HOLDER PIDS)
+# ==================================================
+def _alive(pid: int) -> bool:
+    if os.name == "nt":
+        return True     # no cheap probe; Windows frees the segment with its last handle
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def _holders(name: str) -> list:
+    f = STATE / f"{name}.json"
+    pids = json.loads(f.read_text())["holders"] if f.exists() else []
+    return [p for p in pids if _alive(p)]
+
+
+def _save_holders(name: str, pids: list) -> None:
+    f = STATE / f"{name}.json"
+    if pids:
+        f.write_text(json.dumps({"holders": pids}))
+    else:
+        f.unlink(missing_ok=True)
+
+
+def _lock(name: str):
+    return file_lock(STATE / f"{name}.lock")
+
+
+def _untrack(seg: shared_memory.SharedMemory) -> None:
+    try:
+        from multiprocessing import resource_tracker
+        resource_tracker.unregister(seg._name, "shared_memory")
+    except (ImportError, AttributeError, KeyError):
+        pass
+
+
+def _unlink(name: str) -> None:
+    if os.name == "nt":
+        return          # no names to remove; the last handle frees it
+    try:
+        seg = shared_memory.SharedMemory(name=name)
+    except FileNotFoundError:
+        return
+    seg.close()
+    seg.unlink()        # also drops the resource-tracker entry of this attach
+
+
+def holders(name: str) -> list:
+    """Live holder pids of a segment (empty → not published)."""
+    with _lock(name):
+        return _holders(name)
+
+
+def published() -> dict:
+    """{segment name: live holder pids} for every registered segment."""
+    if not STATE.exists():
+        return {}
+    return {f.stem: holders(f.stem) for f in sorted(STATE.glob(f"{PREFIX}*.json"))}
+
+# ==================================================
+# LAYOUT
+# ==================================================
+def _columns(df: pd.DataFrame) -> list:
+    """(name, numpy array, categories | None) per column, fixed-width dtypes only."""
+    out = []
+    for c in df.columns:
+        s = df[c]
+        if isinstance(s.dtype, pd.CategoricalDtype):
+            out.append((c, s.cat.codes.to_numpy(), [str(v) for v in s.cat.categories]))
+        elif pd.api.types.is_bool_dtype(s) or pd.api.types.is_numeric_dtype(s):
+            if s.isna().any() and not pd.api.types.is_float_dtype(s):
+                arr = s.to_numpy("float64", na_value=np.nan)    # nullable ints with <NA>
+            else:
+                arr = s.to_numpy()
+            out.append((c, np.ascontiguousarray(arr), None))
+        else:
+            cat = pd.Categorical(s.astype("string").fillna(""))
+            out.append((c, cat.codes, [str(v) for v in cat.categories]))
+    return out
+
+
+def _aligned(n: int) -> int:
+    return -(-n // ALIGN) * ALIGN
+
+# ==================================================
+# PUBLISH (LOADER)
+# ==================================================
+def publish(name: str, df: pd.DataFrame) -> shared_memory.SharedMemory:
+    """Copy df into a new segment once; the caller is its first holder."""
+    cols = _columns(df)
+
+    meta, offset = [], 0
+    for c, arr, cats in cols:
+        meta.append({"name": c, "dtype": arr.dtype.str, "offset": offset, "categories": cats})
+        offset = _aligned(offset + arr.nbytes)
+
+    header = json.dumps({"rows": len(df), "columns": meta}).encode()
+    base = _aligned(HEADER.size + len(header))
+
+    with _lock(name):
+        if _holders(name):
+            raise RuntimeError(f" Segment {name} is already published (holders {_holders(name)})")
+        _unlink(name)       # leftover of a loader that died
+
+        seg = shared_memory.SharedMemory(name=name, create=True, size=max(base + offset, 1))
+        _untrack(seg)
+
+        HEADER.pack_into(seg.buf, 0, len(header))
+        seg.buf[HEADER.size:HEADER.size + len(header)] = header
+        for (_, arr, _), m in zip(cols, meta):
+            dst = np.ndarray(arr.shape, dtype=arr.dtype, buffer=seg.buf, offset=base + m["offset"])
+            dst[:] = arr
+
+        _save_holders(name, [os.getpid()])
+
+    return seg
+
+
+def release(name: str, seg: shared_memory.SharedMemory | None = None) -> bool:
+    """Drop this process's hold; True when it was the last one (segment unlinked)."""
+    if seg is not None:
+        try:
+            seg.close()
+        except BufferError:
+            pass        # frames still point into it → unmapped when they are freed
+
+    with _lock(name):
+        pids = _holders(name)
+        if os.getpid() in pids:
+            pids.remove(os.getpid())
+        _save_holders(name, pids)
+
+        if not pids:
+            _unlink(name)
+            return True
+    return False
+
+# ==================================================
+# ATTACH (WORKERS)
+# ==================================================
+class Shared:
+    """Zero-copy view of a published master; close() releases the hold."""
+
+    def __init__(self, name: str):
+        self.name = name
+
+        with _lock(name):
+            pids = _holders(name)
+            if not pids:
+                raise RuntimeError(f" Segment {name} is not published")
+            self._seg = shared_memory.SharedMemory(name=name)
+            _untrack(self._seg)
+            _save_holders(name, pids + [os.getpid()])
+
+        buf = self._seg.buf
+        size = HEADER.unpack_from(buf, 0)[0]
+        head = json.loads(bytes(buf[HEADER.size:HEADER.size + size]))
+        base = _aligned(HEADER.size + size)
+
+        self.rows = head["rows"]
+        self.categories = {}
+        self.arrays = {}
+        for m in head["columns"]:
+            arr = np.ndarray(self.rows, dtype=np.dtype(m["dtype"]), buffer=buf, offset=base + m["offset"])
+            arr.flags.writeable = False
+            self.arrays[m["name"]] = arr
+            if m["categories"] is not None:
+                self.categories[m["name"]] = m["categories"]
+
+    def __getitem__(self, col: str) -> np.ndarray:
+        return self.arrays[col]
+
+    def frame(self, columns: list | None = None) -> pd.DataFrame:
+        """DataFrame over the shared columns (text columns as Categorical)."""
+        data = {}
+        for c in columns or list(self.arrays):
+            if c in self.categories:
+                data[c] = pd.Categorical.from_codes(self.arrays[c], self.categories[c], validate=False)
+            else:
+                data[c] = self.arrays[c]
+        return pd.DataFrame(data, copy=False)
+
+    def close(self) -> None:
+        if self._seg is None:
+            return
+        self.arrays, self._seg, seg = {}, None, self._seg
+        release(self.name, seg)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def attach(name: str) -> Shared:
+    return Shared(name)
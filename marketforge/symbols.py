@@ -0,0 +1,270 @@
+"""
+MarketForge | GLOBAL SYMBOL REGISTRY (INTEGER IDS)
+
+One persistent table maps every traded name to a stable int32 id:
+
+    data/master/symbol_registry.csv
+    SYMBOL_ID, SYMBOL, ISIN, VALID_FROM, VALID_TO      (YYYYMMDD, TO exclusive)
+
+    df = symbols.tag(df, "TRADE_DATE")                    # F&O / MTO / indices
+    df = symbols.tag(df, "TRADE_DATE", isin_col="ISIN")   # equity (rename-aware)
+
+✔ SYMBOL_ID column inserted right after SYMBOL in every master
+✔ Same company across a rename (same ISIN, new SYMBOL) keeps its id;
+  the old SYMBOL row is closed, a new one opens on the rename date
+✔ Symbol reused by a different ISIN → new id from that date
+✔ F&O / MTO / indices (no ISIN) resolve by SYMBOL as of the trade date
+✔ A name seen on a day before its first registered row (history fed
+  out of order) keeps its id — the row's VALID_FROM moves back; one
+  SYMBOL never has two rows valid on the same day (checked on save,
+  ambiguous lookups raise)
+✔ Lookups are one vectorized merge; the registry file is only locked,
+  reloaded and rewritten when an unseen name / rename shows up, so the
+  parallel appenders never lose each other's ids
+✔ follow_renames(): per-symbol master file of the old name is moved to
+  the new name, history continues in one file under one id
+
+Cross-dataset joins (equity ⨝ MTO, ...) run on SYMBOL_ID.
+"""
+
+from pathlib import Path
+import os
+
+import numpy as np
+import pandas as pd
+
+from marketforge import dates
+from marketforge.io import file_lock
+from marketforge.settings import DATA
+
+REGISTRY = DATA / "master" / "symbol_registry.csv"
+LOCK_FILE = REGISTRY.with_name(".symbol_registry.lock")
+
+OPEN = 99991231
+COLS = ["SYMBOL_ID", "SYMBOL", "ISIN", "VALID_FROM", "VALID_TO"]
+
+# ==================================================
+# LOAD / SAVE
+# ==================================================
+def _empty() -> pd.DataFrame:
+    return pd.DataFrame({
+        "SYMBOL_ID": pd.Series(dtype="int32"),
+        "SYMBOL": pd.Series(dtype="object"),
+        "ISIN": pd.Series(dtype="object"),
+        "VALID_FROM": pd.Series(dtype="int64"),
+        "VALID_TO": pd.Series(dtype="int64"),
+    })
+
+
+def load() -> pd.DataFrame:
+    if not REGISTRY.exists():
+        return _empty()
+    reg = pd.read_csv(REGISTRY, dtype={"SYMBOL": str, "ISIN": str}, keep_default_na=False)
+    return reg.astype({"SYMBOL_ID": "int32", "VALID_FROM": "int64", "VALID_TO": "int64"})
+
+
+def _check(reg: pd.DataFrame) -> None:
+    """One SYMBOL never has two rows valid on the same day."""
+    r = reg.sort_values(["SYMBOL", "VALID_FROM"], kind="mergesort")
+    overlap = (r["SYMBOL"] == r["SYMBOL"].shift()) & (r["VALID_FROM"] < r["VALID_TO"].shift())
+    if overlap.any():
+        raise RuntimeError(f" Symbol registry would overlap for {sorted(set(r.loc[overlap, 'SYMBOL']))[:10]}")
+
+
+def _save(reg: pd.DataFrame) -> None:
+    _check(reg)
+    REGISTRY.parent.mkdir(parents=True, exist_ok=True)
+    tmp = REGISTRY.with_name(f".{REGISTRY.name}.{os.getpid()}.tmp")
+    reg.sort_values(["SYMBOL_ID", "VALID_FROM"], kind="mergesort")[COLS].to_csv(tmp, index=False)
+    os.replace(tmp, REGISTRY)
+
+
+_cache = None
+
+
+def registry() -> pd.DataFrame:
+    global _cache
+    if _cache is None:
+        _cache = load()
+    return _cache
+
+# ==================================================
+# RESOLVE
+# ==================================================
+def _lookup(reg: pd.DataFrame, keys: pd.DataFrame) -> np.ndarray:
+    """SYMBOL_ID per (SYMBOL, DAY[, ISIN]) row of keys; -1 = unknown."""
+    m = keys.reset_index(drop=True).reset_index().merge(
+        reg, on="SYMBOL", how="inner", suffixes=("", "_REG"),
+    )
+    m = m[(m["VALID_FROM"] <= m["DAY"]) & (m["DAY"] < m["VALID_TO"])]
+
+    if "ISIN" in keys.columns:
+        # ISIN rows must match exactly (symbol reused by another company,
+        # or an F&O-registered row that has not learnt its ISIN yet)
+        m = m[(m["ISIN"] == "") | (m["ISIN"] == m["ISIN_REG"])]
+
+    twice = m["index"].duplicated(keep=False)
+    if twice.any():
+        bad = m.loc[twice, ["SYMBOL", "DAY", "SYMBOL_ID"]].drop_duplicates().head(6).to_dict("records")
+        raise RuntimeError(
+            f" Symbol registry has overlapping rows for one name: {bad} — "
+            f"remove {REGISTRY.name} and rebuild the masters (05_rebuild_masters.py)"
+        )
+
+    out = np.full(len(keys), -1, dtype="int64")
+    out[m["index"].to_numpy()] = m["SYMBOL_ID"].to_numpy()
+    return out
+
+
+def _live(rows: list, day: int) -> list:
+    return [x for x in rows if x["VALID_FROM"] <= day < x["VALID_TO"]]
+
+
+def _register(reg: pd.DataFrame, new: pd.DataFrame) -> pd.DataFrame:
+    """Open rows for unknown (SYMBOL, ISIN) names, oldest day first."""
+    rows = reg.to_dict("records")
+    by_symbol, by_isin = {}, {}
+
+    def index(x):
+        by_symbol.setdefault(x["SYMBOL"], []).append(x)
+        if x["ISIN"]:
+            by_isin.setdefault(x["ISIN"], []).append(x)
+
+    for x in rows:
+        index(x)
+
+    next_id = int(reg["SYMBOL_ID"].max()) + 1 if len(reg) else 1
+
+    for r in new.sort_values("DAY", kind="mergesort").itertuples(index=False):
+        symbol, day, isin = r.SYMBOL, int(r.DAY), getattr(r, "ISIN", "")
+
+        same = _live(by_symbol.get(symbol, []), day)
+        if any(not isin or x["ISIN"] == isin for x in same):
+            continue    # registered by an earlier row of this batch
+
+        moved = [x for x in _live(by_isin.get(isin, []), day) if x["SYMBOL"] != symbol] if isin else []
+        blank = [x for x in same if not x["ISIN"]]
+
+        # name first registered from a LATER day (equity before F&O / MTO
+        # history) → same id, its row starts earlier instead of a second one
+        later = [
+            x for x in by_symbol.get(symbol, [])
+            if x["VALID_FROM"] > day and (not isin or x["ISIN"] in ("", isin))
+        ]
+        if not same and not moved and later:
+            x = min(later, key=lambda x: x["VALID_FROM"])
+            x["VALID_FROM"] = day
+            if isin and not x["ISIN"]:
+                x["ISIN"] = isin
+                index(x)
+            continue
+
+        if blank and not moved:
+            blank[0]["ISIN"] = isin     # F&O / MTO name learns its ISIN
+            index(blank[0])
+            continue
+
+        # name held by another ISIN, or registered by F&O on the rename day
+        for x in same:
+            x["VALID_TO"] = day
+
+        sid = None
+        for x in moved:
+            # rename: same company, new symbol → close the old name
+            sid = x["SYMBOL_ID"]
+            x["VALID_TO"] = day
+            print(f" Symbol rename : {x['SYMBOL']} → {symbol} ({isin}, id {sid}) from {day}")
+
+        if sid is None:
+            sid, next_id = next_id, next_id + 1
+
+        x = {"SYMBOL_ID": sid, "SYMBOL": symbol, "ISIN": isin, "VALID_FROM": day, "VALID_TO": OPEN}
+        rows.append(x)
+        index(x)
+
+    return pd.DataFrame(rows, columns=COLS).astype({"SYMBOL_ID": "int32"})
+
+
+def ids(symbols: pd.Series, days: pd.Series, isins: pd.Series | None = None) -> np.ndarray:
+    """int32 SYMBOL_ID per row, registering unseen names (locked)."""
+    global _cache
+
+    keys = pd.DataFrame({
+        "SYMBOL": symbols.astype(str).str.strip().to_numpy(),
+        "DAY": dates.key(days).to_numpy(),
+    })
+    if isins is not None:
+        keys["ISIN"] = isins.fillna("").astype(str).str.strip().to_numpy()
+
+    uniq = keys.drop_duplicates()
+    found = _lookup(registry(), uniq)
+
+    if (found < 0).any():
+        with file_lock(LOCK_FILE):
+            reg = load()        # another appender may have registered some
+            found = _lookup(reg, uniq)
+            if (found < 0).any():
+                reg = _register(reg, uniq[found < 0])
+                _save(reg)
+                found = _lookup(reg, uniq)
+        _cache = reg
+
+    if (found < 0).any():
+        raise RuntimeError(f" Symbol registry could not resolve {int((found < 0).sum())} names")
+
+    uniq = uniq.assign(SYMBOL_ID=found.astype("int32"))
+    return keys.merge(uniq, on=list(keys.columns), how="left")["SYMBOL_ID"].to_numpy()
+
+
+def tag(df: pd.DataFrame, date_col: str, isin_col: str | None = None) -> pd.DataFrame:
+    """df with SYMBOL_ID (int32) right after SYMBOL."""
+    sid = ids(df["SYMBOL"], df[date_col], df[isin_col] if isin_col else None)
+
+    df = df.drop(columns="SYMBOL_ID", errors="ignore")
+    df.insert(df.columns.get_loc("SYMBOL") + 1, "SYMBOL_ID", sid)
+    return df
+
+
+def carry(old: pd.DataFrame, new: pd.DataFrame) -> pd.DataFrame:
+    """Master written before ids existed → take the id of the incoming rows."""
+    if "SYMBOL_ID" in old.columns or "SYMBOL_ID" not in new.columns or old.empty:
+        return old
+    old = old.copy()
+    old.insert(old.columns.get_loc("SYMBOL") + 1, "SYMBOL_ID", new["SYMBOL_ID"].iloc[0])
+    return old
+
+# ==================================================
+# RENAMES → PER-SYMBOL FILES
+# ==================================================
+def renames(reg: pd.DataFrame | None = None) -> list:
+    """[(old_symbol, new_symbol, day)] in date order."""
+    reg = registry() if reg is None else reg
+    out = []
+    for _, g in reg.sort_values("VALID_FROM", kind="mergesort").groupby("SYMBOL_ID", sort=False):
+        rows = g.to_dict("records")
+        for a, b in zip(rows, rows[1:]):
+            if a["SYMBOL"] != b["SYMBOL"]:
+                out.append((a["SYMBOL"], b["SYMBOL"], b["VALID_FROM"]))
+    return sorted(out, key=lambda r: r[2])
+
+
+def follow_renames(out_dir: Path, suffixes: tuple = (".csv",)) -> int:
+    """Move {old}.csv (+ twins) → {new}.csv so history stays in one file."""
+    moved = 0
+    for old, new, day in renames():
+        src = out_dir / f"{old}.csv"
+        dst = out_dir / f"{new}.csv"
+
+        if not src.exists():
+            continue
+        if dst.exists():
+            print(f" Rename {old} → {new}: both files exist in {out_dir.name} — left as is")
+            continue
+
+        for suf in suffixes:
+            if (out_dir / f"{old}{suf}").exists():
+                os.replace(out_dir / f"{old}{suf}", out_dir / f"{new}{suf}")
+        print(f" Master file   : {old} → {new} (renamed {day})")
+        moved += 1
+
+    return moved
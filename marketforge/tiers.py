@@ -0,0 +1,158 @@
+"""
+MarketForge | HOT / COLD OPTION MASTER TIERS
+
+    option_master/<SEG>/<SYMBOL>.csv (+ .parquet)        HOT  — rewritten daily
+    option_master/<SEG>/cold/<SYMBOL>/<YYYYMM>.parquet   COLD — written once
+
+✔ HOT  = contracts expiring in the last HOT_MONTHS expiry months or later
+  (live chain + recent expiries) — the only part the appender rewrites
+✔ COLD = one file per symbol per expiry month, written ONCE when the month
+  drops out of the hot window, never touched again (immutable):
+  fixed-point prices + zstd level COLD_LEVEL (marketforge/fixed.py)
+✔ drop_archived(): daily rows for a month already in cold are ignored
+  (late corrections to expired contracts do not reopen the archive)
+✔ read() spans both tiers — cold files pruned by expiry month, the hot
+  file by its zone map (marketforge/zones.py):
+
+    df = tiers.read(out_dir, "NIFTY")                      # full history
+    df = tiers.read(out_dir, "NIFTY", exp_from=202401)     # Jan 2024 expiries on
+    df = tiers.read(out_dir, "NIFTY", where={"TRADE_DATE": (20240102, 20240131)})
+
+Daily write volume ∝ live chain size; history grows only by one cold
+file per symbol per month.
+"""
+
+from pathlib import Path
+import os
+
+import pandas as pd
+
+from marketforge import fixed, zones
+from marketforge.settings import HOT_MONTHS
+
+COLD = "cold"
+COLD_LEVEL = 19     # zstd level — written once, read rarely
+
+
+# ==================================================
+# WINDOW
+# ==================================================
+def cutoff(trade_date: int) -> int:
+    """First HOT expiry month (YYYYMM) as of trade_date (YYYYMMDD)."""
+    y, m = divmod(int(trade_date) // 100, 100)
+    m -= HOT_MONTHS
+    return (y + (m - 1) // 12) * 100 + (m - 1) % 12 + 1
+
+
+def month(df: pd.DataFrame) -> pd.Series:
+    return (df["EXP_DATE"].astype("int64") // 100).rename("EXP_MONTH")
+
+
+def split(df: pd.DataFrame, cut: int) -> tuple:
+    """(hot rows, cold rows)."""
+    is_cold = month(df) < cut
+    return df[~is_cold], df[is_cold]
+
+# ==================================================
+# COLD ARCHIVE
+# ==================================================
+def cold_dir(out_dir: Path, symbol: str) -> Path:
+    return out_dir / COLD / symbol
+
+
+def archived(out_dir: Path, symbol: str) -> set:
+    d = cold_dir(out_dir, symbol)
+    return {int(p.stem) for p in d.glob("*.parquet")} if d.exists() else set()
+
+
+def drop_archived(df: pd.DataFrame, out_dir: Path, symbol: str) -> tuple:
+    """(rows not in an archived month, number dropped)."""
+    done = archived(out_dir, symbol)
+    if not done:
+        return df, 0
+    gone = month(df).isin(done)
+    return df[~gone], int(gone.sum())
+
+
+def archive(cold: pd.DataFrame, out_dir: Path, symbol: str, replace: bool = False) -> int:
+    """Write each new expiry month once; replace=True only for rebuilds."""
+    if cold.empty:
+        return 0
+
+    d = cold_dir(out_dir, symbol)
+    d.mkdir(parents=True, exist_ok=True)
+    written = 0
+
+    for mon, part in cold.groupby(month(cold), sort=True):
+        path = d / f"{mon}.parquet"
+        if path.exists() and not replace:
+            continue
+
+        tmp = d / f".{path.name}.{os.getpid()}.tmp"
+        fixed.write_parquet(part.reset_index(drop=True), tmp, compression_level=COLD_LEVEL)
+        os.replace(tmp, path)
+        written += 1
+
+    return written
+
+# ==================================================
+# READ (BOTH TIERS)
+# ==================================================
+def names(out_dir: Path) -> list:
+    """Symbols present in either tier."""
+    hot = {p.stem for p in out_dir.glob("*.csv")}
+    cold = {p.name for p in (out_dir / COLD).glob("*") if p.is_dir()}
+    return sorted(hot | cold)
+
+
+def _cold_months(where: dict) -> tuple:
+    """Expiry-month bounds implied by the predicate (a contract trades on or before expiry)."""
+    lo, hi = where.get("EXP_DATE", (None, None))
+    t_lo = where.get("TRADE_DATE", (None, None))[0]
+    if t_lo is not None and (lo is None or t_lo > lo):
+        lo = t_lo
+    return (None if lo is None else int(lo) // 100, None if hi is None else int(hi) // 100)
+
+
+def read(
+    out_dir: Path,
+    symbol: str,
+    columns: list | None = None,
+    exp_from: int | None = None,
+    where: dict | None = None,
+) -> pd.DataFrame:
+    """Cold parts (expiry month >= exp_from) + hot file, oldest first."""
+    where = where or {}
+    m_lo, m_hi = _cold_months(where)
+    if exp_from is not None:
+        m_lo = exp_from if m_lo is None else max(m_lo, exp_from)
+
+    cols = None if columns is None else list(dict.fromkeys([*columns, *where]))
+    parts = []
+
+    d = cold_dir(out_dir, symbol)
+    if d.exists():
+        for p in sorted(d.glob("*.parquet")):
+            mon = int(p.stem)
+            if (m_lo is None or mon >= m_lo) and (m_hi is None or mon <= m_hi):
+                df = zones.select(fixed.read_parquet(p, columns=cols), where)
+                parts.append(df if columns is None else df[columns])
+
+    hot = out_dir / f"{symbol}.csv"
+    if hot.exists():
+        parts.append(zones.read(hot, where=where, columns=columns))
+
+    if not parts:
+        return pd.DataFrame(columns=columns)
+    return pd.concat(parts, ignore_index=True)
+
+
+def follow_renames(out_dir: Path, renames: list) -> int:
+    """Move cold/<old>/ → cold/<new>/ (same pairs as symbols.renames())."""
+    moved = 0
+    for old, new, _ in renames:
+        src, dst = cold_dir(out_dir, old), cold_dir(out_dir, new)
+        if src.exists() and not dst.exists():
+            os.replace(src, dst)
+            moved += 1
+    return moved
@@ -0,0 +1,183 @@
+"""
+MarketForge | ZONE MAPS (PER-BLOCK MIN / MAX SIDECARS)
+
+Every Futures / option master CSV gets a sidecar next to it:
+
+    Futures_master/FUTSTK/RELIANCE.csv
+    Futures_master/FUTSTK/RELIANCE.zones.json    ← byte offset + min / max
+                                                   per BLOCK_ROWS-row block
+
+    df = zones.read(path, where={"TRADE_DATE": (20240101, 20240131),
+                                 "STRIKE_PRICE": (22000, 23000)})
+
+✔ Built from the frame that was just written (no second parse); byte
+  offsets from one newline scan of the file
+✔ Blocks whose [min, max] cannot meet the predicate are never read —
+  matching blocks are read with one seek each (adjacent blocks merged)
+✔ Predicates are inclusive (lo, hi) ranges, None = open end; rows are
+  filtered exactly after the block read
+✔ Sidecar carries the CSV's size + mtime: a stale or missing sidecar
+  (file rewritten by something else) → plain full read, never wrong rows
+✔ Masters are sorted by trade date (per symbol), so date predicates
+  prune to a contiguous run of blocks
+"""
+
+from pathlib import Path
+import io
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+BLOCK_ROWS = 4096
+SUFFIX = ".zones.json"
+
+ZONE_COLS = ["TRADE_DATE", "EXP_DATE", "STRIKE_PRICE", "OPEN_INT"]
+
+
+def sidecar(csv_path: Path) -> Path:
+    return csv_path.with_name(csv_path.stem + SUFFIX)
+
+
+def _stat(st) -> list:
+    return [st.st_size, st.st_mtime_ns]
+
+# ==================================================
+# BUILD
+# ==================================================
+def _line_offsets(raw: bytes) -> np.ndarray:
+    """Start offset of every line + end of file."""
+    ends = np.flatnonzero(np.frombuffer(raw, dtype=np.uint8) == 10) + 1
+    if raw and raw[-1] != 10:
+        ends = np.append(ends, len(raw))
+    return np.concatenate([[0], ends])
+
+
+def build(csv_path: Path, df: pd.DataFrame | None = None, cols: list = ZONE_COLS) -> bool:
+    """Write the sidecar for csv_path (df = the frame it holds, if at hand)."""
+    raw = csv_path.read_bytes()
+    st = csv_path.stat()
+    offsets = _line_offsets(raw)
+    rows = len(offsets) - 2         # minus header, minus end marker
+
+    if df is None:
+        header = pd.read_csv(io.BytesIO(raw[: offsets[1]]), nrows=0).columns
+        df = pd.read_csv(io.BytesIO(raw), usecols=[c for c in cols if c in header], low_memory=False)
+
+    cols = [c for c in cols if c in df.columns]
+    if rows != len(df) or not cols:
+        sidecar(csv_path).unlink(missing_ok=True)    # quoted newlines etc. → no zone map
+        return False
+
+    starts = np.arange(0, rows, BLOCK_ROWS)
+    zone = {
+        "stat": _stat(st),
+        "block_rows": BLOCK_ROWS,
+        "offsets": offsets[1 + starts].tolist() + [int(offsets[-1])],
+        "min": {},
+        "max": {},
+    }
+
+    for c in cols:
+        v = pd.to_numeric(df[c], errors="coerce").to_numpy(dtype="float64")
+        if rows:
+            zone["min"][c] = np.fmin.reduceat(v, starts).tolist()
+            zone["max"][c] = np.fmax.reduceat(v, starts).tolist()
+        else:
+            zone["min"][c] = zone["max"][c] = []
+
+    out = sidecar(csv_path)
+    tmp = out.with_name(f".{out.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(zone))
+    os.replace(tmp, out)
+    return True
+
+
+def fresh(csv_path: Path) -> bool:
+    z = sidecar(csv_path)
+    if not z.exists() or not csv_path.exists():
+        return False
+    return json.loads(z.read_text())["stat"] == _stat(csv_path.stat())
+
+# ==================================================
+# READ WITH PRUNING
+# ==================================================
+def _matching(zone: dict, where: dict) -> np.ndarray:
+    n = len(zone["offsets"]) - 1
+    keep = np.ones(n, dtype=bool)
+
+    for c, (lo, hi) in where.items():
+        if c not in zone["min"]:
+            continue        # no stats for this column → cannot prune on it
+        mn = np.asarray(zone["min"][c], dtype="float64")
+        mx = np.asarray(zone["max"][c], dtype="float64")
+        # all-NaN block → NaN stats → kept (comparisons below are False)
+        if lo is not None:
+            keep &= ~(mx < lo)
+        if hi is not None:
+            keep &= ~(mn > hi)
+
+    return keep
+
+
+def select(df: pd.DataFrame, where: dict) -> pd.DataFrame:
+    """Rows of df inside every (lo, hi) range of where."""
+    mask = np.ones(len(df), dtype=bool)
+    for c, (lo, hi) in where.items():
+        v = pd.to_numeric(df[c], errors="coerce")
+        if lo is not None:
+            mask &= (v >= lo).to_numpy()
+        if hi is not None:
+            mask &= (v <= hi).to_numpy()
+    return df[mask].reset_index(drop=True)
+
+
+def read(
+    csv_path: Path,
+    where: dict | None = None,
+    columns: list | None = None,
+    stats: dict | None = None,
+) -> pd.DataFrame:
+    """
+    Rows of csv_path matching where ({col: (lo, hi)}); stats (optional
+    dict) gets bytes_read / bytes_total / blocks_read / blocks_total.
+    """
+    where = where or {}
+    usecols = None if columns is None else list(dict.fromkeys([*columns, *where]))
+
+    z = sidecar(csv_path)
+    zone = json.loads(z.read_text()) if where and z.exists() else None
+
+    with open(csv_path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+
+        if zone is None or zone["stat"] != _stat(os.fstat(f.fileno())):
+            df = pd.read_csv(f, usecols=usecols, low_memory=False)
+            read_bytes, blocks = size, (None, None)
+        else:
+            keep = _matching(zone, where)
+            offs = zone["offsets"]
+            header = f.readline()
+
+            chunks = []
+            i = 0
+            while i < len(keep):
+                if not keep[i]:
+                    i += 1
+                    continue
+                j = i
+                while j + 1 < len(keep) and keep[j + 1]:
+                    j += 1
+                f.seek(offs[i])
+                chunks.append(f.read(offs[j + 1] - offs[i]))
+                i = j + 1
+
+            df = pd.read_csv(io.BytesIO(header + b"".join(chunks)), usecols=usecols, low_memory=False)
+            read_bytes, blocks = len(header) + sum(map(len, chunks)), (int(keep.sum()), len(keep))
+
+    if stats is not None:
+        stats.update(bytes_read=read_bytes, bytes_total=size, blocks_read=blocks[0], blocks_total=blocks[1])
+
+    df = select(df, where)
+    return df if columns is None else df[columns]
@@ -13,12 +13,18 @@ MarketForge | MASTER LAST-ROW CHECKER (READ-ONLY)
 
 from pathlib import Path
 import pandas as pd
+import sys
 
-ROOT = Path(r"H:\MarketForge\data\master")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from marketforge.settings import ROOT as PROJECT_ROOT  # noqa: E402
+
+ROOT = PROJECT_ROOT / "data" / "master"
 
 MASTER_PATHS = {
     "EQUITY_STOCK": ROOT / "Equity_stock_master",
     "EQUITY_MTO": ROOT / "EqiutyDat_master",
+    "EQUITY_ENRICHED": ROOT / "Equity_enriched_master",
     "FUTURES_STK": ROOT / "Futures_master" / "FUTSTK",
     "FUTURES_IDX": ROOT / "Futures_master" / "FUTIDX",
     "OPTIONS_STK": ROOT / "option_master" / "STOCKS",
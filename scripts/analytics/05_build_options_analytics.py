@@ -0,0 +1,385 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+MarketForge | DAILY OPTIONS ANALYTICS (PCR • MAX PAIN • OI BUILDUP)
+
+✔ Consumes STANDARDIZED options_daily output
+✔ Per SYMBOL × EXP_DATE × TRADE_DATE
+✔ PCR (OI + volume)
+✔ Max pain via cumulative sums → O(strikes), not strikes²
+✔ Strike-wise OI change vs previous session
+✔ OI buildup tagging (LONG / SHORT / COVERING / UNWINDING)
+✔ Small analytics master (append-safe & idempotent), written through
+  io.write_if_changed; daily buildup files via atomic replace
+✔ Sessions without a usable chain are recorded in
+  options_analytics_<seg>_nochain.json → not re-read on every run
+✔ Fully vectorized — no per-expiry Python loops
+"""
+
+from pathlib import Path
+from datetime import datetime
+import json
+import re
+import sys
+import numpy as np
+import pandas as pd
+
+# ==================================================
+# PATHS
+# ==================================================
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from marketforge.settings import ROOT  # noqa: E402
+from marketforge.merge import merge_sorted  # noqa: E402
+from marketforge.io import atomic_to_csv, load_digests, save_digests, write_if_changed  # noqa: E402
+
+SRC_ROOT = ROOT / "data" / "processed" / "options_daily"
+DAILY_ROOT = ROOT / "data" / "processed" / "options_analytics_daily"
+MASTER_DIR = ROOT / "data" / "master" / "options_analytics"
+
+SEGMENTS = {
+    "STOCKS": "optstk",
+    "INDICES": "optidx",
+}
+
+MASTER_DIR.mkdir(parents=True, exist_ok=True)
+
+# ==================================================
+# HARD CONTRACT
+# ==================================================
+CHAIN_KEYS = ["SYMBOL", "EXP_DATE", "STRIKE_PRICE", "OPT_TYPE"]
+GROUP_KEYS = ["SYMBOL", "EXP_DATE"]
+
+SUMMARY_COLS = [
+    "TRADE_DATE",
+    "SYMBOL",
+    "EXP_DATE",
+    "CE_OI",
+    "PE_OI",
+    "CE_OI_CHG",
+    "PE_OI_CHG",
+    "CE_VOL",
+    "PE_VOL",
+    "PCR_OI",
+    "PCR_VOL",
+    "MAX_PAIN",
+    "MAX_CE_OI_STRIKE",
+    "MAX_PE_OI_STRIKE",
+]
+
+SUMMARY_KEYS = ["TRADE_DATE", "SYMBOL", "EXP_DATE"]
+
+BUILDUP_COLS = [
+    "TRADE_DATE",
+    "SYMBOL",
+    "EXP_DATE",
+    "STRIKE_PRICE",
+    "OPT_TYPE",
+    "CLOSE_PRICE",
+    "PRICE_CHG",
+    "OPEN_INT",
+    "OI_CHG",
+    "BUILDUP",
+]
+
+# ==================================================
+# HELPERS
+# ==================================================
+def file_trade_date(path: Path) -> int:
+    m = re.search(r"(\d{8})", path.stem)
+    return int(datetime.strptime(m.group(1), "%d%m%Y").strftime("%Y%m%d"))
+
+
+def load_nochain(path: Path) -> set:
+    return set(json.loads(path.read_text())) if path.exists() else set()
+
+
+def save_nochain(path: Path, days: set) -> None:
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_text(json.dumps(sorted(days)))
+    tmp.replace(path)
+
+
+def load_chain(path: Path) -> pd.DataFrame:
+    df = pd.read_csv(path, low_memory=False)
+
+    df.columns = (
+        df.columns.astype(str)
+        .str.strip()
+        .str.upper()
+    )
+
+    df = df[CHAIN_KEYS + ["CLOSE_PRICE", "OPEN_INT", "NO_OF_CONT"]].copy()
+
+    df["EXP_DATE"] = pd.to_numeric(df["EXP_DATE"], errors="coerce").astype("Int64")
+    df["STRIKE_PRICE"] = pd.to_numeric(df["STRIKE_PRICE"], errors="coerce").astype("int64")
+    df["CLOSE_PRICE"] = pd.to_numeric(df["CLOSE_PRICE"], errors="coerce").astype("float64")
+
+    for c in ["OPEN_INT", "NO_OF_CONT"]:
+        df[c] = (
+            pd.to_numeric(df[c], errors="coerce")
+            .fillna(0)
+            .astype("int64")
+        )
+
+    df["SYMBOL"] = df["SYMBOL"].astype(str).str.strip()
+    df["OPT_TYPE"] = df["OPT_TYPE"].astype(str).str.strip().str.upper()
+
+    df = df[df["EXP_DATE"].notna() & df["OPT_TYPE"].isin({"CE", "PE"})]
+
+    return df.sort_values(CHAIN_KEYS).reset_index(drop=True)
+
+
+def max_pain(strikes: pd.DataFrame) -> pd.Series:
+    """
+    Pain at settlement S_j (one row per strike, sorted within group):
+
+        Σ CE_OI_i · max(S_j − K_i, 0) + Σ PE_OI_i · max(K_i − S_j, 0)
+
+    Expanded with group-wise cumulative sums so every candidate strike
+    is priced in one pass. Returns MAX_PAIN strike per GROUP_KEYS.
+    """
+    g = strikes.groupby(GROUP_KEYS, sort=False)
+
+    k = strikes["STRIKE_PRICE"].to_numpy(dtype="float64")
+    ce = strikes["CE"].to_numpy(dtype="float64")
+    pe = strikes["PE"].to_numpy(dtype="float64")
+
+    cum_ce = g["CE"].cumsum().to_numpy(dtype="float64")
+    cum_pe = g["PE"].cumsum().to_numpy(dtype="float64")
+
+    ck = pd.Series(ce * k, index=strikes.index)
+    pk = pd.Series(pe * k, index=strikes.index)
+
+    grp = [strikes[c] for c in GROUP_KEYS]
+    cum_ck = ck.groupby(grp, sort=False).cumsum().to_numpy()
+    cum_pk = pk.groupby(grp, sort=False).cumsum().to_numpy()
+
+    tot_pe = g["PE"].transform("sum").to_numpy(dtype="float64")
+    tot_pk = pk.groupby(grp, sort=False).transform("sum").to_numpy()
+
+    pain = (k * cum_ce - cum_ck) + ((tot_pk - cum_pk) - k * (tot_pe - cum_pe))
+
+    idx = pd.Series(pain, index=strikes.index).groupby(grp, sort=False).idxmin()
+    out = strikes.loc[idx, GROUP_KEYS + ["STRIKE_PRICE"]]
+
+    return out.rename(columns={"STRIKE_PRICE": "MAX_PAIN"}).reset_index(drop=True)
+
+
+def build_buildup(chain: pd.DataFrame, prev: pd.DataFrame | None, trade_date: int) -> pd.DataFrame:
+    out = chain.copy()
+
+    if prev is None:
+        out["PRICE_CHG"] = np.nan
+        out["OI_CHG"] = pd.Series(pd.NA, index=out.index, dtype="Int64")
+    else:
+        out = out.merge(
+            prev[CHAIN_KEYS + ["CLOSE_PRICE", "OPEN_INT"]],
+            on=CHAIN_KEYS,
+            how="left",
+            suffixes=("", "_PREV"),
+        )
+        out["PRICE_CHG"] = out["CLOSE_PRICE"] - out["CLOSE_PRICE_PREV"]
+        out["OI_CHG"] = (out["OPEN_INT"] - out["OPEN_INT_PREV"]).astype("Int64")
+
+    oi_up = (out["OI_CHG"] > 0).fillna(False).to_numpy(dtype=bool)
+    oi_dn = (out["OI_CHG"] < 0).fillna(False).to_numpy(dtype=bool)
+    px_up = (out["PRICE_CHG"] > 0).to_numpy()
+    px_dn = (out["PRICE_CHG"] < 0).to_numpy()
+
+    out["BUILDUP"] = np.select(
+        [
+            oi_up & px_up,
+            oi_up & px_dn,
+            oi_dn & px_up,
+            oi_dn & px_dn,
+        ],
+        [
+            "LONG_BUILDUP",
+            "SHORT_BUILDUP",
+            "SHORT_COVERING",
+            "LONG_UNWINDING",
+        ],
+        default="",
+    )
+
+    out["TRADE_DATE"] = trade_date
+
+    return out[BUILDUP_COLS]
+
+
+def build_summary(chain: pd.DataFrame, buildup: pd.DataFrame, trade_date: int) -> pd.DataFrame:
+    # ---------- STRIKE GRID (CE / PE side by side) ----------
+    strikes = (
+        chain.pivot_table(
+            index=GROUP_KEYS + ["STRIKE_PRICE"],
+            columns="OPT_TYPE",
+            values=["OPEN_INT", "NO_OF_CONT"],
+            aggfunc="sum",
+            fill_value=0,
+        )
+    )
+    strikes.columns = [f"{t}_{c}" for c, t in strikes.columns]
+    strikes = strikes.reindex(
+        columns=["CE_OPEN_INT", "PE_OPEN_INT", "CE_NO_OF_CONT", "PE_NO_OF_CONT"],
+        fill_value=0,
+    )
+    strikes = (
+        strikes
+        .rename(columns={"CE_OPEN_INT": "CE", "PE_OPEN_INT": "PE"})
+        .reset_index()
+        .sort_values(GROUP_KEYS + ["STRIKE_PRICE"])
+        .reset_index(drop=True)
+    )
+
+    grp = strikes.groupby(GROUP_KEYS, sort=False)
+
+    summary = grp.agg(
+        CE_OI=("CE", "sum"),
+        PE_OI=("PE", "sum"),
+        CE_VOL=("CE_NO_OF_CONT", "sum"),
+        PE_VOL=("PE_NO_OF_CONT", "sum"),
+    ).reset_index()
+
+    # ---------- OI WALLS ----------
+    ce_wall = strikes.loc[grp["CE"].idxmax(), GROUP_KEYS + ["STRIKE_PRICE"]]
+    pe_wall = strikes.loc[grp["PE"].idxmax(), GROUP_KEYS + ["STRIKE_PRICE"]]
+
+    summary = (
+        summary
+        .merge(ce_wall.rename(columns={"STRIKE_PRICE": "MAX_CE_OI_STRIKE"}), on=GROUP_KEYS)
+        .merge(pe_wall.rename(columns={"STRIKE_PRICE": "MAX_PE_OI_STRIKE"}), on=GROUP_KEYS)
+        .merge(max_pain(strikes), on=GROUP_KEYS)
+    )
+
+    # ---------- OI CHANGE ----------
+    chg = (
+        buildup.groupby(GROUP_KEYS + ["OPT_TYPE"])["OI_CHG"]
+        .sum(min_count=1)
+        .unstack("OPT_TYPE")
+        .reindex(columns=["CE", "PE"])
+        .add_suffix("_OI_CHG")
+        .reset_index()
+    )
+    summary = summary.merge(chg, on=GROUP_KEYS, how="left")
+
+    for c in ["CE_OI_CHG", "PE_OI_CHG"]:
+        summary[c] = pd.to_numeric(summary[c], errors="coerce").astype("Int64")
+
+    # ---------- PCR ----------
+    ce_oi = summary["CE_OI"].replace(0, np.nan)
+    ce_vol = summary["CE_VOL"].replace(0, np.nan)
+
+    summary["PCR_OI"] = (summary["PE_OI"] / ce_oi).round(4)
+    summary["PCR_VOL"] = (summary["PE_VOL"] / ce_vol).round(4)
+
+    summary["TRADE_DATE"] = trade_date
+
+    return summary[SUMMARY_COLS]
+
+# ==================================================
+# PROCESS
+# ==================================================
+print("\n MarketForge | OPTIONS ANALYTICS BUILD STARTED")
+
+for seg, prefix in SEGMENTS.items():
+    src_dir = SRC_ROOT / seg
+    out_daily = DAILY_ROOT / seg
+    out_daily.mkdir(parents=True, exist_ok=True)
+
+    master_file = MASTER_DIR / f"options_analytics_{seg.lower()}.csv"
+    nochain_file = MASTER_DIR / f"options_analytics_{seg.lower()}_nochain.json"
+
+    files = sorted(
+        (
+            f for f in src_dir.glob(f"{prefix}*.csv")
+            if re.fullmatch(rf"{prefix}\d{{8}}\.csv", f.name)
+        ),
+        key=file_trade_date,
+    )
+
+    print(f"\n Processing {seg} | Files: {len(files)}")
+
+    if not files:
+        continue
+
+    # ---------- LOAD OR INIT MASTER ----------
+    if master_file.exists():
+        master = pd.read_csv(master_file, low_memory=False)
+        master["TRADE_DATE"] = master["TRADE_DATE"].astype("int64")
+        done = set(master["TRADE_DATE"].unique())
+    else:
+        master = pd.DataFrame(columns=SUMMARY_COLS)
+        done = set()
+
+    # sessions already seen without a usable chain (no summary rows)
+    nochain = load_nochain(nochain_file)
+    done |= nochain
+    known = set(nochain)
+
+    # ---------- ONLY NEW SESSIONS (PREV DAY NEEDED FOR OI CHANGE) ----------
+    pending = [
+        (i, f) for i, f in enumerate(files)
+        if file_trade_date(f) not in done
+    ]
+
+    if not pending:
+        print(f" {seg} analytics up to date")
+        continue
+
+    new_rows = []
+    prev_cache = {}
+
+    for i, f in pending:
+        trade_date = file_trade_date(f)
+
+        chain = load_chain(f)
+        if chain.empty:
+            print(f" No usable chain rows: {f.name}")
+            nochain.add(trade_date)
+            continue
+
+        prev = None
+        if i > 0:
+            prev = prev_cache.pop(i - 1, None)
+            if prev is None:
+                prev = load_chain(files[i - 1])
+
+        buildup = build_buildup(chain, prev, trade_date)
+        summary = build_summary(chain, buildup, trade_date)
+
+        out = out_daily / f"oi_buildup_{trade_date}.csv"
+        atomic_to_csv(buildup, out)
+
+        new_rows.append(summary)
+        prev_cache[i] = chain
+
+        print(f" {trade_date} | expiries {len(summary)} → {out.name}")
+
+    if nochain != known:
+        save_nochain(nochain_file, nochain)
+
+    if not new_rows:
+        continue
+
+    # ---------- APPEND + DEDUPE ----------
+    combined = merge_sorted(
+        master,
+        pd.concat(new_rows, ignore_index=True),
+        keys=SUMMARY_KEYS,
+        sort_keys=SUMMARY_KEYS,
+    )
+
+    digests = load_digests(MASTER_DIR)
+    write_if_changed(combined, master_file, digests)
+    save_digests(MASTER_DIR, digests)
+
+    print(f" {seg} ANALYTICS MASTER UPDATED → {master_file}")
+    print(f" Rows : {len(combined)}")
+
+# ==================================================
+# DONE
+# ==================================================
+print("\n OPTIONS ANALYTICS BUILD COMPLETED")
+print(f" Master : {MASTER_DIR}")
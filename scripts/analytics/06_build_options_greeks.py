@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+MarketForge | OPTIONS IV & GREEKS BUILDER (VECTORIZED)
+
+✔ Consumes option_master (per symbol, hot + cold tiers via marketforge/tiers.py;
+  cold months older than the Greeks file's last date are not read)
+✔ Futures read through their zone maps (only the new trade dates' blocks)
+✔ Underlying priority:
+    1. Futures master, same expiry      → Black-76
+    2. Futures master, near month       → implied spot, Black-Scholes
+    3. Index master (NIFTY)             → spot, Black-Scholes
+✔ Batch NumPy IV solve (Newton + bisection, convergence mask)
+✔ DELTA / GAMMA / VEGA / THETA per row
+✔ Keyed like option_master DEDUP_KEYS
+✔ Incremental: only TRADE_DATEs not yet in the Greeks file
+✔ CSV only
+"""
+
+from pathlib import Path
+import sys
+import numpy as np
+import pandas as pd
+
+# ==================================================
+# PATHS
+# ==================================================
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from marketforge.settings import ROOT  # noqa: E402
+from marketforge import dates  # noqa: E402
+from marketforge.greeks import implied_vol, greeks  # noqa: E402
+from marketforge.io import load_digests, save_digests, write_if_changed  # noqa: E402
+from marketforge.merge import merge_sorted  # noqa: E402
+from marketforge import tiers, zones  # noqa: E402
+
+OPT_ROOT = ROOT / "data" / "master" / "option_master"
+FUT_ROOT = ROOT / "data" / "master" / "Futures_master"
+OUT_ROOT = ROOT / "data" / "master" / "option_greeks"
+
+SEG_MAP = {
+    "STOCKS": FUT_ROOT / "FUTSTK",
+    "INDICES": FUT_ROOT / "FUTIDX",
+}
+
+INDEX_SPOT = {
+    "NIFTY": ROOT / "data" / "master" / "Indices_master" / "master_nifty.csv",
+}
+
+# ==================================================
+# MODEL CONFIG
+# ==================================================
+RISK_FREE_RATE = 0.065     # annualised, continuous
+MIN_DAYS = 1               # expiry-day rows priced with one day left
+
+# ==================================================
+# HARD CONTRACT
+# ==================================================
+DEDUP_KEYS = [
+    "SYMBOL",
+    "TRADE_DATE",
+    "EXP_DATE",
+    "STRIKE_PRICE",
+    "OPT_TYPE",
+]
+
+SORT_KEYS = DEDUP_KEYS
+
+FINAL_COLS = DEDUP_KEYS + [
+    "CLOSE_PRICE",
+    "UNDERLYING",
+    "UNDERLYING_SRC",
+    "T_YEARS",
+    "IV",
+    "IV_CONVERGED",
+    "DELTA",
+    "GAMMA",
+    "VEGA",
+    "THETA",
+]
+
+# ==================================================
+# HELPERS
+# ==================================================
+def load_futures(symbol: str, fut_dir: Path, days: tuple) -> pd.DataFrame | None:
+    """Futures rows for trade dates in days (lo, hi) — zone map skips the rest."""
+    f = fut_dir / f"{symbol}.csv"
+    if not f.exists():
+        return None
+
+    fut = zones.read(f, where={"TRADE_DATE": days}, columns=["TRADE_DATE", "EXP_DATE", "CLOSE_PRICE"])
+    fut["TRADE_DATE"] = pd.to_numeric(fut["TRADE_DATE"], errors="coerce").astype("Int64")
+    fut["EXP_DATE"] = pd.to_numeric(fut["EXP_DATE"], errors="coerce").astype("Int64")
+    fut["CLOSE_PRICE"] = pd.to_numeric(fut["CLOSE_PRICE"], errors="coerce").astype("float64")
+
+    fut = fut.dropna()
+    fut = fut[fut["CLOSE_PRICE"] > 0]
+
+    return fut.drop_duplicates(["TRADE_DATE", "EXP_DATE"], keep="last")
+
+
+def load_index_spot(symbol: str) -> pd.DataFrame | None:
+    f = INDEX_SPOT.get(symbol)
+    if f is None or not f.exists():
+        return None
+
+    idx = pd.read_csv(f, usecols=["TRADE_DATE", "CLOSE"], low_memory=False)
+    idx["TRADE_DATE"] = idx["TRADE_DATE"].astype("Int64")
+
+    return (
+        idx.rename(columns={"CLOSE": "SPOT"})
+        .drop_duplicates("TRADE_DATE", keep="last")
+    )
+
+
+def attach_underlying(opt: pd.DataFrame, fut: pd.DataFrame | None, spot: pd.DataFrame | None) -> pd.DataFrame:
+    """
+    Adds UNDERLYING, CARRY (b) and UNDERLYING_SRC.
+    b = 0 → underlying is the matching future (Black-76)
+    b = r → underlying is spot (Black-Scholes)
+    """
+    r = RISK_FREE_RATE
+
+    opt["UNDERLYING"] = np.nan
+    opt["CARRY"] = np.nan
+    opt["UNDERLYING_SRC"] = ""
+
+    if fut is not None and not fut.empty:
+        # ---------- 1. SAME-EXPIRY FUTURE ----------
+        same = opt[["TRADE_DATE", "EXP_DATE"]].merge(
+            fut, on=["TRADE_DATE", "EXP_DATE"], how="left"
+        )["CLOSE_PRICE"].to_numpy()
+
+        hit = np.isfinite(same)
+        opt.loc[hit, "UNDERLYING"] = same[hit]
+        opt.loc[hit, "CARRY"] = 0.0
+        opt.loc[hit, "UNDERLYING_SRC"] = "FUT"
+
+        # ---------- 2. NEAR-MONTH FUTURE → IMPLIED SPOT ----------
+        near = (
+            fut[fut["EXP_DATE"] >= fut["TRADE_DATE"]]
+            .sort_values(["TRADE_DATE", "EXP_DATE"])
+            .drop_duplicates("TRADE_DATE", keep="first")
+        )
+        t_near = np.maximum(
+            dates.days(near["EXP_DATE"]) - dates.days(near["TRADE_DATE"]),
+            0,
+        ) / 365.0
+        near = near.assign(SPOT=near["CLOSE_PRICE"].to_numpy() * np.exp(-r * t_near))
+
+        implied = opt[["TRADE_DATE"]].merge(
+            near[["TRADE_DATE", "SPOT"]], on="TRADE_DATE", how="left"
+        )["SPOT"].to_numpy()
+
+        miss = ~np.isfinite(opt["UNDERLYING"].to_numpy()) & np.isfinite(implied)
+        opt.loc[miss, "UNDERLYING"] = implied[miss]
+        opt.loc[miss, "CARRY"] = r
+        opt.loc[miss, "UNDERLYING_SRC"] = "FUT_NEAR"
+
+    if spot is not None and not spot.empty:
+        # ---------- 3. INDEX SPOT ----------
+        s = opt[["TRADE_DATE"]].merge(spot, on="TRADE_DATE", how="left")["SPOT"].to_numpy()
+
+        miss = ~np.isfinite(opt["UNDERLYING"].to_numpy()) & np.isfinite(s)
+        opt.loc[miss, "UNDERLYING"] = s[miss]
+        opt.loc[miss, "CARRY"] = r
+        opt.loc[miss, "UNDERLYING_SRC"] = "INDEX"
+
+    return opt
+
+
+def compute_greeks(opt: pd.DataFrame) -> pd.DataFrame:
+    days = dates.days(opt["EXP_DATE"]) - dates.days(opt["TRADE_DATE"])
+    t = np.maximum(days, MIN_DAYS) / 365.0
+
+    u = opt["UNDERLYING"].to_numpy(dtype="float64")
+    b = opt["CARRY"].to_numpy(dtype="float64")
+    k = opt["STRIKE_PRICE"].to_numpy(dtype="float64")
+    prem = opt["CLOSE_PRICE"].to_numpy(dtype="float64")
+    is_call = (opt["OPT_TYPE"] == "CE").to_numpy()
+
+    iv, ok = implied_vol(prem, u, k, t, RISK_FREE_RATE, b, is_call)
+    g = greeks(u, k, t, RISK_FREE_RATE, b, iv, is_call)
+
+    out = opt[DEDUP_KEYS + ["CLOSE_PRICE", "UNDERLYING", "UNDERLYING_SRC"]].copy()
+    out["T_YEARS"] = t
+    out["IV"] = iv
+    out["IV_CONVERGED"] = ok
+
+    for name, values in g.items():
+        out[name] = values
+
+    return out[FINAL_COLS]
+
+# ==================================================
+# PROCESS
+# ==================================================
+print("\n MarketForge | OPTIONS GREEKS BUILD STARTED")
+
+for seg, fut_dir in SEG_MAP.items():
+    src_dir = OPT_ROOT / seg
+    out_dir = OUT_ROOT / seg
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    names = tiers.names(src_dir) if src_dir.exists() else []
+    print(f"\n Processing {seg} | Symbols: {len(names)}")
+
+    rows_done = 0
+    digests = load_digests(out_dir)
+
+    for symbol in names:
+        out_file = out_dir / f"{symbol}.csv"
+
+        old = None
+        if out_file.exists():
+            old = pd.read_csv(out_file, low_memory=False)
+            old["TRADE_DATE"] = old["TRADE_DATE"].astype("Int64")
+            old["EXP_DATE"] = old["EXP_DATE"].astype("Int64")
+
+        # contracts expiring before the last priced month were priced already
+        done_month = int(old["TRADE_DATE"].max()) // 100 if old is not None and len(old) else None
+
+        opt = tiers.read(src_dir, symbol, columns=DEDUP_KEYS + ["CLOSE_PRICE"], exp_from=done_month)
+
+        opt["TRADE_DATE"] = pd.to_numeric(opt["TRADE_DATE"], errors="coerce").astype("Int64")
+        opt["EXP_DATE"] = pd.to_numeric(opt["EXP_DATE"], errors="coerce").astype("Int64")
+        opt["STRIKE_PRICE"] = pd.to_numeric(opt["STRIKE_PRICE"], errors="coerce").astype("int64")
+        opt["CLOSE_PRICE"] = pd.to_numeric(opt["CLOSE_PRICE"], errors="coerce").astype("float64")
+        opt["OPT_TYPE"] = opt["OPT_TYPE"].astype(str).str.strip()
+
+        opt = opt[opt["TRADE_DATE"].notna() & opt["EXP_DATE"].notna()]
+
+        # ---------- INCREMENTAL: ONLY NEW TRADE DATES ----------
+        if old is not None:
+            opt = opt[~opt["TRADE_DATE"].isin(old["TRADE_DATE"].unique())]
+
+        if opt.empty:
+            continue
+
+        opt = opt.reset_index(drop=True)
+        trade_days = (int(opt["TRADE_DATE"].min()), int(opt["TRADE_DATE"].max()))
+        opt = attach_underlying(opt, load_futures(symbol, fut_dir, trade_days), load_index_spot(symbol))
+
+        new = compute_greeks(opt)
+
+        if old is not None:
+            merged = merge_sorted(old, new, keys=DEDUP_KEYS, sort_keys=SORT_KEYS)
+        else:
+            merged = new.sort_values(SORT_KEYS)
+
+        if write_if_changed(merged, out_file, digests):
+            rows_done += len(new)
+
+    save_digests(out_dir, digests)
+
+    print(f" {seg} GREEKS UPDATED → {out_dir} | New rows: {rows_done}")
+
+# ==================================================
+# DONE
+# ==================================================
+print("\n OPTIONS GREEKS BUILD COMPLETED")
+print(f" Output root: {OUT_ROOT}")
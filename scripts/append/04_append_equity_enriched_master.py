@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+MarketForge | EQUITY + DELIVERY (MTO) ENRICHED MASTER (LOCKED)
+
+✔ Latest CLEANED bhavcopy (equity_daily) + same-day CLEANED MTO (equityDat_daily)
+✔ ONE vectorized merge on SYMBOL_ID (EQ only, both sides; ids from the
+  symbol registry, marketforge/symbols.py — survives renames)
+✔ TRADE_DATE = YYYYMMDD (int) — same key as MTO / FO / indices
+✔ OHLCV + DELIVERABLE_QTY + DELIVERY_PCT per row
+✔ MTO not published yet → delivery left empty, filled on rerun
+✔ MTO present but zero rows joined → hard fail (registry ids disagree)
+✔ Per-symbol master CSV
+✔ Append-safe & idempotent
+✔ Unchanged symbol files are not rewritten (content digest)
+✔ Inserted / replaced rows → delta feed (data/delta, marketforge/cdc.py)
+"""
+
+from pathlib import Path
+import pandas as pd
+import sys
+
+# ==================================================
+# PATHS
+# ==================================================
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from marketforge.settings import ROOT  # noqa: E402
+from marketforge.merge import merge_sorted  # noqa: E402
+from marketforge.io import load_digests, save_digests, write_if_changed  # noqa: E402
+from marketforge import cdc  # noqa: E402
+from marketforge import dates  # noqa: E402
+from marketforge import symbols  # noqa: E402
+
+EQ_DIR = ROOT / "data" / "processed" / "equity_daily"
+MTO_DIR = ROOT / "data" / "processed" / "equityDat_daily"
+OUT_DIR = ROOT / "data" / "master" / "Equity_enriched_master"
+
+OUT_DIR.mkdir(parents=True, exist_ok=True)
+
+# ==================================================
+# HARD CONTRACT
+# ==================================================
+EQ_COLS = [
+    "TRADE_DATE",
+    "SYMBOL",
+    "SERIES",
+    "OPEN",
+    "HIGH",
+    "LOW",
+    "CLOSE",
+    "LAST",
+    "PREVCLOSE",
+    "TOTTRDQTY",
+    "TOTTRDVAL",
+    "TOTALTRADES",
+    "ISIN",
+]
+
+MTO_COLS = [
+    "SYMBOL_ID",
+    "DELIVERABLE_QTY",
+    "DELIVERY_PCT",
+]
+
+FINAL_COLS = [
+    "TRADE_DATE",
+    "SYMBOL",
+    "SYMBOL_ID",
+    "SERIES",
+    "OPEN",
+    "HIGH",
+    "LOW",
+    "CLOSE",
+    "LAST",
+    "PREVCLOSE",
+    "TOTTRDQTY",
+    "TOTTRDVAL",
+    "TOTALTRADES",
+    "DELIVERABLE_QTY",
+    "DELIVERY_PCT",
+    "ISIN",
+]
+
+DEDUP_KEYS = ["TRADE_DATE", "SYMBOL"]
+
+# ==================================================
+# LATEST CLEANED BHAVCOPY
+# ==================================================
+files = sorted(
+    EQ_DIR.glob("BhavCopy_NSE_CM_*.csv"),
+    key=lambda f: f.stat().st_mtime,
+    reverse=True
+)
+
+if not files:
+    print(" No cleaned equity files found")
+    sys.exit(0)
+
+eq_file = files[0]
+print(f" Bhavcopy : {eq_file.name}")
+
+eq = pd.read_csv(eq_file, low_memory=False)
+
+eq.columns = (
+    eq.columns.astype(str)
+    .str.strip()
+    .str.upper()
+)
+eq = eq.rename(columns={"DATE": "TRADE_DATE"})    # daily files cleaned before the key
+
+missing = set(EQ_COLS) - set(eq.columns)
+if missing:
+    raise RuntimeError(f" Bhavcopy missing columns: {sorted(missing)}")
+
+eq = eq[EQ_COLS]
+
+eq["SERIES"] = eq["SERIES"].astype(str).str.strip()
+eq = eq[eq["SERIES"] == "EQ"]
+
+if eq.empty:
+    print(" No EQ rows in bhavcopy — nothing to append")
+    sys.exit(0)
+
+# ==================================================
+# TRADE_DATE (YYYYMMDD INT)
+# ==================================================
+eq["TRADE_DATE"] = dates.key(eq["TRADE_DATE"])
+eq = eq[eq["TRADE_DATE"].notna()]
+
+trade_dates = eq["TRADE_DATE"].unique()
+if len(trade_dates) != 1:
+    raise RuntimeError(f" Bhavcopy spans {len(trade_dates)} dates — expected one")
+
+trade_date = int(trade_dates[0])
+
+# ==================================================
+# TYPE ENFORCEMENT (BHAVCOPY)
+# ==================================================
+for c in ["OPEN", "HIGH", "LOW", "CLOSE", "LAST", "PREVCLOSE", "TOTTRDVAL"]:
+    eq[c] = pd.to_numeric(eq[c], errors="coerce").astype("float64")
+
+for c in ["TOTTRDQTY", "TOTALTRADES"]:
+    eq[c] = (
+        pd.to_numeric(eq[c], errors="coerce")
+        .fillna(0)
+        .astype("int64")
+    )
+
+eq["SYMBOL"] = eq["SYMBOL"].astype(str).str.strip().str.upper()
+eq["TRADE_DATE"] = eq["TRADE_DATE"].astype(dates.DTYPE)
+
+eq = symbols.tag(eq, "TRADE_DATE", isin_col="ISIN")
+symbols.follow_renames(OUT_DIR)
+
+# ==================================================
+# SAME-DAY MTO
+# ==================================================
+mto_file = MTO_DIR / f"mto_{trade_date}.csv"
+
+if mto_file.exists():
+    print(f" MTO      : {mto_file.name}")
+
+    mto = pd.read_csv(mto_file, low_memory=False)
+    mto.columns = mto.columns.str.strip().str.upper()
+
+    mto["SERIES"] = mto["SERIES"].astype(str).str.strip()
+    mto = mto[mto["SERIES"] == "EQ"]
+
+    mto["SYMBOL"] = mto["SYMBOL"].astype(str).str.strip().str.upper()
+    mto["DELIVERABLE_QTY"] = (
+        pd.to_numeric(mto["DELIVERABLE_QTY"], errors="coerce")
+        .astype("Int64")
+    )
+    mto["DELIVERY_PCT"] = pd.to_numeric(
+        mto["DELIVERY_PCT"], errors="coerce"
+    ).astype("float64")
+
+    mto["SYMBOL_ID"] = symbols.ids(mto["SYMBOL"], pd.Series(trade_date, index=mto.index))
+    mto = mto[MTO_COLS].drop_duplicates("SYMBOL_ID", keep="last")
+else:
+    print(f" MTO for {trade_date} not available yet — delivery left empty")
+    mto = pd.DataFrame({
+        "SYMBOL_ID": pd.Series(dtype="int32"),
+        "DELIVERABLE_QTY": pd.Series(dtype="Int64"),
+        "DELIVERY_PCT": pd.Series(dtype="float64"),
+    })
+
+# ==================================================
+# ONE VECTORIZED JOIN
+# ==================================================
+df = eq.merge(mto, on="SYMBOL_ID", how="left", validate="many_to_one")
+df = df[FINAL_COLS]
+
+matched = int(df["DELIVERABLE_QTY"].notna().sum())
+
+print(f" Trade date     : {trade_date}")
+print(f" EQ rows        : {len(df)}")
+print(f" With delivery  : {matched}")
+
+# same-day MTO that matches no EQ row = broken ids, not a data gap
+if not mto.empty and matched == 0:
+    raise RuntimeError(
+        f" MTO {mto_file.name} has {len(mto)} EQ rows but none joined on SYMBOL_ID — "
+        "check data/master/symbol_registry.csv"
+    )
+
+# ==================================================
+# APPEND PER SYMBOL (IDEMPOTENT)
+# ==================================================
+symbols_updated = 0
+digests = load_digests(OUT_DIR)
+with cdc.feed("enriched", keys=DEDUP_KEYS, date_col="TRADE_DATE") as delta:
+    for symbol, g in df.groupby("SYMBOL"):
+        out_file = OUT_DIR / f"{symbol}.csv"
+
+        if out_file.exists():
+            old = symbols.carry(pd.read_csv(out_file, low_memory=False), g)
+
+            old["TRADE_DATE"] = pd.to_numeric(
+                old["TRADE_DATE"], errors="coerce"
+            ).astype("int64")
+            old["DELIVERABLE_QTY"] = pd.to_numeric(
+                old["DELIVERABLE_QTY"], errors="coerce"
+            ).astype("Int64")
+
+            merged = merge_sorted(old, g, keys=DEDUP_KEYS, sort_keys=["TRADE_DATE"])
+            delta.capture(old, g)
+        else:
+            merged = g
+            delta.capture(None, g)
+
+        symbols_updated += write_if_changed(merged, out_file, digests)
+
+    save_digests(OUT_DIR, digests)
+
+# ==================================================
+# DONE
+# ==================================================
+print("\n EQUITY ENRICHED MASTER UPDATED")
+print(f" Master folder   : {OUT_DIR}")
+print(f" Symbols updated : {symbols_updated}")
@@ -11,17 +11,24 @@ MarketForge | APPEND DAILY EQUITY MTO → SYMBOLWISE MASTER (LOCKED)
 ✔ Duplicate-safe
 ✔ CSV ONLY
 ✔ ZERO data loss
+✔ Inserted / replaced rows → delta feed (data/delta, marketforge/cdc.py)
 """
 
 from pathlib import Path
 import pandas as pd
 import sys
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from marketforge.settings import ROOT  # noqa: E402
+from marketforge.merge import merge_sorted  # noqa: E402
+from marketforge.io import load_digests, save_digests, write_if_changed  # noqa: E402
+from marketforge import cdc  # noqa: E402
+from marketforge import symbols  # noqa: E402
+
 # ==================================================
 # PATHS
 # ==================================================
-ROOT = Path(r"H:\MarketForge")
-
 DAILY_DIR  = ROOT / "data" / "processed" / "equityDat_daily"
 MASTER_DIR = ROOT / "data" / "master" / "EqiutyDat_master"
 
@@ -94,36 +101,42 @@ if df.empty:
     print(" No EQ rows in daily MTO — nothing to append")
     sys.exit(0)
 
+df = symbols.tag(df, "TRADE_DATE")
+symbols.follow_renames(MASTER_DIR)
+
 # ==================================================
 # APPEND PER SYMBOL (CORRECT WAY)
 # ==================================================
 symbols_updated = 0
+digests = load_digests(MASTER_DIR)
+with cdc.feed("mto") as delta:
+    for symbol, g in df.groupby("SYMBOL"):
+        out_file = MASTER_DIR / f"{symbol}.csv"
 
-for symbol, g in df.groupby("SYMBOL"):
-    out_file = MASTER_DIR / f"{symbol}.csv"
+        # If symbol master doesn't exist → SKIP (no silent creation)
+        if not out_file.exists():
+            continue
 
-    # If symbol master doesn't exist → SKIP (no silent creation)
-    if not out_file.exists():
-        continue
+        old = pd.read_csv(out_file, low_memory=False)
 
-    old = pd.read_csv(out_file, low_memory=False)
+        old.columns = old.columns.str.strip().str.upper()
+        old = symbols.carry(old[[c for c in g.columns if c in old.columns]], g)
 
-    old.columns = old.columns.str.strip().str.upper()
-    old = old[FINAL_COLS]
+        # Enforce types again
+        old["TRADE_DATE"] = pd.to_numeric(
+            old["TRADE_DATE"], errors="coerce"
+        ).astype("int64")
 
-    # Enforce types again
-    old["TRADE_DATE"] = pd.to_numeric(
-        old["TRADE_DATE"], errors="coerce"
-    ).astype("int64")
+        combined = merge_sorted(
+            old, g,
+            keys=["TRADE_DATE", "SYMBOL"],
+            sort_keys=["TRADE_DATE"],
+        )
+        delta.capture(old, g)
 
-    combined = (
-        pd.concat([old, g], ignore_index=True)
-        .drop_duplicates(subset=["TRADE_DATE", "SYMBOL"], keep="last")
-        .sort_values("TRADE_DATE")
-    )
+        symbols_updated += write_if_changed(combined, out_file, digests)
 
-    combined.to_csv(out_file, index=False)
-    symbols_updated += 1
+    save_digests(MASTER_DIR, digests)
 
 # ==================================================
 # DONE
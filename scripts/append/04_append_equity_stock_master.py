@@ -9,19 +9,27 @@ MarketForge | EQUITY STOCK MASTER BUILDER (CSV ONLY)
 ✔ CSV ONLY (Parquet removed)
 ✔ Per-symbol master CSV
 ✔ Append-safe & idempotent
-✔ DATE dtype hardened
+✔ TRADE_DATE = YYYYMMDD int (marketforge/dates.py) — no date parsing
 ✔ Production safe
+✔ Inserted / replaced rows → delta feed (data/delta, marketforge/cdc.py)
 """
 
 from pathlib import Path
 import pandas as pd
 import sys
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from marketforge.settings import ROOT  # noqa: E402
+from marketforge.merge import merge_sorted  # noqa: E402
+from marketforge.io import load_digests, save_digests, write_if_changed  # noqa: E402
+from marketforge import cdc  # noqa: E402
+from marketforge import dates  # noqa: E402
+from marketforge import symbols  # noqa: E402
+
 # ==================================================
 # PATHS
 # ==================================================
-ROOT = Path(r"H:\MarketForge")
-
 IN_DIR = ROOT / "data" / "processed" / "equity_daily"
 OUT_DIR = ROOT / "data" / "master" / "Equity_stock_master"
 
@@ -82,7 +90,7 @@ if df.empty:
 # REQUIRED COLUMNS
 # ==================================================
 KEEP_COLS = [
-    "DATE",
+    "TRADE_DATE",
     "SYMBOL",
     "SERIES",
     "OPEN",
@@ -97,6 +105,7 @@ KEEP_COLS = [
     "ISIN",
 ]
 
+df = df.rename(columns={"DATE": "TRADE_DATE"})    # daily files cleaned before the key
 missing = [c for c in KEEP_COLS if c not in df.columns]
 if missing:
     raise RuntimeError(f"Missing required columns: {missing}")
@@ -106,8 +115,8 @@ df = df[KEEP_COLS]
 # ==================================================
 # TYPE ENFORCEMENT (GLOBAL)
 # ==================================================
-df["DATE"] = pd.to_datetime(df["DATE"], errors="coerce")
-df = df[df["DATE"].notna()]
+df["TRADE_DATE"] = dates.key(df["TRADE_DATE"])
+df = df[df["TRADE_DATE"].notna()]
 
 FLOAT_COLS = [
     "OPEN", "HIGH", "LOW", "CLOSE",
@@ -128,39 +137,43 @@ for c in INT_COLS:
 
 df["SYMBOL"] = df["SYMBOL"].astype(str).str.strip()
 
+# ISIN-aware ids; a renamed symbol's file moves to the new name first
+df = symbols.tag(df, "TRADE_DATE", isin_col="ISIN")
+symbols.follow_renames(OUT_DIR)
+
 print(f" EQ rows        : {len(df)}")
 print(f" Symbols found  : {df['SYMBOL'].nunique()}")
 
 # ==================================================
-# APPEND PER SYMBOL (CSV ONLY, DATE SAFE)
+# APPEND PER SYMBOL (CSV ONLY, INTEGER DATE KEY)
 # ==================================================
-for symbol, g in df.groupby("SYMBOL"):
-    g = g.sort_values("DATE")
+written = 0
+digests = load_digests(OUT_DIR)
+with cdc.feed("equity") as delta:
+    for symbol, g in df.groupby("SYMBOL"):
+        g = g.sort_values("TRADE_DATE")
 
-    csv_out = OUT_DIR / f"{symbol}.csv"
+        csv_out = OUT_DIR / f"{symbol}.csv"
 
-    if csv_out.exists():
-        old = pd.read_csv(csv_out)
+        if csv_out.exists():
+            old = symbols.carry(pd.read_csv(csv_out), g)
 
-        merged = pd.concat([old, g], ignore_index=True)
+            if "DATE" in old.columns:
+                raise RuntimeError(
+                    f" {csv_out.name} still keyed on DATE — run "
+                    "scripts/master_merge/02_migrate_trade_date_keys.py first"
+                )
 
-        #  HARD DATE STANDARD (CRITICAL FIX)
-        merged["DATE"] = pd.to_datetime(
-            merged["DATE"], errors="coerce"
-        )
+            merged = merge_sorted(old, g, keys=["TRADE_DATE"], sort_keys=["TRADE_DATE"])
+            delta.capture(old, g)
+        else:
+            merged = g
+            delta.capture(None, merged)
 
-        merged = (
-            merged
-                .drop_duplicates(subset=["DATE"], keep="last")
-                .sort_values("DATE")
-        )
-    else:
-        merged = g.copy()
-        merged["DATE"] = pd.to_datetime(
-            merged["DATE"], errors="coerce"
-        )
+        written += write_if_changed(merged, csv_out, digests)
 
-    merged.to_csv(csv_out, index=False)
+    save_digests(OUT_DIR, digests)
 
 print("\n EQUITY STOCK MASTER UPDATED (CSV ONLY)")
 print(f" Output path: {OUT_DIR}")
+print(f" Files written: {written}")
@@ -11,16 +11,27 @@ MarketForge | FUTURES MASTER APPENDER (FINAL LOCKED)
 ✔ CSV only
 ✔ ZERO warnings
 ✔ Idempotent
+✔ Unchanged symbol files are not rewritten (content digest)
+✔ Per-block min / max zone map next to each CSV (marketforge/zones.py)
+✔ Inserted / replaced rows → delta feed (data/delta, marketforge/cdc.py)
 """
 
 from pathlib import Path
 import pandas as pd
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from marketforge.settings import ROOT  # noqa: E402
+from marketforge.merge import merge_sorted  # noqa: E402
+from marketforge.io import load_digests, save_digests, write_if_changed  # noqa: E402
+from marketforge import cdc  # noqa: E402
+from marketforge import symbols  # noqa: E402
+from marketforge import zones  # noqa: E402
 
 # ==================================================
 # PATHS
 # ==================================================
-ROOT = Path(r"H:\MarketForge")
-
 DAILY_ROOT = ROOT / "data" / "processed" / "futures_daily"
 MASTER_ROOT = ROOT / "data" / "master" / "Futures_master"
 
@@ -54,7 +65,7 @@ FINAL_COLS = [
 # ==================================================
 # APPEND FUNCTION
 # ==================================================
-def append_futures(daily_file: Path, out_dir: Path):
+def append_futures(daily_file: Path, out_dir: Path, digests: dict, delta: cdc.DeltaFeed) -> int:
     print(f"  → Reading {daily_file.name}")
 
     df = pd.read_csv(daily_file, low_memory=False)
@@ -108,41 +119,55 @@ def append_futures(daily_file: Path, out_dir: Path):
         df["SYMBOL"].notna()
     ]
 
+    df = symbols.tag(df, "TRADE_DATE")
+
     # -----------------------------
     # APPEND PER SYMBOL (IDEMPOTENT)
     # -----------------------------
+    written = 0
+
     for symbol, g in df.groupby("SYMBOL"):
         out_file = out_dir / f"{symbol}.csv"
 
         if out_file.exists():
-            old = pd.read_csv(out_file, low_memory=False)
+            old = symbols.carry(pd.read_csv(out_file, low_memory=False), g)
 
             old["TRADE_DATE"] = pd.to_numeric(old["TRADE_DATE"], errors="coerce").astype("Int64")
             old["EXP_DATE"] = pd.to_numeric(old["EXP_DATE"], errors="coerce").astype("Int64")
 
-            merged = (
-                pd.concat([old, g], ignore_index=True)
-                .drop_duplicates(
-                    subset=["SYMBOL", "TRADE_DATE", "EXP_DATE"],
-                    keep="last"
-                )
-                .sort_values(["TRADE_DATE", "EXP_DATE"])
+            merged = merge_sorted(
+                old, g,
+                keys=["SYMBOL", "TRADE_DATE", "EXP_DATE"],
+                sort_keys=["TRADE_DATE", "EXP_DATE"],
             )
+            delta.capture(old, g)
         else:
             merged = g.sort_values(["TRADE_DATE", "EXP_DATE"])
+            delta.capture(None, g)
+
+        written += write_if_changed(merged, out_file, digests, zone_cols=zones.ZONE_COLS)
 
-        merged.to_csv(out_file, index=False)
+    return written
 
 # ==================================================
 # RUN
 # ==================================================
-print("\nProcessing STOCK FUTURES")
-for f in sorted((DAILY_ROOT / "STOCKS").glob("futstk*.csv")):
-    append_futures(f, STOCK_MASTER)
-
-print("\nProcessing INDEX FUTURES")
-for f in sorted((DAILY_ROOT / "INDICES").glob("futidx*.csv")):
-    append_futures(f, INDEX_MASTER)
+with cdc.feed("futures") as delta:
+    for label, pattern, master in [
+        ("STOCK", "STOCKS/futstk*.csv", STOCK_MASTER),
+        ("INDEX", "INDICES/futidx*.csv", INDEX_MASTER),
+    ]:
+        print(f"\nProcessing {label} FUTURES")
+
+        symbols.follow_renames(master, suffixes=(".csv", zones.SUFFIX))
+        digests = load_digests(master)
+        written = 0
+
+        for f in sorted(DAILY_ROOT.glob(pattern)):
+            written += append_futures(f, master, digests, delta)
+
+        save_digests(master, digests)
+        print(f" {label} files written: {written}")
 
 print("\n FUTURES MASTER APPEND COMPLETED (LOCKED, ZERO WARNINGS)")
 print(f" FUTSTK → {STOCK_MASTER}")
@@ -10,16 +10,25 @@ MarketForge | APPEND NIFTY → MASTER_NIFTY (LOCKED)
 ✔ Schema locked
 ✔ Append-safe & duplicate-safe
 ✔ CSV ONLY (index master)
+✔ Unchanged master is not rewritten (content digest)
+✔ Inserted / replaced rows → delta feed (data/delta, marketforge/cdc.py)
 """
 
 from pathlib import Path
 import pandas as pd
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from marketforge.settings import ROOT  # noqa: E402
+from marketforge.merge import merge_sorted  # noqa: E402
+from marketforge.io import load_digests, save_digests, write_if_changed  # noqa: E402
+from marketforge import cdc  # noqa: E402
+from marketforge import symbols  # noqa: E402
 
 # ==================================================
 # PATHS
 # ==================================================
-ROOT = Path(r"H:\MarketForge")
-
 CLEAN_DIR = ROOT / "data" / "processed" / "indices_daily"
 MASTER_DIR = ROOT / "data" / "master" / "Indices_master"
 MASTER_DIR.mkdir(parents=True, exist_ok=True)
@@ -60,6 +69,7 @@ mapped = pd.DataFrame({
     "LOW": daily["LOW"].astype("float64"),
     "CLOSE": daily["CLOSE"].astype("float64"),
 })
+mapped = symbols.tag(mapped, "TRADE_DATE")
 
 # ==================================================
 # LOAD OR INIT MASTER
@@ -68,26 +78,31 @@ if MASTER_FILE.exists():
     master = pd.read_csv(MASTER_FILE, low_memory=False)
 
     master["TRADE_DATE"] = master["TRADE_DATE"].astype("int64")
+    master = symbols.carry(master, mapped)
 else:
     master = pd.DataFrame(columns=mapped.columns)
 
 # ==================================================
 # APPEND + TRUE DEDUPE
 # ==================================================
-combined = (
-    pd.concat([master, mapped], ignore_index=True)
-    .drop_duplicates(subset=["TRADE_DATE", "SYMBOL"], keep="last")
-    .sort_values("TRADE_DATE")
-    .reset_index(drop=True)
+combined = merge_sorted(
+    master, mapped,
+    keys=["TRADE_DATE", "SYMBOL"],
+    sort_keys=["TRADE_DATE"],
 )
 
 # ==================================================
-# SAVE
+# SAVE + DELTA FEED
 # ==================================================
-combined.to_csv(MASTER_FILE, index=False)
+digests = load_digests(MASTER_DIR)
+written = write_if_changed(combined, MASTER_FILE, digests)
+save_digests(MASTER_DIR, digests)
+
+with cdc.feed("indices") as delta:
+    delta.capture(master, mapped)
 
 print("\n NIFTY MASTER APPEND COMPLETED (LOCKED)")
-print(f" Master file : {MASTER_FILE}")
+print(f" Master file : {MASTER_FILE}{'' if written else ' (unchanged)'}")
 print(f" Total rows : {len(combined)}")
 print(
     f" Date range : "
@@ -9,19 +9,48 @@ MarketForge | OPTIONS MASTER BUILDER (FINAL LOCKED)
 ✔ STRIKE_PRICE enforced
 ✔ Append-safe & idempotent
 ✔ CSV + Parquet (same schema)
+✔ Per-block min / max zone map next to each CSV (marketforge/zones.py)
+✔ Hot / cold tiers (marketforge/tiers.py): only live + recent expiries
+  are rewritten daily; expired months go once to cold/<SYMBOL>/<YYYYMM>.parquet
+✔ Unchanged symbol files are not rewritten (content digest)
+✔ Inserted / replaced rows → delta feed (data/delta, marketforge/cdc.py)
+✔ Phase metrics → logs/metrics/append_options.jsonl
+✔ Chunked mode (--memory-mb N or MARKETFORGE_APPEND_MEMORY_MB): daily
+  files read in date order in chunks of ≤ N/2 MB, rows spilled to
+  per-symbol buffers on disk, each symbol's buffer merged into its
+  master ≤ N/2 MB at a time, expired months archived as they go cold
+  → peak memory ≈ N + one hot file, whatever the history length
 ✔ ZERO warnings
+
+Usage:
+    python 04_append_options_master.py
+    python 04_append_options_master.py --memory-mb 2048     (full-history builds)
 """
 
 from pathlib import Path
+import argparse
+import shutil
 import pandas as pd
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from marketforge.settings import ROOT, APPEND_MEMORY_MB  # noqa: E402
+from marketforge import metrics  # noqa: E402
+from marketforge.merge import merge_sorted  # noqa: E402
+from marketforge.io import load_digests, save_digests, write_if_changed  # noqa: E402
+from marketforge import cdc  # noqa: E402
+from marketforge import symbols  # noqa: E402
+from marketforge import tiers  # noqa: E402
+from marketforge import zones  # noqa: E402
+from marketforge import dates  # noqa: E402
 
 # ==================================================
 # PATHS
 # ==================================================
-ROOT = Path(r"H:\MarketForge")
-
 SRC_ROOT = ROOT / "data" / "processed" / "options_daily"
 OUT_ROOT = ROOT / "data" / "master" / "option_master"
+SPILL_ROOT = ROOT / "data" / "tmp" / "append_options"
 
 SRC_MAP = {
     "STOCKS": SRC_ROOT / "STOCKS",
@@ -36,7 +65,20 @@ OUT_MAP = {
 for p in OUT_MAP.values():
     p.mkdir(parents=True, exist_ok=True)
 
+parser = argparse.ArgumentParser(description="Append daily option files into the option masters")
+parser.add_argument(
+    "--memory-mb",
+    type=int,
+    default=APPEND_MEMORY_MB,
+    help="chunked mode under this memory budget (0 = load every daily file at once)",
+)
+args = parser.parse_args()
+
+BUDGET = args.memory_mb * 1024 * 1024
+
 print("\n MarketForge | OPTIONS MASTER BUILD STARTED")
+if BUDGET:
+    print(f" Chunked mode | memory budget {args.memory_mb} MB")
 
 # ==================================================
 # HARD CONTRACT (FINAL)
@@ -71,23 +113,9 @@ DEDUP_KEYS = [
 SORT_KEYS = DEDUP_KEYS
 
 # ==================================================
-# PROCESS
+# NORMALIZE ONE FRAME
 # ==================================================
-for seg, src_dir in SRC_MAP.items():
-    out_dir = OUT_MAP[seg]
-
-    files = sorted(src_dir.glob("*.csv"))
-    print(f"\n Processing {seg} | Files: {len(files)}")
-
-    if not files:
-        continue
-
-    # ---------- LOAD ALL DAILY FILES ----------
-    df = pd.concat(
-        (pd.read_csv(f, low_memory=False) for f in files),
-        ignore_index=True
-    )
-
+def normalize(df: pd.DataFrame, seg: str) -> pd.DataFrame:
     # ---------- NORMALIZE COLUMNS ----------
     df.columns = (
         df.columns.astype(str)
@@ -134,33 +162,209 @@ for seg, src_dir in SRC_MAP.items():
         df["EXP_DATE"].notna() &
         df["SYMBOL"].notna()
     ]
+    return symbols.tag(df, "TRADE_DATE")
 
-    # ---------- PER SYMBOL APPEND ----------
-    for symbol, g in df.groupby("SYMBOL", sort=False):
-        g = g.sort_values(SORT_KEYS)
+# ==================================================
+# PER SYMBOL APPEND
+# ==================================================
+def read_master(csv_out: Path, g: pd.DataFrame, m) -> pd.DataFrame:
+    with m.phase("read_master") as p:
+        old = symbols.carry(pd.read_csv(csv_out, low_memory=False), g)
+        p.rows += len(old)
+        p.bytes += csv_out.stat().st_size
+
+        old["TRADE_DATE"] = pd.to_numeric(old["TRADE_DATE"], errors="coerce").astype("Int64")
+        old["EXP_DATE"]   = pd.to_numeric(old["EXP_DATE"], errors="coerce").astype("Int64")
+        old["STRIKE_PRICE"] = pd.to_numeric(old["STRIKE_PRICE"], errors="coerce").astype("int64")
+    return old
+
+
+def append_symbol(symbol: str, batches, out_dir: Path, digests: dict, delta, m) -> None:
+    """batches → (new rows, hot cutoff) in file order; one batch unless chunked."""
+    csv_out = out_dir / f"{symbol}.csv"
+    pq_out  = out_dir / f"{symbol}.parquet"
+    hot = None
+
+    for g, cut in batches:
+        g, late = tiers.drop_archived(g, out_dir, symbol)
+        if late:
+            m.count("rows_already_archived", late)
+        if g.empty:
+            continue
+        g = g.sort_values(SORT_KEYS, kind="mergesort")
+
+        if hot is None and csv_out.exists():
+            hot = read_master(csv_out, g, m)
+
+        if hot is not None:
+            with m.phase("merge") as p:
+                merged = merge_sorted(hot, g, keys=DEDUP_KEYS, sort_keys=SORT_KEYS)
+                p.rows += len(merged)
+            delta.capture(hot, g)
+        else:
+            merged = g
+            delta.capture(None, g)
 
-        csv_out = out_dir / f"{symbol}.csv"
-        pq_out  = out_dir / f"{symbol}.parquet"
+        hot, cold = tiers.split(merged, cut)
 
-        if csv_out.exists():
-            old = pd.read_csv(csv_out, low_memory=False)
+        with m.phase("archive") as p:
+            n = tiers.archive(cold, out_dir, symbol)
+            if n:
+                p.rows += len(cold)
+                m.count("cold_files_written", n)
 
-            old["TRADE_DATE"] = pd.to_numeric(old["TRADE_DATE"], errors="coerce").astype("Int64")
-            old["EXP_DATE"]   = pd.to_numeric(old["EXP_DATE"], errors="coerce").astype("Int64")
-            old["STRIKE_PRICE"] = pd.to_numeric(old["STRIKE_PRICE"], errors="coerce").astype("int64")
+    if hot is None:
+        return      # nothing new for this symbol
 
-            merged = (
-                pd.concat([old, g], ignore_index=True)
-                .drop_duplicates(subset=DEDUP_KEYS, keep="last")
-                .sort_values(SORT_KEYS)
-            )
+    with m.phase("write") as p:
+        if write_if_changed(hot, csv_out, digests, parquet_path=pq_out, zone_cols=zones.ZONE_COLS):
+            p.rows += len(hot)
+            p.bytes += csv_out.stat().st_size + pq_out.stat().st_size
+            m.count("symbols_written")
         else:
-            merged = g
+            m.count("symbols_unchanged")
+
+# ==================================================
+# CHUNKED MODE — DAILY FILES → PER-SYMBOL SPILL BUFFERS
+# ==================================================
+def spill_daily(files: list, seg: str, spill: Path, m) -> tuple:
+    """
+    Pass 1: daily files (date order) → spill/<SYMBOL>/<chunk>.pkl, flushed
+    every BUDGET/2 bytes of rows. Returns ({symbol: [(part, bytes, chunk)]},
+    [latest trade date once chunk k is read]).
+    """
+    parts = {}
+    chunk_last = []
+    buf, size, last = [], 0, 0
+
+    def flush():
+        df = pd.concat(buf, ignore_index=True)
+        k = len(chunk_last)
+        chunk_last.append(last)
+
+        with m.phase("spill") as p:
+            for symbol, g in df.groupby("SYMBOL", sort=False):
+                part = spill / symbol / f"{k:06d}.pkl"
+                part.parent.mkdir(parents=True, exist_ok=True)
+                g.to_pickle(part)
+                parts.setdefault(symbol, []).append((part, int(g.memory_usage(deep=True).sum()), k))
+            p.rows += len(df)
+
+    for f in sorted(files, key=lambda f: (dates.from_name(f.name), f.name)):
+        with m.phase("read_daily") as p:
+            raw = pd.read_csv(f, low_memory=False)
+            p.rows += len(raw)
+            p.bytes += f.stat().st_size
+
+        with m.phase("transform") as p:
+            df = normalize(raw, seg)
+            p.rows += len(df)
+
+        if df.empty:
+            continue
+
+        buf.append(df)
+        size += int(df.memory_usage(deep=True).sum())
+        last = max(last, int(df["TRADE_DATE"].max()))
+
+        if size >= BUDGET // 2:
+            flush()
+            buf, size = [], 0
+
+    if buf:
+        flush()
+
+    return parts, chunk_last
+
+
+def spilled_batches(parts: list, chunk_last: list, cut: int, m):
+    """
+    Pass 2: one symbol's spill parts, ≤ BUDGET/2 bytes per batch. Batches
+    before the last use the cutoff as of their own chunk: files arrive in
+    date order, so a month that is cold then gets no later rows.
+    """
+    batches, size = [[]], 0
+    for part in parts:
+        if batches[-1] and size + part[1] > BUDGET // 2:
+            batches.append([])
+            size = 0
+        batches[-1].append(part)
+        size += part[1]
+
+    for i, batch in enumerate(batches):
+        with m.phase("read_spill") as p:
+            g = pd.concat((pd.read_pickle(f) for f, _, _ in batch), ignore_index=True)
+            p.rows += len(g)
+
+        final = i == len(batches) - 1
+        yield g, cut if final else tiers.cutoff(chunk_last[batch[-1][2]])
+
+# ==================================================
+# PROCESS
+# ==================================================
+with metrics.stage("append_options") as m, cdc.feed(
+    "options", spill=SPILL_ROOT / "delta" if BUDGET else None,
+) as delta:
+    for seg, src_dir in SRC_MAP.items():
+        out_dir = OUT_MAP[seg]
+
+        files = sorted(src_dir.glob("*.csv"))
+        print(f"\n Processing {seg} | Files: {len(files)}")
+
+        if not files:
+            continue
+
+        symbols.follow_renames(out_dir, suffixes=(".csv", ".parquet", zones.SUFFIX))
+        tiers.follow_renames(out_dir, symbols.renames())
+        digests = load_digests(out_dir)
+
+        if BUDGET:
+            spill = SPILL_ROOT / seg
+            if spill.exists():
+                shutil.rmtree(spill)
+
+            # ---------- PASS 1: CHUNKS → PER-SYMBOL SPILL ----------
+            parts, chunk_last = spill_daily(files, seg, spill, m)
+            if not parts:
+                shutil.rmtree(spill, ignore_errors=True)
+                continue
+
+            cut = tiers.cutoff(max(chunk_last))
+            print(f" Chunks: {len(chunk_last)} | Symbols: {len(parts)}")
+            print(f" Hot expiries from {cut} (older → cold archive)")
+
+            # ---------- PASS 2: PER-SYMBOL MERGE ----------
+            for symbol, sym_parts in parts.items():
+                append_symbol(
+                    symbol, spilled_batches(sym_parts, chunk_last, cut, m),
+                    out_dir, digests, delta, m,
+                )
+
+            shutil.rmtree(spill)
+
+        else:
+            # ---------- LOAD ALL DAILY FILES ----------
+            with m.phase("read_daily") as p:
+                df = pd.concat(
+                    (pd.read_csv(f, low_memory=False) for f in files),
+                    ignore_index=True
+                )
+                p.rows += len(df)
+                p.bytes += sum(f.stat().st_size for f in files)
+
+            with m.phase("transform") as p:
+                df = normalize(df, seg)
+                p.rows += len(df)
+
+            cut = tiers.cutoff(df["TRADE_DATE"].max())
+            print(f" Hot expiries from {cut} (older → cold archive)")
+
+            for symbol, g in df.groupby("SYMBOL", sort=False):
+                append_symbol(symbol, [(g, cut)], out_dir, digests, delta, m)
 
-        merged.to_csv(csv_out, index=False)
-        merged.to_parquet(pq_out, index=False)
+        save_digests(out_dir, digests)
 
-    print(f" {seg} OPTIONS MASTER UPDATED → {out_dir}")
+        print(f" {seg} OPTIONS MASTER UPDATED → {out_dir}")
 
 # ==================================================
 # DONE
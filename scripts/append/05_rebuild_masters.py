@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+MarketForge | SINGLE-PASS BULK MASTER REBUILD
+
+✔ Rebuilds equity / mto / futures / options / indices masters
+  from processed daily files — no day-by-day appender replay
+✔ Pass 1: every daily file read ONCE, rows spilled to symbol-hash buckets
+✔ Pass 2: per bucket → one global sort + dedup on the master keys
+✔ Each symbol file written at most once, through io.write_if_changed —
+  unchanged files are skipped and the digests the appenders read stay
+  in step with the rebuilt masters
+✔ Memory bounded by bucket size, not history length
+✔ Same normalization / dedup rules as the 04_append_* scripts
+✔ Later daily file wins on duplicate keys (same as keep="last") —
+  "later" = later trade date in the file, mtime only as a tie-break
+✔ Daily files read in trade-date order (name date, then mtime) so
+  symbols.tag registers ids in history order
+✔ No row deltas: each rebuilt folder is recorded as a cdc.snapshot()
+  in the delta manifest → consumers reload the dataset
+✔ Tiered masters (options): expired months rewritten into the cold
+  archive, live + recent expiries into the hot file (marketforge/tiers.py)
+
+Usage:
+    python 05_rebuild_masters.py --dataset options
+    python 05_rebuild_masters.py --dataset all --buckets 64
+"""
+
+from pathlib import Path
+import argparse
+import shutil
+import sys
+import pandas as pd
+
+# ==================================================
+# PATHS
+# ==================================================
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from marketforge.settings import ROOT  # noqa: E402
+from marketforge.masters import MASTERS  # noqa: E402
+from marketforge.io import load_digests, save_digests, write_if_changed  # noqa: E402
+from marketforge import cdc, dates, symbols  # noqa: E402
+from marketforge import tiers, zones  # noqa: E402
+
+SPILL_ROOT = ROOT / "data" / "tmp" / "rebuild"
+
+SEQ_COL = "_SEQ"
+SEQ_SPAN = 1_000_000    # _SEQ = file trade date × SEQ_SPAN + file rank
+
+# ==================================================
+# PASS 1 — SCAN ONCE, SPILL TO BUCKETS
+# ==================================================
+def bucket_of(symbols: pd.Series, buckets: int):
+    return pd.util.hash_array(symbols.to_numpy(dtype=object)) % buckets
+
+
+def scan(name: str, spec: dict, in_dir: Path, pattern: str, spill: Path, buckets: int) -> tuple:
+    """(rows spilled, latest trade date seen)."""
+    # trade-date order (file name), mtime only between same-date files —
+    # ids are registered in this order and the later date must win dedup
+    files = sorted(in_dir.glob(pattern), key=lambda f: (dates.from_name(f.name), f.stat().st_mtime))
+    print(f"  Daily files : {len(files)}")
+
+    rows = 0
+    last = 0
+    for seq, f in enumerate(files):
+        df = spec["normalize"](pd.read_csv(f, low_memory=False), f.name)
+        if df.empty:
+            continue
+
+        df = symbols.tag(df, spec["date_col"], isin_col="ISIN" if "ISIN" in df.columns else None)
+
+        # "later file wins" = later trade date; file order only breaks ties
+        day = int(df[spec["date_col"]].max())
+        df[SEQ_COL] = day * SEQ_SPAN + seq
+
+        for b, g in df.groupby(bucket_of(df["SYMBOL"], buckets), sort=False):
+            part_dir = spill / f"b{b:04d}"
+            part_dir.mkdir(parents=True, exist_ok=True)
+            g.to_pickle(part_dir / f"{seq:06d}.pkl")
+
+        rows += len(df)
+        last = max(last, day)
+
+    return rows, last
+
+# ==================================================
+# PASS 2 — SORT + DEDUP PER BUCKET, WRITE ONCE
+# ==================================================
+def merge_bucket(spec: dict, part_dir: Path) -> pd.DataFrame:
+    df = pd.concat(
+        (pd.read_pickle(p) for p in sorted(part_dir.glob("*.pkl"))),
+        ignore_index=True,
+    )
+
+    sort_keys = ["SYMBOL"] + [c for c in spec["sort"] if c != "SYMBOL"]
+
+    return (
+        df.sort_values(sort_keys + [SEQ_COL], kind="mergesort")
+        .drop_duplicates(subset=spec["dedup"], keep="last")
+        .drop(columns=SEQ_COL)
+        .reset_index(drop=True)
+    )
+
+
+def write_symbols(spec: dict, df: pd.DataFrame, out_dir: Path, cut: int, digests: dict) -> int:
+    written = 0
+
+    for symbol, g in df.groupby("SYMBOL", sort=False):
+        csv_out = out_dir / f"{symbol}.csv"
+
+        # same policy as the appender: no silent creation
+        if not spec["create_new"] and not csv_out.exists():
+            continue
+
+        if spec["tiered"]:
+            g, cold = tiers.split(g, cut)
+            tiers.archive(cold, out_dir, symbol, replace=True)
+
+        written += write_if_changed(
+            g.reset_index(drop=True), csv_out, digests,
+            parquet_path=out_dir / f"{symbol}.parquet" if spec["parquet"] else None,
+            zone_cols=spec["zones"],
+        )
+
+    return written
+
+
+def rebuild(name: str, buckets: int, keep_spill: bool) -> None:
+    spec = MASTERS[name]
+
+    for in_dir, pattern, out_dir in spec["sources"]:
+        print(f"\n Rebuilding {name.upper()} → {out_dir}")
+
+        out_dir.mkdir(parents=True, exist_ok=True)
+
+        spill = SPILL_ROOT / name / out_dir.name
+        if spill.exists():
+            shutil.rmtree(spill)
+
+        n_buckets = 1 if spec["single"] else buckets
+
+        rows, last = scan(name, spec, in_dir, pattern, spill, n_buckets)
+        print(f"  Rows scanned : {rows}")
+
+        if not rows:
+            continue
+
+        written = 0
+        kept = 0
+        digests = load_digests(out_dir)
+
+        for part_dir in sorted(spill.glob("b*")):
+            merged = merge_bucket(spec, part_dir)
+            kept += len(merged)
+
+            if spec["single"]:
+                written += write_if_changed(merged, out_dir / spec["single"], digests)
+            else:
+                written += write_symbols(spec, merged, out_dir, tiers.cutoff(last), digests)
+
+        save_digests(out_dir, digests)
+        cdc.snapshot(name, f"bulk rebuild of {out_dir.name}")
+
+        if not keep_spill:
+            shutil.rmtree(spill)
+
+        print(f"  Rows kept    : {kept}")
+        print(f"  Files written: {written}")
+
+# ==================================================
+# MAIN
+# ==================================================
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Single-pass master rebuild")
+    parser.add_argument(
+        "--dataset",
+        choices=sorted(MASTERS) + ["all"],
+        required=True,
+    )
+    parser.add_argument(
+        "--buckets",
+        type=int,
+        default=16,
+        help="symbol-hash buckets (more buckets → lower peak memory)",
+    )
+    parser.add_argument(
+        "--keep-spill",
+        action="store_true",
+        help="keep bucket spill files for inspection",
+    )
+    args = parser.parse_args()
+
+    names = sorted(MASTERS) if args.dataset == "all" else [args.dataset]
+
+    print("\n MarketForge | BULK MASTER REBUILD")
+    print(f" Datasets : {', '.join(names)}")
+    print(f" Buckets  : {args.buckets}")
+
+    for name in names:
+        rebuild(name, args.buckets, args.keep_spill)
+
+    print("\n MASTER REBUILD COMPLETED")
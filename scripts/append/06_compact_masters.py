@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+MarketForge | MASTER COMPACTION (QUIET-WINDOW MAINTENANCE)
+
+✔ Finds per-symbol master files that drifted from their clean form:
+    written outside write_if_changed (rebuild, migration, manual edits,
+    interrupted runs), out of key order, duplicate keys, stale / missing
+    Parquet twin, tiered options rows whose expiry month went cold
+✔ Files last written by an appender (digest stat matches) are clean by
+  construction → skipped WITHOUT being read
+✔ Rewrite = global sort + dedup on the MASTERS keys (later row wins),
+  fresh Parquet twin (column statistics rebuilt), fresh zone map
+  (marketforge/zones.py), fresh digest
+✔ Clean file with a missing / stale zone map → only the map is rebuilt
+✔ Safe next to readers: temp file + os.replace (io.atomic_*); a file
+  that changes while it is being compacted is left for the next run
+✔ --window 22:00-06:00 → exits at once outside the quiet window;
+  --budget stops starting new files after N seconds
+
+Usage:
+    python 06_compact_masters.py                        # all masters
+    python 06_compact_masters.py --dataset options --dry-run
+    python 06_compact_masters.py --window 22:00-06:00 --budget 1800
+"""
+
+from pathlib import Path
+from datetime import datetime, time as dtime
+import argparse
+import sys
+import time
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from marketforge.masters import MASTERS, last_date  # noqa: E402
+from marketforge.io import (  # noqa: E402
+    atomic_to_csv, atomic_to_parquet, frame_digest, load_digests, save_digests,
+)
+from marketforge import dates, tiers, zones  # noqa: E402
+
+# ==================================================
+# WHAT NEEDS COMPACTING
+# ==================================================
+def _stat(path: Path) -> list:
+    st = path.stat()
+    return [st.st_size, st.st_mtime_ns]
+
+
+def twin_stale(spec: dict, csv_path: Path) -> bool:
+    if not spec["parquet"]:
+        return False
+    twin = csv_path.with_suffix(".parquet")
+    return not twin.exists() or twin.stat().st_mtime_ns < csv_path.stat().st_mtime_ns
+
+
+def suspect(spec: dict, csv_path: Path, digests: dict) -> bool:
+    """False only when the last write provably came from write_if_changed."""
+    entry = digests.get(csv_path.name)
+    return (
+        entry is None
+        or entry["stat"] != _stat(csv_path)
+        or twin_stale(spec, csv_path)
+        or (spec["zones"] is not None and not zones.fresh(csv_path))
+    )
+
+
+def compacted(spec: dict, df: pd.DataFrame) -> pd.DataFrame:
+    sort_keys = [c for c in spec["sort"] if c in df.columns]
+    return (
+        df.sort_values(sort_keys, kind="mergesort")
+        .drop_duplicates(subset=[c for c in spec["dedup"] if c in df.columns], keep="last")
+        .reset_index(drop=True)
+    )
+
+# ==================================================
+# ONE FILE
+# ==================================================
+def compact_file(spec: dict, csv_path: Path, digests: dict, cut: int | None, dry_run: bool) -> str:
+    """'clean' | 'compacted' | 'changed' (touched meanwhile → next run)."""
+    before = _stat(csv_path)
+    df = pd.read_csv(csv_path, low_memory=False)
+
+    out = compacted(spec, df)
+    if cut is not None:
+        out, gone = tiers.drop_archived(out, csv_path.parent, csv_path.stem)
+        out, cold = tiers.split(out, cut)
+    else:
+        gone, cold = 0, out.iloc[:0]
+
+    dirty = len(out) != len(df) or not out.equals(df.reset_index(drop=True))
+
+    if not dirty and not twin_stale(spec, csv_path):
+        if not dry_run:
+            if spec["zones"] and not zones.fresh(csv_path):
+                zones.build(csv_path, out, spec["zones"])
+            digests[csv_path.name] = {"digest": frame_digest(out), "stat": before}
+        return "clean"
+
+    if dry_run:
+        return "compacted"
+
+    if not cold.empty:
+        tiers.archive(cold, csv_path.parent, csv_path.stem)
+
+    # an appender rewrote it while we worked → its version wins
+    if _stat(csv_path) != before:
+        return "changed"
+
+    if dirty:
+        atomic_to_csv(out, csv_path)
+    if spec["parquet"]:
+        atomic_to_parquet(out, csv_path.with_suffix(".parquet"))
+    if spec["zones"]:
+        zones.build(csv_path, out, spec["zones"])
+
+    digests[csv_path.name] = {"digest": frame_digest(out), "stat": _stat(csv_path)}
+    return "compacted"
+
+# ==================================================
+# ONE MASTER
+# ==================================================
+def compact(name: str, deadline: float, dry_run: bool) -> dict:
+    spec = MASTERS[name]
+    counts = {"checked": 0, "clean": 0, "compacted": 0, "changed": 0, "skipped": 0}
+
+    cut = None
+    if spec["tiered"]:
+        last = last_date(name)
+        cut = tiers.cutoff(dates.of(last)) if last else None
+
+    for _, _, out_dir in spec["sources"]:
+        if not out_dir.exists():
+            continue
+
+        files = [out_dir / spec["single"]] if spec["single"] else sorted(out_dir.glob("*.csv"))
+        digests = load_digests(out_dir)
+
+        for f in files:
+            if not f.exists():
+                continue
+            if time.monotonic() > deadline:
+                counts["skipped"] += 1
+                continue
+
+            counts["checked"] += 1
+            if not suspect(spec, f, digests):
+                counts["clean"] += 1
+                continue
+
+            status = compact_file(spec, f, digests, cut, dry_run)
+            counts[status] += 1
+            if status != "clean":
+                print(f"  {status:<9} {f.relative_to(out_dir.parent)}")
+
+        if not dry_run:
+            save_digests(out_dir, digests)
+
+    return counts
+
+
+def in_window(window: str | None, now: datetime) -> bool:
+    if not window:
+        return True
+    start, end = (dtime.fromisoformat(t) for t in window.split("-"))
+    t = now.time()
+    return start <= t < end if start <= end else (t >= start or t < end)
+
+# ==================================================
+# MAIN
+# ==================================================
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compact drifted master files")
+    parser.add_argument("--dataset", nargs="+", choices=sorted(MASTERS), default=sorted(MASTERS))
+    parser.add_argument("--window", help="quiet window HH:MM-HH:MM (may wrap midnight)")
+    parser.add_argument("--budget", type=float, default=None, help="seconds before no new file is started")
+    parser.add_argument("--dry-run", action="store_true", help="report what would be rewritten")
+    args = parser.parse_args()
+
+    print("=====================================")
+    print(" MarketForge | MASTER COMPACTION")
+    print(f" Datasets : {', '.join(args.dataset)}")
+    print("=====================================")
+
+    if not in_window(args.window, datetime.now()):
+        print(f" Outside quiet window {args.window} — nothing done")
+        sys.exit(0)
+
+    t0 = time.monotonic()
+    deadline = t0 + args.budget if args.budget else float("inf")
+
+    for name in args.dataset:
+        print(f"\n {name.upper()}")
+        c = compact(name, deadline, args.dry_run)
+        print(
+            f" {name:<8} checked {c['checked']} | clean {c['clean']} | "
+            f"{'would compact' if args.dry_run else 'compacted'} {c['compacted']} | "
+            f"busy {c['changed']} | out of budget {c['skipped']}"
+        )
+
+    print(f"\n MASTER COMPACTION COMPLETED in {time.monotonic() - t0:.1f}s")
@@ -0,0 +1,546 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+MarketForge | SYNTHETIC NSE DATA GENERATOR (BENCHMARK)
+
+✔ Deterministic: same seed + scale → byte-identical files
+✔ FO ZIP   : foDDMMYYYY.zip → foDDMMYYYY.csv + opDDMMYYYY.csv
+✔ CM ZIP   : BhavCopy_NSE_CM_0_0_0_YYYYMMDD_F_0000.csv.zip
+✔ MTO      : MTO_DDMMYYYY.DAT (record type 20 rows)
+✔ Indices  : allIndices JSON + indices_ohlc_eod CSV (as the downloader saves it)
+✔ OLD / NEW NSE column layouts, or MIXED (switch half-way, like NSE 2024)
+✔ Option premiums priced off the futures (Black-76 + smile) → IVs solvable
+✔ Files land in <out>/data/raw/... exactly where the downloaders put them
+✔ Offline, laptop friendly
+
+Usage:
+    python generate_nse_data.py --out D:\\bench --scale medium
+    python generate_nse_data.py --out /tmp/mf --stocks 50 --strikes 15 --days 10 --layout mixed
+"""
+
+from pathlib import Path
+from datetime import date, datetime, timedelta
+import argparse
+import calendar
+import io
+import json
+import os
+import sys
+import zipfile
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from marketforge.greeks import price  # noqa: E402
+
+# ==================================================
+# SCALES
+# ==================================================
+SCALES = {
+    "tiny":   {"stocks": 5,   "strikes": 5,  "days": 3},
+    "small":  {"stocks": 25,  "strikes": 10, "days": 5},
+    "medium": {"stocks": 100, "strikes": 20, "days": 20},
+    "large":  {"stocks": 200, "strikes": 40, "days": 60},
+}
+
+LAYOUTS = ("old", "new", "mixed")
+
+# ==================================================
+# MARKET MODEL
+# ==================================================
+RISK_FREE_RATE = 0.065
+TICK = 0.05
+
+# symbol → (spot, strike step, ATM vol, index name in allIndices)
+INDEX_UNDERLYINGS = {
+    "NIFTY":     (22000.0, 50,  0.13, "NIFTY 50"),
+    "BANKNIFTY": (48000.0, 100, 0.16, "NIFTY BANK"),
+    "FINNIFTY":  (21000.0, 50,  0.15, "NIFTY FIN SERVICE"),
+}
+
+# allIndices-only rows (no derivatives)
+OTHER_INDICES = {
+    "NIFTY NEXT 50": 60000.0,
+    "INDIA VIX": 14.0,
+    "NIFTY IT": 36000.0,
+    "NIFTY AUTO": 21000.0,
+    "NIFTY PHARMA": 19000.0,
+    "NIFTY FMCG": 55000.0,
+    "NIFTY METAL": 8500.0,
+    "NIFTY REALTY": 900.0,
+}
+
+STOCK_EXPIRIES = 3          # monthly
+INDEX_WEEKLIES = 2
+INDEX_MONTHLIES = 3
+
+# ==================================================
+# COLUMN LAYOUTS
+# ==================================================
+CM_NEW_COLS = [
+    "TradDt", "BizDt", "Sgmt", "Src", "FinInstrmTp", "FinInstrmId", "ISIN",
+    "TckrSymb", "SctySrs", "XpryDt", "FininstrmActlXpryDt", "StrkPric",
+    "OptnTp", "FinInstrmNm", "OpnPric", "HghPric", "LwPric", "ClsPric",
+    "LastPric", "PrvsClsgPric", "UndrlygPric", "SttlmPric", "OpnIntrst",
+    "ChngInOpnIntrst", "TtlTradgVol", "TtlTrfVal", "TtlNbOfTxsExctd",
+    "SsnId", "NewBrdLotQty", "Rmks", "Rsvd1", "Rsvd2", "Rsvd3", "Rsvd4",
+]
+
+CM_OLD_COLS = [
+    "SYMBOL", "SERIES", "OPEN", "HIGH", "LOW", "CLOSE", "LAST", "PREVCLOSE",
+    "TOTTRDQTY", "TOTTRDVAL", "TIMESTAMP", "TOTALTRADES", "ISIN",
+]
+
+FUT_OLD_COLS = [
+    "INSTRUMENT", "SYMBOL", "EXP_DATE", "OPEN_PRICE", "HI_PRICE", "LO_PRICE",
+    "CLOSE_PRICE", "OPEN_INT*", "TRD_QTY", "NO_OF_CONT", "NO_OF_TRADE", "TRD_VAL",
+]
+
+FUT_NEW_COLS = [
+    "FININSTRMTP", "SYMBOL", "EXP_DATE", "OPNPRIC", "HGHPRIC", "LWPRIC",
+    "CLSPRIC", "OPNINTRST", "CHNGINOPNINTRST", "TTLTRADGVOL", "NOOFCONTRACTS",
+    "TTLNBOFTXSEXCTD", "TTLTRFVAL",
+]
+
+OPT_OLD_COLS = [
+    "INSTRUMENT", "SYMBOL", "EXP_DATE", "STR_PRICE", "OPT_TYPE", "OPEN_PRICE",
+    "HI_PRICE", "LO_PRICE", "CLOSE_PRICE", "OPEN_INT*", "TRD_QTY", "NO_OF_CONT",
+    "NO_OF_TRADE", "NOTION_VAL", "PR_VAL",
+]
+
+OPT_NEW_COLS = [
+    "FIN_INSTRM_TP", "SYMBOL", "EXP_DATE", "STRK_PRICE", "OPT_TYPE", "OPEN_PRICE",
+    "HI_PRICE", "LO_PRICE", "CLOSE_PRICE", "OPEN_INT", "TRD_QTY", "NO_OF_CONT",
+    "NO_OF_TRADE", "NOTION_VAL", "PR_VAL",
+]
+
+# ==================================================
+# CALENDAR
+# ==================================================
+def trading_days(start: date, n: int) -> list:
+    days, d = [], start
+    while len(days) < n:
+        if d.weekday() < 5:
+            days.append(d)
+        d += timedelta(days=1)
+    return days
+
+
+def last_thursday(year: int, month: int) -> date:
+    d = date(year, month, calendar.monthrange(year, month)[1])
+    while d.weekday() != 3:
+        d -= timedelta(days=1)
+    return d
+
+
+def monthly_expiries(d: date, n: int) -> list:
+    out, y, m = [], d.year, d.month
+    while len(out) < n:
+        e = last_thursday(y, m)
+        if e >= d:
+            out.append(e)
+        y, m = (y + 1, 1) if m == 12 else (y, m + 1)
+    return out
+
+
+def weekly_expiries(d: date, n: int) -> list:
+    first = d + timedelta(days=(3 - d.weekday()) % 7)
+    return [first + timedelta(weeks=i) for i in range(n)]
+
+# ==================================================
+# UNIVERSE + PRICE PATHS
+# ==================================================
+def build_universe(rng: np.random.Generator, n_stocks: int) -> pd.DataFrame:
+    stocks = pd.DataFrame({
+        "SYMBOL": [f"STK{i:04d}" for i in range(n_stocks)],
+        "SPOT": np.round(np.exp(rng.normal(np.log(800), 0.9, n_stocks)), 2).clip(20, 40000),
+        "VOL": rng.uniform(0.20, 0.50, n_stocks),
+        "IS_INDEX": False,
+        "STEP": 0,
+        "INDEX_NAME": "",
+    })
+    stocks["ISIN"] = [f"INE{i:06d}01{i % 10}" for i in range(n_stocks)]
+    stocks["LOT"] = (25_00_000 / stocks["SPOT"]).round(-1).clip(10, None).astype("int64")
+
+    # NSE-style strike steps: 1 / 2.5→5 / 10 / 20 / 50 ... ~1% of spot
+    raw = stocks["SPOT"] * 0.01
+    mag = 10 ** np.floor(np.log10(raw))
+    stocks["STEP"] = np.maximum(
+        np.where(raw / mag <= 2, 2, np.where(raw / mag <= 5, 5, 10)) * mag, 1
+    ).astype("int64")
+
+    index = pd.DataFrame([
+        {
+            "SYMBOL": s, "SPOT": spot, "VOL": vol, "IS_INDEX": True,
+            "STEP": step, "INDEX_NAME": name, "ISIN": "", "LOT": 25,
+        }
+        for s, (spot, step, vol, name) in INDEX_UNDERLYINGS.items()
+    ])
+
+    return pd.concat([stocks, index], ignore_index=True)
+
+
+def price_paths(rng: np.random.Generator, uni: pd.DataFrame, n_days: int) -> np.ndarray:
+    """(days, symbols) closes — GBM with each symbol's own vol."""
+    dt = 1 / 252
+    vol = uni["VOL"].to_numpy()
+    z = rng.standard_normal((n_days, len(uni)))
+    steps = np.exp((-0.5 * vol ** 2) * dt + vol * np.sqrt(dt) * z)
+    steps[0] = 1.0
+    return uni["SPOT"].to_numpy() * np.cumprod(steps, axis=0)
+
+
+def ohlc(rng: np.random.Generator, prev: np.ndarray, close: np.ndarray) -> tuple:
+    o = prev * np.exp(rng.normal(0, 0.004, len(close)))
+    hi = np.maximum(o, close) * (1 + np.abs(rng.normal(0, 0.006, len(close))))
+    lo = np.minimum(o, close) * (1 - np.abs(rng.normal(0, 0.006, len(close))))
+    return o, hi, lo
+
+
+def ticks(x) -> np.ndarray:
+    return np.maximum(np.round(np.asarray(x) / TICK) * TICK, TICK).round(2)
+
+# ==================================================
+# DAY BUILDERS
+# ==================================================
+def cm_frame(rng, uni, d, close, prev, layout) -> pd.DataFrame:
+    st = uni[~uni["IS_INDEX"]]
+    n = len(st)
+    c, p = close[: n], prev[: n]
+    o, hi, lo = ohlc(rng, p, c)
+    qty = rng.integers(10_000, 5_000_000, n)
+    trades = np.maximum(qty // rng.integers(50, 400, n), 1)
+
+    df = pd.DataFrame({
+        "SYMBOL": st["SYMBOL"].to_numpy(),
+        "SERIES": "EQ",
+        "OPEN": o.round(2), "HIGH": hi.round(2), "LOW": lo.round(2),
+        "CLOSE": c.round(2), "LAST": (c * (1 + rng.normal(0, 0.0005, n))).round(2),
+        "PREVCLOSE": p.round(2),
+        "TOTTRDQTY": qty, "TOTTRDVAL": (qty * c).round(2), "TOTALTRADES": trades,
+        "ISIN": st["ISIN"].to_numpy(),
+    })
+
+    # a few non-EQ series rows, as in the real file
+    extra = df.iloc[::25].copy()
+    extra["SERIES"] = "BE"
+    df = pd.concat([df, extra], ignore_index=True).sort_values(["SYMBOL", "SERIES"])
+
+    if layout == "old":
+        df["TIMESTAMP"] = d.strftime("%d-%b-%Y").upper()
+        return df[CM_OLD_COLS]
+
+    iso = d.isoformat()
+    new = pd.DataFrame({
+        "TradDt": iso, "BizDt": iso, "Sgmt": "CM", "Src": "NSE",
+        "FinInstrmTp": "STK", "FinInstrmId": np.arange(len(df)) + 1000,
+        "ISIN": df["ISIN"].to_numpy(), "TckrSymb": df["SYMBOL"].to_numpy(),
+        "SctySrs": df["SERIES"].to_numpy(),
+        "XpryDt": "", "FininstrmActlXpryDt": "", "StrkPric": "", "OptnTp": "",
+        "FinInstrmNm": df["SYMBOL"].to_numpy() + " LTD",
+        "OpnPric": df["OPEN"].to_numpy(), "HghPric": df["HIGH"].to_numpy(),
+        "LwPric": df["LOW"].to_numpy(), "ClsPric": df["CLOSE"].to_numpy(),
+        "LastPric": df["LAST"].to_numpy(), "PrvsClsgPric": df["PREVCLOSE"].to_numpy(),
+        "UndrlygPric": "", "SttlmPric": df["CLOSE"].to_numpy(),
+        "OpnIntrst": "", "ChngInOpnIntrst": "",
+        "TtlTradgVol": df["TOTTRDQTY"].to_numpy(), "TtlTrfVal": df["TOTTRDVAL"].to_numpy(),
+        "TtlNbOfTxsExctd": df["TOTALTRADES"].to_numpy(),
+        "SsnId": "F1", "NewBrdLotQty": 1, "Rmks": "",
+        "Rsvd1": "", "Rsvd2": "", "Rsvd3": "", "Rsvd4": "",
+    })
+    return new[CM_NEW_COLS]
+
+
+def mto_lines(rng, cm: pd.DataFrame, d: date) -> list:
+    sym = cm["SYMBOL"] if "SYMBOL" in cm.columns else cm["TckrSymb"]
+    ser = cm["SERIES"] if "SERIES" in cm.columns else cm["SctySrs"]
+    qty = cm["TOTTRDQTY"] if "TOTTRDQTY" in cm.columns else cm["TtlTradgVol"]
+
+    dq = (qty.to_numpy() * rng.uniform(0.15, 0.85, len(cm))).astype("int64")
+    pct = np.round(dq / qty.to_numpy() * 100, 2)
+
+    lines = [
+        "Security Wise Delivery Position - Compulsory Rolling Settlement",
+        f"10,MTO,{d:%d%m%Y},{rng.integers(100000, 999999)},{len(cm):07d}",
+        f"Trade Date <{d:%d-%b-%Y}>,Settlement Type <N>,Settlement No <{d:%Y}{d.timetuple().tm_yday:03d}>",
+        "Record Type,Sr No,Name of Security,Type,Quantity Traded,"
+        "Deliverable Quantity(gross across client level),"
+        "% of Deliverable Quantity to Traded Quantity",
+    ]
+    lines += [
+        f"20,{i + 1},{s},{t},{q},{x},{p:.2f}"
+        for i, (s, t, q, x, p) in enumerate(zip(sym, ser, qty, dq, pct))
+    ]
+    return lines
+
+
+def fo_frames(rng, uni, d, close, layout, n_strikes) -> tuple:
+    fut_rows, opt_parts = [], []
+
+    for i, u in enumerate(uni.itertuples(index=False)):
+        spot = close[i]
+        if u.IS_INDEX:
+            expiries = sorted(set(weekly_expiries(d, INDEX_WEEKLIES) + monthly_expiries(d, INDEX_MONTHLIES)))
+            fut_exp = monthly_expiries(d, INDEX_MONTHLIES)
+            instr = "IDX"
+        else:
+            expiries = fut_exp = monthly_expiries(d, STOCK_EXPIRIES)
+            instr = "STK"
+
+        # ---------- FUTURES ----------
+        for e in fut_exp:
+            t = max((e - d).days, 1) / 365
+            f = spot * np.exp(RISK_FREE_RATE * t)
+            fut_rows.append((f"FUT{instr}", u.SYMBOL, e, f, u.LOT))
+
+        # ---------- OPTIONS: expiries × strikes × CE/PE ----------
+        atm = round(spot / u.STEP) * u.STEP
+        strikes = atm + u.STEP * np.arange(-n_strikes, n_strikes + 1)
+        strikes = strikes[strikes > 0]
+
+        e = np.repeat(expiries, len(strikes) * 2)
+        k = np.tile(np.repeat(strikes, 2), len(expiries))
+        is_call = np.tile([True, False], len(strikes) * len(expiries))
+        t = np.array([max((x - d).days, 1) / 365 for x in e])
+        f = spot * np.exp(RISK_FREE_RATE * t)
+
+        m = np.log(k / f)
+        vol = u.VOL * (1 + 2.0 * m * m) * np.exp(rng.normal(0, 0.02, len(k)))
+        prem = ticks(price(f, k, t, RISK_FREE_RATE, 0.0, vol, is_call))
+
+        oi_lots = rng.poisson(2000 * np.exp(-(m * m) / 0.004) + 5)
+        vol_lots = rng.poisson(oi_lots * 0.8 + 1)
+
+        opt_parts.append(pd.DataFrame({
+            "INSTRUMENT": f"OPT{instr}", "SYMBOL": u.SYMBOL, "EXP_DATE": e,
+            "STRIKE_PRICE": k.astype("int64"),
+            "OPT_TYPE": np.where(is_call, "CE", "PE"),
+            "CLOSE_PRICE": prem, "LOT": u.LOT,
+            "OI_LOTS": oi_lots, "VOL_LOTS": vol_lots,
+        }))
+
+    # ---------- FUTURES FRAME ----------
+    fut = pd.DataFrame(fut_rows, columns=["INSTRUMENT", "SYMBOL", "EXP_DATE", "CLOSE_PRICE", "LOT"])
+    o, hi, lo = ohlc(rng, fut["CLOSE_PRICE"].to_numpy(), fut["CLOSE_PRICE"].to_numpy())
+    cont = rng.integers(100, 50_000, len(fut))
+    qty = cont * fut["LOT"].to_numpy()
+    oi = qty * rng.integers(2, 6, len(fut))
+
+    fut = fut.assign(
+        OPEN_PRICE=ticks(o), HI_PRICE=ticks(hi), LO_PRICE=ticks(lo),
+        CLOSE_PRICE=ticks(fut["CLOSE_PRICE"]),
+        OPEN_INT=oi, CHG_IN_OI=(oi * rng.normal(0, 0.05, len(fut))).astype("int64"),
+        TRD_QTY=qty, NO_OF_CONT=cont, NO_OF_TRADE=np.maximum(cont // 3, 1),
+    )
+    fut["TRD_VAL"] = (fut["TRD_QTY"] * fut["CLOSE_PRICE"] / 1e5).round(2)   # ₹ lakh
+
+    # ---------- OPTIONS FRAME ----------
+    opt = pd.concat(opt_parts, ignore_index=True)
+    c = opt["CLOSE_PRICE"].to_numpy()
+    o = ticks(c * np.exp(rng.normal(0, 0.08, len(c))))
+    opt = opt.assign(
+        OPEN_PRICE=o,
+        HI_PRICE=np.maximum(o, c) + ticks(c * np.abs(rng.normal(0, 0.05, len(c)))),
+        LO_PRICE=np.maximum(np.minimum(o, c) - ticks(c * np.abs(rng.normal(0, 0.05, len(c)))), TICK),
+        OPEN_INT=opt["OI_LOTS"] * opt["LOT"],
+        TRD_QTY=opt["VOL_LOTS"] * opt["LOT"],
+        NO_OF_CONT=opt["VOL_LOTS"],
+        NO_OF_TRADE=np.maximum(opt["VOL_LOTS"] // 2, 0),
+    )
+    opt["NOTION_VAL"] = (opt["TRD_QTY"] * opt["STRIKE_PRICE"]).astype("int64")
+    opt["PR_VAL"] = (opt["TRD_QTY"] * c / 1e5).round(2)
+    opt["HI_PRICE"] = opt["HI_PRICE"].round(2)
+    opt["LO_PRICE"] = opt["LO_PRICE"].round(2)
+
+    # ---------- LAYOUT ----------
+    if layout == "old":
+        exp = lambda s: pd.to_datetime(s).dt.strftime("%d/%m/%Y")
+        fut = fut.rename(columns={"OPEN_INT": "OPEN_INT*"}).assign(EXP_DATE=lambda x: exp(x["EXP_DATE"]))
+        opt = opt.rename(columns={"OPEN_INT": "OPEN_INT*", "STRIKE_PRICE": "STR_PRICE"})
+        opt = opt.assign(EXP_DATE=exp(opt["EXP_DATE"]))
+        return fut[FUT_OLD_COLS], opt[OPT_OLD_COLS]
+
+    iso = lambda s: pd.to_datetime(s).dt.strftime("%Y-%m-%d")
+    fut = fut.rename(columns={
+        "INSTRUMENT": "FININSTRMTP", "OPEN_PRICE": "OPNPRIC", "HI_PRICE": "HGHPRIC",
+        "LO_PRICE": "LWPRIC", "CLOSE_PRICE": "CLSPRIC", "OPEN_INT": "OPNINTRST",
+        "CHG_IN_OI": "CHNGINOPNINTRST", "TRD_QTY": "TTLTRADGVOL",
+        "NO_OF_CONT": "NOOFCONTRACTS", "NO_OF_TRADE": "TTLNBOFTXSEXCTD", "TRD_VAL": "TTLTRFVAL",
+    }).assign(EXP_DATE=lambda x: iso(x["EXP_DATE"]))
+    opt = opt.rename(columns={"INSTRUMENT": "FIN_INSTRM_TP", "STRIKE_PRICE": "STRK_PRICE"})
+    opt = opt.assign(EXP_DATE=iso(opt["EXP_DATE"]))
+    return fut[FUT_NEW_COLS], opt[OPT_NEW_COLS]
+
+
+def indices_payload(rng, uni, d, close, prev) -> dict:
+    rows = []
+    idx = uni[uni["IS_INDEX"]]
+    levels = {
+        r.INDEX_NAME: (close[i], prev[i])
+        for i, r in zip(idx.index, idx.itertuples(index=False))
+    }
+    for name, base in OTHER_INDICES.items():
+        drift = np.exp(rng.normal(0, 0.01))
+        levels[name] = (base * drift, base)
+
+    for name, (c, p) in levels.items():
+        o, hi, lo = (float(x[0]) for x in ohlc(rng, np.array([p]), np.array([c])))
+        rows.append({
+            "key": "BROAD MARKET INDICES" if name.startswith("NIFTY") else "VOLATILITY",
+            "index": name,
+            "indexSymbol": name,
+            "last": round(float(c), 2),
+            "variation": round(float(c - p), 2),
+            "percentChange": round(float((c / p - 1) * 100), 2),
+            "open": round(o, 2),
+            "high": round(hi, 2),
+            "low": round(lo, 2),
+            "previousClose": round(float(p), 2),
+        })
+
+    return {"data": rows, "timestamp": f"{d:%d-%b-%Y} 15:30:00"}
+
+
+def indices_eod_frame(payload: dict, d: date) -> pd.DataFrame:
+    """Same shape the index downloader writes after its renames."""
+    df = pd.DataFrame(payload["data"])
+    df.columns = df.columns.astype(str).str.strip().str.upper()
+    df = df.rename(columns={"INDEX": "INDEX_NAME", "PERCENTCHANGE": "PCT_CHANGE", "LAST": "CLOSE"})
+    df.insert(0, "TRADE_DATE", d)
+    return df[["TRADE_DATE", "INDEX_NAME", "OPEN", "HIGH", "LOW", "CLOSE", "PCT_CHANGE"]]
+
+# ==================================================
+# WRITERS (DETERMINISTIC)
+# ==================================================
+def csv_bytes(df: pd.DataFrame) -> bytes:
+    buf = io.StringIO()
+    df.to_csv(buf, index=False)
+    return buf.getvalue().encode()
+
+
+def write_zip(path: Path, members: dict, d: date) -> None:
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as z:
+        for name, data in members.items():
+            z.writestr(zipfile.ZipInfo(name, date_time=(d.year, d.month, d.day, 18, 0, 0)), data)
+
+
+def stamp(path: Path, d: date) -> None:
+    """mtime = trade day 18:00 so 'latest file' pickers see trade order."""
+    ts = datetime(d.year, d.month, d.day, 18, 0).timestamp()
+    os.utime(path, (ts, ts))
+
+# ==================================================
+# MAIN GENERATOR
+# ==================================================
+def generate(out: Path, stocks: int, strikes: int, days: int,
+             layout: str = "new", seed: int = 7, start: date = date(2024, 1, 1)) -> dict:
+    rng = np.random.default_rng(seed)
+    raw = out / "data" / "raw"
+    dirs = {k: raw / k for k in ("equity", "futures", "equityDat", "indices")}
+    for p in dirs.values():
+        p.mkdir(parents=True, exist_ok=True)
+
+    # appenders that refuse to create their master folder
+    (out / "data" / "master" / "EqiutyDat_master").mkdir(parents=True, exist_ok=True)
+
+    uni = build_universe(rng, stocks)
+    closes = price_paths(rng, uni, days + 1)
+    dates = trading_days(start, days)
+
+    stats = {"cm_rows": 0, "fut_rows": 0, "opt_rows": 0, "mto_rows": 0, "index_rows": 0, "bytes": 0}
+
+    for i, d in enumerate(dates):
+        day_layout = layout if layout != "mixed" else ("old" if i < days // 2 else "new")
+        prev, close = closes[i], closes[i + 1]
+        ddmmyyyy, yyyymmdd = f"{d:%d%m%Y}", f"{d:%Y%m%d}"
+
+        # ---------- CM ----------
+        cm = cm_frame(rng, uni, d, close, prev, day_layout)
+        name = f"BhavCopy_NSE_CM_0_0_0_{yyyymmdd}_F_0000.csv"
+        f = dirs["equity"] / f"{name}.zip"
+        write_zip(f, {name: csv_bytes(cm)}, d)
+        stamp(f, d)
+        stats["cm_rows"] += len(cm)
+        stats["bytes"] += f.stat().st_size
+
+        # ---------- MTO ----------
+        lines = mto_lines(rng, cm, d)
+        f = dirs["equityDat"] / f"MTO_{ddmmyyyy}.DAT"
+        f.write_bytes(("\r\n".join(lines) + "\r\n").encode())
+        stamp(f, d)
+        stats["mto_rows"] += len(lines) - 4
+        stats["bytes"] += f.stat().st_size
+
+        # ---------- FO ----------
+        fut, opt = fo_frames(rng, uni, d, close, day_layout, strikes)
+        f = dirs["futures"] / f"fo{ddmmyyyy}.zip"
+        write_zip(f, {f"fo{ddmmyyyy}.csv": csv_bytes(fut), f"op{ddmmyyyy}.csv": csv_bytes(opt)}, d)
+        stamp(f, d)
+        stats["fut_rows"] += len(fut)
+        stats["opt_rows"] += len(opt)
+        stats["bytes"] += f.stat().st_size
+
+        # ---------- INDICES ----------
+        payload = indices_payload(rng, uni, d, close, prev)
+        f = dirs["indices"] / f"allIndices_{yyyymmdd}.json"
+        f.write_text(json.dumps(payload), encoding="utf-8")
+        stamp(f, d)
+
+        eod = indices_eod_frame(payload, d)
+        f = dirs["indices"] / f"indices_ohlc_eod_{yyyymmdd}.csv"
+        f.write_bytes(csv_bytes(eod))
+        stamp(f, d)
+        stats["index_rows"] += len(eod)
+        stats["bytes"] += f.stat().st_size
+
+    stats["days"] = days
+    stats["first"] = dates[0].isoformat()
+    stats["last"] = dates[-1].isoformat()
+    return stats
+
+
+def resolve_scale(args) -> dict:
+    scale = dict(SCALES[args.scale])
+    for k in ("stocks", "strikes", "days"):
+        if getattr(args, k) is not None:
+            scale[k] = getattr(args, k)
+    return scale
+
+
+def add_scale_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--scale", choices=SCALES, default="small")
+    parser.add_argument("--stocks", type=int)
+    parser.add_argument("--strikes", type=int, help="strikes each side of ATM")
+    parser.add_argument("--days", type=int)
+    parser.add_argument("--layout", choices=LAYOUTS, default="mixed")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--start", type=date.fromisoformat, default=date(2024, 1, 1))
+
+# ==================================================
+# MAIN
+# ==================================================
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate synthetic NSE raw files")
+    parser.add_argument("--out", type=Path, required=True, help="tree root (gets data/raw/...)")
+    add_scale_args(parser)
+    args = parser.parse_args()
+
+    scale = resolve_scale(args)
+
+    print("\n MarketForge | SYNTHETIC NSE DATA")
+    print(f" Out    : {args.out}")
+    print(f" Scale  : {scale} | Layout: {args.layout} | Seed: {args.seed}")
+
+    stats = generate(args.out, layout=args.layout, seed=args.seed, start=args.start, **scale)
+
+    print(f" Days   : {stats['days']} ({stats['first']} → {stats['last']})")
+    print(f" CM     : {stats['cm_rows']} rows")
+    print(f" MTO    : {stats['mto_rows']} rows")
+    print(f" FUT    : {stats['fut_rows']} rows")
+    print(f" OPT    : {stats['opt_rows']} rows")
+    print(f" INDEX  : {stats['index_rows']} rows")
+    print(f" Bytes  : {stats['bytes'] / 2**20:.1f} MB")
+    print(" SYNTHETIC DATA READY")
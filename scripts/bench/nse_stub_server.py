@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+MarketForge | LOCAL NSE allIndices STUB SERVER (OFFLINE TESTING)
+
+✔ Serves /api/allIndices in NSE's shape (plus the extra fields NSE sends
+  that the poller must ignore)
+✔ Every request = one random-walk tick of every index
+✔ HTTP/1.1 keep-alive → shows whether a client reuses its connection
+✔ `/` answers 200 + a cookie (poller warm-up path)
+✔ --fail-every N → every Nth API call returns 503 (error-path testing)
+✔ --archive DIR → serves archive files (fo*.zip, BhavCopy, MTO .DAT) by
+  file name from DIR, HEAD + Range supported; --publish-after S keeps
+  them 404 for S seconds (publication-window scheduler testing)
+✔ --eod → payload stamped today 15:30:00 (post-close snapshot)
+
+Usage:
+    python nse_stub_server.py --port 8765
+    python ../downloader/01_poll_indices_intraday.py \\
+        --url http://127.0.0.1:8765/api/allIndices --polls 20 --eod-now
+"""
+
+from pathlib import Path
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from generate_nse_data import INDEX_UNDERLYINGS, OTHER_INDICES  # noqa: E402
+
+# ==================================================
+# MARKET STATE (RANDOM WALK)
+# ==================================================
+class Market:
+    def __init__(self, seed: int, eod: bool = False):
+        self.rng = random.Random(seed)
+        self.eod = eod
+        self.lock = threading.Lock()
+        base = {name: spot for spot, _, _, name in INDEX_UNDERLYINGS.values()}
+        base.update(OTHER_INDICES)
+        self.prev = dict(base)
+        self.open = dict(base)
+        self.high = dict(base)
+        self.low = dict(base)
+        self.last = dict(base)
+
+    def tick(self) -> dict:
+        with self.lock:
+            rows = []
+            for name, p in self.last.items():
+                c = round(p * (1 + self.rng.gauss(0, 0.0005)), 2)
+                self.last[name] = c
+                self.high[name] = max(self.high[name], c)
+                self.low[name] = min(self.low[name], c)
+                prev = self.prev[name]
+                rows.append({
+                    "key": "BROAD MARKET INDICES" if name.startswith("NIFTY") else "VOLATILITY",
+                    "index": name,
+                    "indexSymbol": name,
+                    "last": c,
+                    "variation": round(c - prev, 2),
+                    "percentChange": round((c / prev - 1) * 100, 2),
+                    "open": self.open[name],
+                    "high": self.high[name],
+                    "low": self.low[name],
+                    "previousClose": prev,
+                    "yearHigh": round(prev * 1.2, 2),
+                    "yearLow": round(prev * 0.8, 2),
+                    "pe": "22.5",
+                    "pb": "3.9",
+                    "dy": "1.2",
+                    "declines": "12",
+                    "advances": "38",
+                    "unchanged": "0",
+                    "chart365dPath": f"https://example.invalid/{name}.svg",
+                })
+
+        stamp = f"{datetime.now():%d-%b-%Y} 15:30:00" if self.eod else f"{datetime.now():%d-%b-%Y %H:%M:%S}"
+        return {"data": rows, "timestamp": stamp}
+
+# ==================================================
+# HTTP
+# ==================================================
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"     # keep-alive
+    server_version = "NSEStub/1.0"
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def send_body(self, code: int, body: bytes, ctype: str, extra: dict = ()) -> None:
+        self.send_response(code)
+        self.send_header("Content-Type", ctype)
+        self.send_header("Content-Length", str(len(body)))
+        for k, v in dict(extra).items():
+            self.send_header(k, v)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def archive_file(self) -> Path | None:
+        if self.server.archive is None:
+            return None
+        if time.monotonic() - self.server.started < self.server.publish_after:
+            return None     # "not published yet"
+        name = self.path.rsplit("/", 1)[-1]
+        return next(self.server.archive.rglob(name), None) if name else None
+
+    def do_HEAD(self):
+        f = self.archive_file()
+        if f is None:
+            self.send_body(404, b"", "text/plain")
+            return
+        self.send_response(200)
+        self.send_header("Content-Length", str(f.stat().st_size))
+        self.end_headers()
+
+    def do_GET(self):
+        f = self.archive_file()
+        if f is not None:
+            body = f.read_bytes()
+            rng = self.headers.get("Range", "")
+            if rng.startswith("bytes="):
+                a, _, b = rng[6:].partition("-")
+                a, b = int(a), min(int(b or len(body) - 1), len(body) - 1)
+                self.send_body(206, body[a:b + 1], "application/octet-stream",
+                               {"Content-Range": f"bytes {a}-{b}/{len(body)}"})
+            else:
+                self.send_body(200, body, "application/octet-stream")
+            return
+
+        if self.path == "/":
+            self.send_body(200, b"ok", "text/plain", {"Set-Cookie": "nsit=stub; Path=/"})
+            return
+
+        if self.path.startswith("/api/allIndices"):
+            self.server.calls += 1
+            if self.server.fail_every and self.server.calls % self.server.fail_every == 0:
+                self.send_body(503, b"busy", "text/plain")
+                return
+            body = json.dumps(self.server.market.tick()).encode()
+            self.send_body(200, body, "application/json")
+            return
+
+        self.send_body(404, b"not found", "text/plain")
+
+    def log_message(self, fmt, *args):
+        pass
+
+
+def make_server(
+    port: int = 0,
+    seed: int = 7,
+    fail_every: int = 0,
+    archive: Path | None = None,
+    publish_after: float = 0.0,
+    eod: bool = False,
+) -> ThreadingHTTPServer:
+    """Server bound to 127.0.0.1:port (0 = any free port, see server.server_port)."""
+    srv = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+    srv.daemon_threads = True
+    srv.market = Market(seed, eod)
+    srv.connections = 0
+    srv.calls = 0
+    srv.fail_every = fail_every
+    srv.archive = archive
+    srv.publish_after = publish_after
+    srv.started = time.monotonic()
+    return srv
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local NSE allIndices stub")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--fail-every", type=int, default=0)
+    parser.add_argument("--archive", type=Path, help="folder with archive files to serve")
+    parser.add_argument("--publish-after", type=float, default=0.0, help="archive 404 for the first N seconds")
+    parser.add_argument("--eod", action="store_true", help="stamp payloads 15:30:00 today")
+    args = parser.parse_args()
+
+    srv = make_server(args.port, args.seed, args.fail_every, args.archive, args.publish_after, args.eod)
+    print(f" NSE stub on http://127.0.0.1:{srv.server_port}/api/allIndices (Ctrl+C to stop)")
+
+    try:
+        srv.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(f" Calls: {srv.calls} | TCP connections: {srv.connections}")
+        srv.server_close()
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+MarketForge | END-TO-END PERFORMANCE REGRESSION GATE (OFFLINE)
+
+✔ Fixed synthetic dataset (scale + seed + layout locked per baseline file)
+✔ download-stub (generator) → unzip → clean → append → analytics
+✔ Per stage: wall time, peak RSS, output bytes (median of --repeat runs)
+✔ Results stored keyed by git commit → logs/bench/baselines_<scale>.json
+✔ FAILS (exit 1) when any stage regresses past the threshold vs the baseline
+✔ No network, no real data touched (MARKETFORGE_ROOT → scratch dir)
+
+Usage:
+    python regression_gate.py                     # compare vs last other commit
+    python regression_gate.py --baseline a1b2c3d  # compare vs a specific commit
+    python regression_gate.py --threshold 0.15 --repeat 5
+"""
+
+from pathlib import Path
+from datetime import date, datetime
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+BENCH_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = BENCH_DIR.parents[1]
+
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(BENCH_DIR))
+
+from generate_nse_data import SCALES, generate  # noqa: E402
+
+# ==================================================
+# FIXED DATASET
+# ==================================================
+SEED = 20240101
+LAYOUT = "mixed"
+START = date(2024, 1, 1)
+
+METRICS = ("wall_s", "peak_rss", "bytes_out")
+
+# wall-time jitter below this is never a regression (process spawn noise)
+MIN_WALL_DELTA = 0.25      # seconds
+MIN_RSS_DELTA = 32 * 2**20  # bytes
+
+# ==================================================
+# ARGS
+# ==================================================
+parser = argparse.ArgumentParser(description="MarketForge E2E regression gate")
+parser.add_argument("--scale", choices=SCALES, default="small")
+parser.add_argument("--repeat", type=int, default=3)
+parser.add_argument("--threshold", type=float, default=0.25, help="allowed growth, 0.25 = +25%%")
+parser.add_argument("--baseline", default="auto", help="commit to compare against (auto = latest other commit)")
+parser.add_argument("--no-save", action="store_true", help="do not store this run")
+args = parser.parse_args()
+
+BASELINE_FILE = PROJECT_ROOT / "logs" / "bench" / f"baselines_{args.scale}.json"
+
+# ==================================================
+# GIT
+# ==================================================
+def git(*cmd) -> str:
+    try:
+        return subprocess.run(
+            ["git", *cmd], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+commit = git("rev-parse", "--short", "HEAD") or "unknown"
+dirty = bool(git("status", "--porcelain", "--untracked-files=no"))
+key = f"{commit}+dirty" if dirty else commit
+
+# ==================================================
+# SCRATCH ROOT (all stages resolve here)
+# ==================================================
+WORK = Path(tempfile.mkdtemp(prefix="marketforge_gate_"))
+os.environ["MARKETFORGE_ROOT"] = str(WORK)
+
+sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
+
+import run_pipeline as pipeline  # noqa: E402
+
+# ==================================================
+# ONE END-TO-END RUN
+# ==================================================
+def run_once() -> dict:
+    shutil.rmtree(WORK, ignore_errors=True)
+    WORK.mkdir(parents=True)
+
+    out = {}
+
+    # ---------- DOWNLOAD STUB ----------
+    t0 = time.perf_counter()
+    gen = generate(WORK, layout=LAYOUT, seed=SEED, start=START, **SCALES[args.scale])
+    out["download_stub"] = {
+        "wall_s": round(time.perf_counter() - t0, 3),
+        "peak_rss": None,
+        "bytes_out": gen["bytes"],
+    }
+
+    # ---------- PIPELINE ----------
+    for name in pipeline.topo_order(list(pipeline.STAGES)):
+        if pipeline.STAGES[name]["inputs"] is None:
+            continue
+
+        res = pipeline.run_stage(name, None)
+        if res["status"] != "ok":
+            raise RuntimeError(f" Stage {name} failed — see {res['log']}")
+
+        out[name] = {m: res[m] for m in METRICS}
+
+    return out
+
+
+def median_runs(runs: list) -> dict:
+    merged = {}
+    for stage in runs[0]:
+        merged[stage] = {}
+        for m in METRICS:
+            vals = [r[stage][m] for r in runs if r[stage][m] is not None]
+            merged[stage][m] = statistics.median(vals) if vals else None
+    return merged
+
+# ==================================================
+# COMPARE
+# ==================================================
+def regressions(current: dict, base: dict, threshold: float) -> list:
+    found = []
+    for stage, cur in current.items():
+        old = base.get(stage)
+        if old is None:
+            continue
+
+        for m in METRICS:
+            a, b = old.get(m), cur.get(m)
+            if not a or b is None:
+                continue
+
+            floor = {"wall_s": MIN_WALL_DELTA, "peak_rss": MIN_RSS_DELTA}.get(m, 0)
+            if b > a * (1 + threshold) and b - a > floor:
+                found.append((stage, m, a, b, b / a - 1))
+    return found
+
+
+def pick_baseline(store: dict) -> tuple:
+    if args.baseline != "auto":
+        rec = store.get(args.baseline)
+        if rec is None:
+            raise RuntimeError(f" No stored baseline for commit {args.baseline}")
+        return args.baseline, rec
+
+    others = [(k, r) for k, r in store.items() if k.split("+")[0] != commit]
+    if not others:
+        return None, None
+    return max(others, key=lambda kv: kv[1]["recorded"])
+
+# ==================================================
+# MAIN
+# ==================================================
+print("=====================================")
+print(" MarketForge | E2E REGRESSION GATE")
+print(f" Commit    : {key}")
+print(f" Dataset   : {args.scale} {SCALES[args.scale]} | seed {SEED} | {LAYOUT}")
+print(f" Repeat    : {args.repeat} | Threshold: +{args.threshold:.0%}")
+print("=====================================")
+
+runs = []
+try:
+    for i in range(args.repeat):
+        t0 = time.perf_counter()
+        runs.append(run_once())
+        print(f" Run {i + 1}/{args.repeat} done in {time.perf_counter() - t0:.1f}s")
+finally:
+    shutil.rmtree(WORK, ignore_errors=True)
+
+current = median_runs(runs)
+
+store = json.loads(BASELINE_FILE.read_text()) if BASELINE_FILE.exists() else {}
+base_key, base = pick_baseline(store)
+
+print(f"\n {'STAGE':<20}{'WALL s':>9}{'BASE s':>9}{'PEAK MB':>9}{'OUT MB':>9}")
+for stage, cur in current.items():
+    old = (base or {}).get("stages", {}).get(stage, {})
+    print(
+        f" {stage:<20}{cur['wall_s']:>9.2f}"
+        f"{old['wall_s'] if old.get('wall_s') is not None else float('nan'):>9.2f}"
+        f"{(cur['peak_rss'] or 0) / 2**20:>9.0f}"
+        f"{(cur['bytes_out'] or 0) / 2**20:>9.2f}"
+    )
+
+found = regressions(current, base["stages"], args.threshold) if base else []
+
+if not args.no_save:
+    store[key] = {
+        "recorded": datetime.now().isoformat(timespec="seconds"),
+        "host": os.uname().nodename if hasattr(os, "uname") else os.environ.get("COMPUTERNAME", ""),
+        "python": sys.version.split()[0],
+        "repeat": args.repeat,
+        "stages": current,
+    }
+    BASELINE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    BASELINE_FILE.write_text(json.dumps(store, indent=2, sort_keys=True))
+    print(f"\n Stored as  : {key} → {BASELINE_FILE}")
+
+if base is None:
+    print(" Baseline   : none yet — this run becomes the baseline")
+    sys.exit(0)
+
+print(f" Baseline   : {base_key} ({base['recorded']})")
+
+if found:
+    print("\n REGRESSIONS")
+    for stage, m, a, b, pct in found:
+        print(f"  {stage:<20} {m:<10} {a:>14.3f} → {b:>14.3f}  (+{pct:.0%})")
+    sys.exit(1)
+
+print(" NO REGRESSIONS — GATE PASSED")
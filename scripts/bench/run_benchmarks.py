@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+MarketForge | STAGE BENCHMARK RUNNER (OFFLINE)
+
+✔ Generates a synthetic NSE tree (generate_nse_data.py) in a scratch root
+✔ Points every stage at it via MARKETFORGE_ROOT (real data untouched)
+✔ Runs unzip → clean → append → analytics in DAG order (run_pipeline STAGES)
+✔ Downloaders excluded (network)
+✔ Per stage: wall time, input MB, output rows, rows/s, MB/s
+✔ Results → logs/bench/bench_<scale>_<ts>.json (real project root)
+
+Usage:
+    python run_benchmarks.py --scale small
+    python run_benchmarks.py --scale large --layout new --keep
+    python run_benchmarks.py --stocks 300 --strikes 30 --days 10 --stage clean_options append_options
+"""
+
+from pathlib import Path
+from datetime import datetime
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+BENCH_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = BENCH_DIR.parents[1]
+
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(BENCH_DIR))
+
+from generate_nse_data import add_scale_args, generate, resolve_scale  # noqa: E402
+
+# ==================================================
+# ARGS
+# ==================================================
+parser = argparse.ArgumentParser(description="MarketForge stage benchmarks")
+add_scale_args(parser)
+parser.add_argument("--workdir", type=Path, help="scratch root (default: temp dir)")
+parser.add_argument("--keep", action="store_true", help="keep the scratch tree")
+parser.add_argument("--stage", nargs="+", help="only these stages (+ their prerequisites)")
+args = parser.parse_args()
+
+scale = resolve_scale(args)
+
+work = args.workdir or Path(tempfile.mkdtemp(prefix="marketforge_bench_"))
+work.mkdir(parents=True, exist_ok=True)
+
+# every stage (and run_pipeline's paths) must resolve to the scratch root
+os.environ["MARKETFORGE_ROOT"] = str(work)
+
+sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
+
+import run_pipeline as pipeline  # noqa: E402
+
+# ==================================================
+# GENERATE
+# ==================================================
+print("=====================================")
+print(" MarketForge | STAGE BENCHMARKS")
+print(f" Scratch : {work}")
+print(f" Scale   : {scale} | Layout: {args.layout} | Seed: {args.seed}")
+print("=====================================")
+
+t0 = time.perf_counter()
+gen = generate(work, layout=args.layout, seed=args.seed, start=args.start, **scale)
+gen["wall_s"] = round(time.perf_counter() - t0, 3)
+
+print(
+    f" Generated {gen['days']} days | OPT {gen['opt_rows']} | FUT {gen['fut_rows']} "
+    f"| CM {gen['cm_rows']} | {gen['bytes'] / 2**20:.1f} MB in {gen['wall_s']:.1f}s\n"
+)
+
+# ==================================================
+# STAGE ORDER (DAG, NO DOWNLOADERS)
+# ==================================================
+wanted = args.stage or list(pipeline.STAGES)
+unknown = set(wanted) - set(pipeline.STAGES)
+if unknown:
+    raise RuntimeError(f" Unknown stages: {sorted(unknown)}")
+
+order = [n for n in pipeline.topo_order(wanted) if pipeline.STAGES[n]["inputs"] is not None]
+
+# ==================================================
+# RUN
+# ==================================================
+results = []
+failed = set()
+
+print(f" {'STAGE':<20}{'WALL s':>9}{'IN MB':>9}{'ROWS OUT':>11}{'ROWS/s':>11}{'MB/s':>8}")
+
+for name in order:
+    stage = pipeline.STAGES[name]
+
+    if any(d in failed for d in stage["after"]):
+        failed.add(name)
+        results.append({"stage": name, "status": "blocked"})
+        print(f" {name:<20}  BLOCKED")
+        continue
+
+    in_bytes = sum(size for size, _ in pipeline.snapshot(stage["inputs"]).values())
+    res = pipeline.run_stage(name, None)
+
+    wall = res["wall_s"] or 1e-9
+    res["bytes_in"] = in_bytes
+    res["rows_per_s"] = round(res["rows_out"] / wall, 1)
+    res["mb_per_s"] = round(in_bytes / 2**20 / wall, 2)
+    results.append(res)
+
+    if res["status"] != "ok":
+        failed.add(name)
+        print(f" {name:<20}  FAILED (see {res['log']})")
+        continue
+
+    print(
+        f" {name:<20}{res['wall_s']:>9.2f}{in_bytes / 2**20:>9.1f}"
+        f"{res['rows_out']:>11}{res['rows_per_s']:>11.0f}{res['mb_per_s']:>8.1f}"
+    )
+
+# ==================================================
+# RECORD
+# ==================================================
+out_dir = PROJECT_ROOT / "logs" / "bench"
+out_dir.mkdir(parents=True, exist_ok=True)
+
+out_file = out_dir / f"bench_{args.scale}_{datetime.now():%Y%m%d_%H%M%S}.json"
+out_file.write_text(json.dumps({
+    "started": datetime.now().isoformat(timespec="seconds"),
+    "scale": scale,
+    "layout": args.layout,
+    "seed": args.seed,
+    "generator": gen,
+    "stages": results,
+}, indent=2))
+
+print(f"\n Results : {out_file}")
+
+if not args.keep and args.workdir is None:
+    shutil.rmtree(work, ignore_errors=True)
+else:
+    print(f" Scratch kept: {work}")
+
+if failed:
+    print(f" FAILED / BLOCKED : {', '.join(sorted(failed))}")
+    sys.exit(1)
+
+print(" BENCHMARKS COMPLETED")
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+MarketForge | GAP DETECTION + MULTI-DAY CATCH-UP
+
+✔ Reads each master's last trade date (marketforge/masters.py last_date)
+    cm → equity | fo → futures + options | mto → mto | indices → indices
+✔ Missing sessions = weekdays after that date up to --until
+  (a 404 on a weekday = holiday / not published, reported, not an error)
+✔ Phase 1 — network: every missing (dataset, day) fetched CONCURRENTLY
+  through marketforge/net.py (shared limiter decides the real rate),
+  into a staging folder — the raw folders are not touched yet
+✔ Phase 2 — replay: day by day in DATE ORDER, that day's files are
+  released into data/raw/ and the same branch chains as watch mode run
+  (unzip → clean → append → derived), so "latest file" stages and the
+  masters see the days exactly as if they had arrived on time
+✔ Indices history from the NSE ind_close_all archive, converted to the
+  indices_ohlc_eod schema the cleaner expects
+✔ A day whose raw file already landed but never reached the masters
+  (unzip / clean / append failed) is replayed too, from the landed file
+✔ A throttled day halts its branch: that day and every later one stay
+  in staging (never appended past a hole) and are picked up, in order,
+  by the next run; a failed stage stops the whole replay
+
+Usage:
+    python catch_up.py                                   # all datasets
+    python catch_up.py --dataset fo mto --dry-run
+    python catch_up.py --since 2024-01-01 --until 2024-01-31
+    python catch_up.py --archives http://127.0.0.1:8765  # offline stub
+"""
+
+from pathlib import Path
+from datetime import date, timedelta
+import argparse
+import io
+import os
+import runpy
+import sys
+import time
+
+import pandas as pd
+
+SCRIPTS = Path(__file__).resolve().parent
+sys.path.insert(0, str(SCRIPTS))
+sys.path.insert(0, str(SCRIPTS.parent))
+
+import run_pipeline as pipeline  # noqa: E402
+import watch_pipeline as watch  # noqa: E402
+from marketforge.masters import last_date  # noqa: E402
+from marketforge import net  # noqa: E402
+
+STAGING = pipeline.DATA / "tmp" / "catch_up"
+
+# branch → masters whose last date bounds it (oldest wins)
+BRANCH_MASTERS = {
+    "cm": ["equity"],
+    "fo": ["futures", "options"],
+    "mto": ["mto"],
+    "indices": ["indices"],
+}
+
+MAX_DAYS = 60       # refuse larger gaps without --since (rebuild territory)
+
+# archive URL / landing file / validation: same table as the scheduler
+_sched = runpy.run_path(str(SCRIPTS / "downloader" / "00_schedule_downloads.py"), run_name="scheduler")
+WINDOWS = _sched["WINDOWS"]
+HEADERS = _sched["HEADERS"]
+ARCHIVES = _sched["ARCHIVES"]
+
+INDEX_ARCHIVE = "/content/indices/ind_close_all_{d:%d%m%Y}.csv"
+
+# ind_close_all column → indices_ohlc_eod column
+INDEX_COLUMNS = {
+    "Index Name": "INDEX_NAME",
+    "Open Index Value": "OPEN",
+    "High Index Value": "HIGH",
+    "Low Index Value": "LOW",
+    "Closing Index Value": "CLOSE",
+    "Points Change": "CHANGE",
+    "Change(%)": "PCT_CHANGE",
+}
+
+# ==================================================
+# GAPS
+# ==================================================
+def sessions(after: date, until: date) -> list:
+    days, d = [], after + timedelta(days=1)
+    while d <= until:
+        if d.weekday() < 5:
+            days.append(d)
+        d += timedelta(days=1)
+    return days
+
+
+def gaps(branches: list, since: date | None, until: date) -> dict:
+    """branch → missing session dates (ascending)."""
+    out = {}
+    for b in branches:
+        lasts = [last_date(m) for m in BRANCH_MASTERS[b]]
+
+        if since is not None:
+            start = since - timedelta(days=1)
+        elif None in lasts:
+            raise RuntimeError(f" {b}: no master yet — pass --since (or use the rebuild tool)")
+        else:
+            start = min(lasts)
+
+        days = sessions(start, until)
+        if since is None and len(days) > MAX_DAYS:
+            raise RuntimeError(f" {b}: {len(days)} sessions missing (> {MAX_DAYS}) — pass --since explicitly")
+
+        shown = ", ".join(f"{m} {d or '-'}" for m, d in zip(BRANCH_MASTERS[b], lasts))
+        print(f" {b:<8} last: {shown} | missing sessions: {len(days)}")
+        out[b] = days
+
+    return out
+
+# ==================================================
+# PHASE 1 — CONCURRENT FETCH INTO STAGING
+# ==================================================
+def landing(branch: str, d: date) -> Path:
+    if branch == "indices":
+        return pipeline.RAW / "indices" / f"indices_ohlc_eod_{d:%Y%m%d}.csv"
+    return WINDOWS[branch]["out"](d)
+
+
+def staged(branch: str, d: date) -> Path:
+    return STAGING / branch / landing(branch, d).name
+
+
+def index_eod(body: bytes, d: date) -> pd.DataFrame:
+    df = pd.read_csv(io.BytesIO(body))
+    df.columns = df.columns.astype(str).str.strip()
+
+    missing = set(INDEX_COLUMNS) - set(df.columns)
+    if missing:
+        raise RuntimeError(f" ind_close_all {d}: missing columns {sorted(missing)}")
+
+    df = df[list(INDEX_COLUMNS)].rename(columns=INDEX_COLUMNS)
+    df["INDEX_NAME"] = df["INDEX_NAME"].astype(str).str.strip().str.upper()   # "Nifty 50" → API spelling
+    df.insert(0, "TRADE_DATE", d.isoformat())
+    return df
+
+
+def fetch_day(item: tuple, archives: str) -> str:
+    """'landed' | 'fetched' | 'missing' | 'throttled' — never raises on network trouble."""
+    branch, d = item
+    out = staged(branch, d)
+
+    if landing(branch, d).exists():
+        return "landed"       # downloaded before, still missing from the master → replay
+    if out.exists():
+        return "fetched"      # staged by an earlier, interrupted catch-up
+
+    try:
+        if branch == "indices":
+            r = net.get(archives + INDEX_ARCHIVE.format(d=d), headers=HEADERS, timeout=60)
+        else:
+            r = net.get(archives + WINDOWS[branch]["path"](d), headers=HEADERS, timeout=120)
+    except net.NetError as e:
+        print(f" {branch:<8} {d} THROTTLED ({e})")
+        return "throttled"
+
+    body = r.content
+    if r.status_code != 200:
+        return "missing"
+
+    out.parent.mkdir(parents=True, exist_ok=True)
+    tmp = out.with_name(f".{out.name}.tmp")
+
+    if branch == "indices":
+        try:
+            index_eod(body, d).to_csv(tmp, index=False)
+        except (RuntimeError, ValueError) as e:
+            print(f" {branch:<8} {d} unreadable archive file: {e}")
+            return "missing"
+    else:
+        spec = WINDOWS[branch]
+        if len(body) < spec["min_bytes"] or (spec["magic"] and not body.startswith(spec["magic"])):
+            return "missing"      # placeholder / error page
+        tmp.write_bytes(body)
+
+    tmp.replace(out)
+    return "fetched"
+
+
+def fetch_all(missing: dict, archives: str, workers: int) -> dict:
+    items = [(b, d) for b, days in missing.items() for d in days]
+    if not items:
+        return {}
+
+    t0 = time.perf_counter()
+    status = net.fetch_many(lambda it: fetch_day(it, archives), items, workers)
+    wall = time.perf_counter() - t0
+
+    result = dict(zip(items, status))
+    counts = {s: status.count(s) for s in sorted(set(status))}
+    print(f"\n Fetched in {wall:.1f}s | " + " | ".join(f"{k} {v}" for k, v in counts.items()))
+    for host, st in net.stats().items():
+        print(f"   {host}: rate {st['rate']}/s | concurrency {st['concurrency']} | "
+              f"ok {st['ok']} | throttled {st['throttled']} | errors {st['errors']}")
+
+    return result
+
+# ==================================================
+# PHASE 2 — REPLAY IN DATE ORDER
+# ==================================================
+REPLAY = ("fetched", "landed")
+
+
+def release(branch: str, d: date, status: str) -> bool:
+    if status == "landed":
+        dst = landing(branch, d)
+        if not dst.exists():
+            return False
+        os.utime(dst)   # already in data/raw — newest mtime → its chain reruns
+        return True
+
+    src = staged(branch, d)
+    if not src.exists():
+        return False
+
+    dst = landing(branch, d)
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    src.replace(dst)
+    os.utime(dst)       # newest mtime → "latest file" stages pick this day
+    return True
+
+
+def halts(fetched: dict) -> dict:
+    """branch → first throttled day (replay of that branch stops there)."""
+    out = {}
+    for (b, d), s in fetched.items():
+        if s == "throttled" and (b not in out or d < out[b]):
+            out[b] = d
+    return out
+
+
+def replay(fetched: dict, jobs: int) -> int:
+    halt = halts(fetched)
+    for b, d in sorted(halt.items()):
+        held = sum(1 for (x, day), s in fetched.items() if x == b and day > d and s in REPLAY)
+        print(f" {b:<8} halted at throttled {d} — {held} later day(s) held back for the next run")
+
+    days = sorted({d for (b, d), s in fetched.items() if s in REPLAY and (b not in halt or d < halt[b])})
+
+    for d in days:
+        branches = {
+            b for (b, day), s in fetched.items()
+            if day == d and s in REPLAY and (b not in halt or d < halt[b]) and release(b, d, s)
+        }
+        if not branches:
+            continue
+
+        print(f"\n ==> {d} | {', '.join(sorted(branches))}")
+        stages = watch.chain(branches)
+
+        t0 = time.perf_counter()
+        results = pipeline.run(stages, jobs, force=False, dry_run=False)
+        pipeline.write_run_record(sorted(branches), time.perf_counter() - t0, results)
+
+        failed = [r["stage"] for r in results if r["status"] in ("failed", "blocked")]
+        if failed:
+            print(f" REPLAY STOPPED at {d} — failed: {', '.join(failed)} (later days stay staged in {STAGING})")
+            return 1
+
+    return 0
+
+# ==================================================
+# MAIN
+# ==================================================
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Detect master gaps and catch up missing sessions")
+    parser.add_argument("--dataset", nargs="+", choices=sorted(BRANCH_MASTERS), default=sorted(BRANCH_MASTERS))
+    parser.add_argument("--since", type=date.fromisoformat, help="first session to fetch (default: master last date + 1)")
+    parser.add_argument("--until", type=date.fromisoformat, default=date.today())
+    parser.add_argument("--archives", default=ARCHIVES, help="archive base URL")
+    parser.add_argument("--workers", type=int, default=net.MAX_CONCURRENCY, help="fetch threads (limiter caps the rate)")
+    parser.add_argument("--jobs", type=int, default=4, help="parallel stages per replayed day")
+    parser.add_argument("--dry-run", action="store_true", help="report gaps only")
+    args = parser.parse_args()
+
+    print("=====================================")
+    print(" MarketForge | CATCH-UP")
+    print(f" Datasets : {', '.join(args.dataset)}")
+    print(f" Until    : {args.until}")
+    print("=====================================")
+
+    missing = gaps(args.dataset, args.since, args.until)
+
+    if args.dry_run or not any(missing.values()):
+        print(" Nothing to fetch" if not any(missing.values()) else " Dry run — nothing fetched")
+        sys.exit(0)
+
+    fetched = fetch_all(missing, args.archives.rstrip("/"), args.workers)
+
+    not_published = sorted(f"{b} {d}" for (b, d), s in fetched.items() if s == "missing")
+    throttled = sorted(f"{b} {d}" for (b, d), s in fetched.items() if s == "throttled")
+
+    code = replay(fetched, args.jobs)
+
+    if not_published:
+        print(f"\n Not published (holiday?) : {', '.join(not_published)}")
+    if throttled:
+        print(f" THROTTLED — rerun later : {', '.join(throttled)}")
+        code = code or 1
+
+    if code == 0:
+        print("\n CATCH-UP COMPLETED")
+    sys.exit(code)
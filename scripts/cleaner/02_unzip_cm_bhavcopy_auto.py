@@ -10,12 +10,15 @@ MarketForge | UNZIP NSE CM BHAVCOPY
 """
 
 from pathlib import Path
+import sys
 import zipfile
 
 # =================================================
 # PATHS
 # =================================================
-ROOT = Path(__file__).resolve().parents[2]   # H:\MarketForge
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from marketforge.settings import ROOT  # noqa: E402
 
 SRC_DIR = ROOT / "data" / "raw" / "equity"
 OUT_DIR = ROOT / "data" / "unzip_daily" / "equty_daily_unzip"
@@ -11,12 +11,15 @@ MarketForge | UNZIP NSE FO DAILY ZIP
 """
 
 from pathlib import Path
+import sys
 import zipfile
 
 # =================================================
 # PATHS
 # =================================================
-ROOT = Path(__file__).resolve().parents[2]   # H:\MarketForge
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from marketforge.settings import ROOT  # noqa: E402
 
 SRC_DIR = ROOT / "data" / "raw" / "futures"
 OUT_DIR = ROOT / "data" / "unzip_daily" / "future_daily_unzip"
@@ -7,16 +7,21 @@ MarketForge | NSE EQUITY DAILY CLEANER (CM BHAVCOPY — EQ ONLY)
 ✔ NEW + OLD NSE CM schema
 ✔ STRICT SERIES = EQ
 ✔ Explicit DATE / INT / FLOAT standards
+✔ TRADE_DATE = YYYYMMDD int (marketforge/dates.py) — same key as every master
 ✔ Production safe
 """
 
 from pathlib import Path
+import sys
 import pandas as pd
 
 # =================================================
 # PATHS
 # =================================================
-ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from marketforge.settings import ROOT  # noqa: E402
+from marketforge import dates  # noqa: E402
 
 SRC_DIR = ROOT / "data" / "unzip_daily" / "equty_daily_unzip"
 OUT_DIR = ROOT / "data" / "processed" / "equity_daily"
@@ -28,7 +33,7 @@ print(f"Scanning source dir : {SRC_DIR}")
 # STANDARD OUTPUT SCHEMA
 # =================================================
 KEEP_COLS = [
-    "DATE",
+    "TRADE_DATE",
     "SYMBOL",
     "SERIES",
     "OPEN",
@@ -79,7 +84,8 @@ COL_MAP = {
 # =================================================
 # DISCOVER FILES
 # =================================================
-files = list(SRC_DIR.glob("BhavCopy_NSE_CM*.csv"))
+# name order = date order → newest day is written last (latest-mtime appenders)
+files = sorted(SRC_DIR.glob("BhavCopy_NSE_CM*.csv"))
 print(f"Found {len(files)} equity CSV files")
 
 if not files:
@@ -116,7 +122,7 @@ for file in files:
         raise RuntimeError(f"No DATE column found in {file.name}")
 
     df = df[df["DATE"].notna()]
-    df["DATE"] = df["DATE"].dt.date
+    df["TRADE_DATE"] = dates.key(df["DATE"])
 
     # ---------------------------------
     # RENAME TO STANDARD
@@ -174,7 +180,7 @@ for file in files:
     # ---------------------------------
     # SORT + SAVE
     # ---------------------------------
-    df = df.sort_values("DATE")
+    df = df.sort_values("TRADE_DATE")
 
     out_file = OUT_DIR / file.name
     df.to_csv(out_file, index=False)
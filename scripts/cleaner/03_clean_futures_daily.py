@@ -17,6 +17,7 @@ MarketForge | FO DAILY → FUTURES ONLY (FINAL • ZERO WARNINGS)
 """
 
 from pathlib import Path
+import sys
 import pandas as pd
 import re
 from datetime import datetime
@@ -24,7 +25,9 @@ from datetime import datetime
 # =================================================
 # PATHS
 # =================================================
-ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from marketforge.settings import ROOT  # noqa: E402
 
 SRC_DIR = ROOT / "data" / "unzip_daily" / "future_daily_unzip"
 OUT_ROOT = ROOT / "data" / "processed" / "futures_daily"
@@ -14,12 +14,17 @@ MarketForge | CLEAN NSE INDEX OHLC (FINAL LOCKED)
 
 from pathlib import Path
 import pandas as pd
+import sys
 
 # ==================================================
 # PATHS
 # ==================================================
-RAW_DIR = Path(r"H:\MarketForge\data\raw\indices")
-OUT_DIR = Path(r"H:\MarketForge\data\processed\indices_daily")
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from marketforge.settings import ROOT  # noqa: E402
+
+RAW_DIR = ROOT / "data" / "raw" / "indices"
+OUT_DIR = ROOT / "data" / "processed" / "indices_daily"
 OUT_DIR.mkdir(parents=True, exist_ok=True)
 
 # ==================================================
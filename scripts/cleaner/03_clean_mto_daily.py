@@ -23,7 +23,9 @@ import sys
 # ==================================================
 # PATHS
 # ==================================================
-ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from marketforge.settings import ROOT  # noqa: E402
 
 RAW_DIR = ROOT / "data" / "raw" / "equityDat"
 OUT_DIR = ROOT / "data" / "processed" / "equityDat_daily"
@@ -18,6 +18,7 @@ MarketForge | FO DAILY → OPTIONS ONLY (FINAL LOCKED & STANDARDIZED)
 """
 
 from pathlib import Path
+import sys
 import pandas as pd
 import re
 from datetime import datetime
@@ -25,7 +26,9 @@ from datetime import datetime
 # =================================================
 # PATHS
 # =================================================
-ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from marketforge.settings import ROOT  # noqa: E402
 
 SRC_DIR = ROOT / "data" / "unzip_daily" / "future_daily_unzip"
 OUT_ROOT = ROOT / "data" / "processed" / "options_daily"
@@ -65,6 +65,9 @@ Run-Step "Clean Futures Daily" `
 Run-Step "Clean Options Daily" `
     "$BASE\cleaner\03_clean_options_daily.py"
 
+Run-Step "Build Options Analytics (PCR / Max Pain / OI)" `
+    "$BASE\analytics\05_build_options_analytics.py"
+
 Run-Step "Clean MTO Daily" `
     "$BASE\cleaner\03_clean_mto_daily.py"
 
@@ -80,6 +83,9 @@ Run-Step "Append Equity Stock Master (Symbolwise)" `
 Run-Step "Append Equity MTO Master" `
     "$BASE\append\04_append_equity_mto_master.py"
 
+Run-Step "Append Equity + Delivery Enriched Master" `
+    "$BASE\append\04_append_equity_enriched_master.py"
+
 Run-Step "Append Futures Master" `
     "$BASE\append\04_append_futures_master.py"
 
@@ -89,6 +95,12 @@ Run-Step "Append Options Master" `
 Run-Step "Append Index OHLC Master (NIFTY)" `
     "$BASE\append\04_append_indices_ohlc_master.py"
 
+# --------------------------------------------------
+# DERIVED ANALYTICS
+# --------------------------------------------------
+Run-Step "Build Options IV & Greeks" `
+    "$BASE\analytics\06_build_options_greeks.py"
+
 # --------------------------------------------------
 # DONE
 # --------------------------------------------------
@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+MarketForge | PUBLICATION-WINDOW DOWNLOAD SCHEDULER
+
+✔ Knows when NSE publishes each dataset (WINDOWS below, IST)
+✔ Inside the window: cheap probes (HEAD, ranged GET fallback) — no
+  full downloads until the file actually exists
+✔ Adaptive cadence:
+    before the expected time → probe interval shrinks as it approaches
+    after the expected time  → backoff ×1.5 per miss (late files run late)
+    throttled (403/429/503)  → interval doubled (archive asks us to slow down)
+✔ All requests through marketforge/net.py (shared per-host limiter,
+  backoff, circuit breaker); probes retry briefly, the cadence does the rest
+✔ File appears → downloaded immediately, validated, saved where the
+  01_download_* scripts save it (watch mode / pipeline pick it up)
+✔ One probe loop for all datasets (single thread, sleeps until next due)
+✔ Per-day outcome → data/state/download_schedule.json (reruns skip done)
+
+Usage:
+    python 00_schedule_downloads.py                     # today, all datasets
+    python 00_schedule_downloads.py --dataset fo mto
+    python 00_schedule_downloads.py --date 2024-01-08 --ignore-window \\
+        --archives http://127.0.0.1:8765 --api http://127.0.0.1:8765/api/allIndices
+"""
+
+from pathlib import Path
+from datetime import date, datetime, time as dtime, timedelta
+import argparse
+import json
+import random
+import runpy
+import sys
+import time
+
+import requests
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from marketforge.settings import ROOT  # noqa: E402
+from marketforge import net  # noqa: E402
+
+RAW = ROOT / "data" / "raw"
+STATE_FILE = ROOT / "data" / "state" / "download_schedule.json"
+
+ARCHIVES = "https://nsearchives.nseindia.com"
+API = "https://www.nseindia.com/api/allIndices"
+
+HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/120.0.0.0 Safari/537.36"
+    ),
+    "Accept": "*/*",
+    "Referer": "https://www.nseindia.com/",
+}
+
+# ==================================================
+# PUBLICATION WINDOWS (IST, OBSERVED — ADJUST IF NSE SHIFTS)
+# ==================================================
+# open / close → probe only inside this window
+# expected     → typical publication time (cadence pivot)
+# path         → archive path for the trade date d
+# out          → local file (same name the 01_download_* scripts use)
+# min_bytes    → smaller response = not the real file
+# magic        → leading bytes of a valid file (None = no check)
+WINDOWS = {
+    "indices": {
+        "open": dtime(15, 35), "expected": dtime(15, 40), "close": dtime(17, 30),
+    },
+    "cm": {
+        "open": dtime(17, 0), "expected": dtime(17, 45), "close": dtime(21, 0),
+        "path": lambda d: f"/content/cm/BhavCopy_NSE_CM_0_0_0_{d:%Y%m%d}_F_0000.csv.zip",
+        "out": lambda d: RAW / "equity" / f"BhavCopy_NSE_CM_0_0_0_{d:%Y%m%d}_F_0000.csv.zip",
+        "min_bytes": 10_000,
+        "magic": b"PK",
+    },
+    "fo": {
+        "open": dtime(17, 30), "expected": dtime(18, 30), "close": dtime(22, 0),
+        "path": lambda d: f"/archives/fo/mkt/fo{d:%d%m%Y}.zip",
+        "out": lambda d: RAW / "futures" / f"fo{d:%d%m%Y}.zip",
+        "min_bytes": 50_000,
+        "magic": b"PK",
+    },
+    "mto": {
+        "open": dtime(17, 30), "expected": dtime(18, 45), "close": dtime(22, 0),
+        "path": lambda d: f"/archives/equities/mto/MTO_{d:%d%m%Y}.DAT",
+        "out": lambda d: RAW / "equityDat" / f"MTO_{d:%d%m%Y}.DAT",
+        "min_bytes": 100_000,
+        "magic": None,
+    },
+}
+
+MIN_WAIT = 15       # seconds, fastest probe cadence
+MAX_WAIT = 300      # seconds, slowest probe cadence
+BACKOFF = 1.5
+JITTER = 0.1        # ±10 % so datasets do not probe in lock-step
+PROBE_TRIES = 2     # net retries per probe (cadence handles the long wait)
+
+# ==================================================
+# STATE
+# ==================================================
+def load_state() -> dict:
+    if STATE_FILE.exists():
+        return json.loads(STATE_FILE.read_text())
+    return {}
+
+
+def save_state(state: dict) -> None:
+    STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    tmp = STATE_FILE.with_suffix(".tmp")
+    tmp.write_text(json.dumps(state, indent=2, sort_keys=True))
+    tmp.replace(STATE_FILE)
+
+# ==================================================
+# CADENCE
+# ==================================================
+def next_wait(now: datetime, expected: datetime, misses: int, throttled: bool) -> float:
+    if now < expected:
+        wait = (expected - now).total_seconds() / 4
+    else:
+        wait = MIN_WAIT * BACKOFF ** misses
+
+    if throttled:
+        wait *= 2
+
+    wait = min(max(wait, MIN_WAIT), MAX_WAIT)
+    return wait * random.uniform(1 - JITTER, 1 + JITTER)
+
+# ==================================================
+# PROBES
+# ==================================================
+def probe_archive(url: str, min_bytes: int) -> str:
+    """'ready' | 'missing' | 'throttled' — without downloading the body."""
+    try:
+        try:
+            r = net.head(url, headers=HEADERS, timeout=10, allow_redirects=True, tries=PROBE_TRIES)
+        except net.NetError:
+            r = None
+
+        if r is None or r.status_code in (405, 501):
+            # HEAD refused / not allowed on this edge → 1-byte ranged GET
+            r = net.get(url, headers={**HEADERS, "Range": "bytes=0-0"}, timeout=10,
+                        stream=True, tries=PROBE_TRIES)
+            r.close()
+
+    except net.NetError as e:
+        print(f"   probe throttled: {e}")
+        return "throttled"
+
+    if r.status_code not in (200, 206):
+        return "missing"
+
+    total = r.headers.get("Content-Range", "").rpartition("/")[2] or r.headers.get("Content-Length")
+    if total and total.isdigit() and int(total) < min_bytes:
+        return "missing"      # placeholder / error page
+
+    return "ready"
+
+
+def fetch_archive(url: str, spec: dict, out: Path) -> int:
+    r = net.get(url, headers=HEADERS, timeout=120)
+    r.raise_for_status()
+
+    body = r.content
+    if len(body) < spec["min_bytes"] or (spec["magic"] and not body.startswith(spec["magic"])):
+        raise RuntimeError(f" Invalid file from {url} ({len(body)} bytes)")
+
+    out.parent.mkdir(parents=True, exist_ok=True)
+    tmp = out.with_name(f".{out.name}.tmp")
+    tmp.write_bytes(body)
+    tmp.replace(out)
+    return len(body)
+
+
+_poller = None
+
+
+def fetch_indices(api: str, d: date) -> tuple:
+    """allIndices → EOD file, only once the payload is stamped d after the close."""
+    global _poller
+    if _poller is None:
+        _poller = runpy.run_path(
+            str(Path(__file__).resolve().parent / "01_poll_indices_intraday.py"),
+            run_name="poller",
+        )
+
+    try:
+        r = net.get(api, headers=HEADERS, timeout=10, tries=PROBE_TRIES)
+    except net.NetError as e:
+        print(f"   probe throttled: {e}")
+        return "throttled", None
+
+    if r.status_code != 200:
+        return "missing", None
+
+    payload = r.json()
+    stamp = _poller["payload_time"](payload)
+    if stamp.date() != d or stamp.time() < dtime(15, 30):
+        return "missing", None
+
+    out = _poller["finalize_eod"](payload, _poller["Decoder"]())
+    return ("ready", out) if out is not None else ("missing", None)
+
+# ==================================================
+# SCHEDULER
+# ==================================================
+def run(datasets: list, d: date, archives: str, api: str, ignore_window: bool) -> dict:
+    state = load_state()
+    day = state.setdefault(d.isoformat(), {})
+
+    jobs = {}
+    for name in datasets:
+        if day.get(name, {}).get("status") == "downloaded":
+            print(f" {name:<8} already downloaded for {d}")
+            continue
+
+        w = WINDOWS[name]
+        jobs[name] = {
+            "open": datetime.combine(d, w["open"]),
+            "expected": datetime.combine(d, w["expected"]),
+            "close": datetime.combine(d, w["close"]),
+            "due": datetime.now() if ignore_window else datetime.combine(d, w["open"]),
+            "misses": 0,
+            "probes": 0,
+        }
+
+    while jobs:
+        name, job = min(jobs.items(), key=lambda kv: kv[1]["due"])
+        now = datetime.now()
+
+        if not ignore_window and now > job["close"]:
+            print(f" {name:<8} MISSED — window closed at {job['close']:%H:%M} ({job['probes']} probes)")
+            day[name] = {"status": "missed", "probes": job["probes"], "at": now.isoformat(timespec="seconds")}
+            save_state(state)
+            del jobs[name]
+            continue
+
+        if job["due"] > now:
+            time.sleep((job["due"] - now).total_seconds())
+            continue
+
+        job["probes"] += 1
+        spec = WINDOWS[name]
+
+        if name == "indices":
+            status, out = fetch_indices(api, d)
+            size = out.stat().st_size if out else 0
+        else:
+            url = archives + spec["path"](d)
+            status = probe_archive(url, spec["min_bytes"])
+            out, size = spec["out"](d), 0
+
+            if status == "ready":
+                try:
+                    size = fetch_archive(url, spec, out)
+                except (requests.exceptions.RequestException, RuntimeError) as e:
+                    print(f"   fetch failed: {e}")
+                    status = "missing"
+
+        now = datetime.now()
+
+        if status == "ready":
+            late = (now - job["expected"]).total_seconds() / 60
+            print(
+                f" {name:<8} DOWNLOADED {out.name} | {size / 2**20:.1f} MB | "
+                f"{job['probes']} probes"
+                + (f" | {late:+.0f} min vs expected" if d == now.date() else "")
+            )
+            day[name] = {
+                "status": "downloaded",
+                "file": str(out),
+                "bytes": size,
+                "probes": job["probes"],
+                "at": now.isoformat(timespec="seconds"),
+            }
+            save_state(state)
+            del jobs[name]
+            continue
+
+        job["misses"] += now >= job["expected"]
+        wait = next_wait(now, job["expected"], job["misses"], status == "throttled")
+        job["due"] = now + timedelta(seconds=wait)
+        print(f" {name:<8} {status:<9} probe {job['probes']:>3} → next in {wait:.0f}s")
+
+    return day
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="NSE publication-window download scheduler")
+    parser.add_argument("--dataset", nargs="+", choices=sorted(WINDOWS), default=sorted(WINDOWS))
+    parser.add_argument("--date", type=date.fromisoformat, default=date.today())
+    parser.add_argument("--archives", default=ARCHIVES, help="archive base URL")
+    parser.add_argument("--api", default=API, help="allIndices API URL")
+    parser.add_argument("--ignore-window", action="store_true", help="probe now, never give up on time")
+    parser.add_argument("--min-wait", type=float, default=MIN_WAIT)
+    args = parser.parse_args()
+
+    MIN_WAIT = args.min_wait
+
+    if args.date.weekday() >= 5:
+        print(f" {args.date} is a weekend — nothing is published")
+        sys.exit(0)
+
+    print("=====================================")
+    print(" MarketForge | DOWNLOAD SCHEDULER")
+    print(f" Trade date : {args.date}")
+    for n in args.dataset:
+        w = WINDOWS[n]
+        print(f" {n:<8}: {w['open']:%H:%M} – {w['close']:%H:%M} (expected {w['expected']:%H:%M})")
+    print("=====================================")
+
+    result = run(args.dataset, args.date, args.archives.rstrip("/"), args.api, args.ignore_window)
+
+    missed = [n for n in args.dataset if result.get(n, {}).get("status") != "downloaded"]
+    if missed:
+        print(f" NOT PUBLISHED : {', '.join(missed)}")
+        sys.exit(1)
+
+    print(" ALL DATASETS DOWNLOADED")
@@ -9,17 +9,24 @@ MarketForge | NSE CM Bhavcopy Downloader (ARCHIVES SAFE - FIXED)
 ✔ Weekend safe
 ✔ Uses nsearchives (stable)
 ✔ ZIP integrity verified
+✔ Shared rate limiter / backoff / circuit breaker (marketforge/net.py);
+  throttling stops the run instead of skipping to older days
 ✔ Production locked
 """
 
 from pathlib import Path
+import sys
 from datetime import datetime, timedelta
-import requests
 
 # =================================================
 # PATHS
 # =================================================
-OUT_DIR = Path(r"H:\MarketForge\data\raw\equity")
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from marketforge.settings import ROOT  # noqa: E402
+from marketforge import net  # noqa: E402
+
+OUT_DIR = ROOT / "data" / "raw" / "equity"
 OUT_DIR.mkdir(parents=True, exist_ok=True)
 
 # =================================================
@@ -39,8 +46,7 @@ HEADERS = {
 # =================================================
 # SESSION INIT (MANDATORY)
 # =================================================
-session = requests.Session()
-session.get("https://www.nseindia.com", headers=HEADERS, timeout=10)
+net.warm("https://www.nseindia.com", headers=HEADERS, timeout=10)
 
 # =================================================
 # HELPERS
@@ -73,19 +79,17 @@ for i in range(0, MAX_LOOKBACK_DAYS):
         print(f" Already exists: {filename}")
         break
 
-    try:
-        resp = session.get(url, headers=HEADERS, timeout=30)
+    # NetError (throttled / unreachable) propagates: an older day must not
+    # be picked just because NSE pushed back on today's
+    resp = net.get(url, headers=HEADERS, timeout=30)
 
-        if resp.status_code == 200 and is_valid_zip(resp.content):
-            out_file.write_bytes(resp.content)
-            print(" Download successful")
-            print(f" Saved at: {out_file}")
-            break
-        else:
-            print(" Not published yet")
-
-    except Exception as e:
-        print(f" Error: {e}")
+    if resp.status_code == 200 and is_valid_zip(resp.content):
+        out_file.write_bytes(resp.content)
+        print(" Download successful")
+        print(f" Saved at: {out_file}")
+        break
+    else:
+        print(" Not published yet")
 
 else:
     raise RuntimeError(" No CM Bhavcopy found in last 10 trading days")
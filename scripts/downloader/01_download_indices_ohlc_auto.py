@@ -9,12 +9,12 @@ MarketForge | NSE INDEX OHLC (TODAY ELSE YESTERDAY | AUTO)
 ✔ NSE column-variant safe
 ✔ No fake dates
 ✔ Holiday & weekend safe
+✔ Fetched through marketforge/net.py (shared limiter, no curl spawn)
 """
 
 from pathlib import Path
-import subprocess
-import json
 import pandas as pd
+import sys
 from datetime import datetime, timedelta, time
 
 # ==================================================
@@ -32,7 +32,12 @@ CORE_EQUITY_INDICES = {
 # ==================================================
 # PATHS
 # ==================================================
-OUT_DIR = Path(r"H:\MarketForge\data\raw\indices")
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from marketforge.settings import ROOT  # noqa: E402
+from marketforge import net  # noqa: E402
+
+OUT_DIR = ROOT / "data" / "raw" / "indices"
 OUT_DIR.mkdir(parents=True, exist_ok=True)
 
 # ==================================================
@@ -40,20 +45,20 @@ OUT_DIR.mkdir(parents=True, exist_ok=True)
 # ==================================================
 URL = "https://www.nseindia.com/api/allIndices"
 
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)",
+    "Accept": "application/json",
+    "Referer": "https://www.nseindia.com/",
+}
+
 # ==================================================
 # DOWNLOAD LIVE SNAPSHOT
 # ==================================================
-cmd = [
-    "curl",
-    "-s",
-    "-L",
-    "-A", "Mozilla/5.0 (Windows NT 10.0; Win64; x64)",
-    "-e", "https://www.nseindia.com/",
-    URL
-]
+net.warm(URL, headers=HEADERS, timeout=10)
 
-result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-data = json.loads(result.stdout)
+resp = net.get(URL, headers=HEADERS, timeout=30)
+resp.raise_for_status()
+data = resp.json()
 df = pd.DataFrame(data["data"])
 
 # ==================================================
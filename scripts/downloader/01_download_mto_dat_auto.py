@@ -9,16 +9,21 @@ MarketForge | AUTO NSE DELIVERY MTO DAT DOWNLOADER
 ✔ No user input
 ✔ Auto fallback to previous trading days
 ✔ Scheduler safe
+✔ Shared rate limiter / backoff / circuit breaker (marketforge/net.py);
+  throttling stops the run instead of skipping to older days
 """
 
-import requests
 from datetime import datetime, timedelta
 from pathlib import Path
+import sys
 
 # =================================================
 # PATHS (PROJECT ROOT SAFE)
 # =================================================
-ROOT = Path(__file__).resolve().parents[2]   # H:\MarketForge
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from marketforge.settings import ROOT  # noqa: E402
+from marketforge import net  # noqa: E402
 SAVE_DIR = ROOT / "data" / "raw" / "equityDat"
 SAVE_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -59,7 +64,7 @@ def try_download(trade_date: datetime) -> bool:
     print(f" Trying: {url}")
 
     try:
-        r = requests.get(url, headers=HEADERS, timeout=60)
+        r = net.get(url, headers=HEADERS, timeout=60)
 
         if r.status_code == 200 and is_valid_dat(r.content):
             out_file.write_bytes(r.content)
@@ -69,9 +74,9 @@ def try_download(trade_date: datetime) -> bool:
         print(f" Not available: MTO_{date_str}.DAT")
         return False
 
-    except requests.exceptions.RequestException as e:
-        print(f" Network error {date_str}: {e}")
-        return False
+    except net.NetError as e:
+        # throttled / unreachable is NOT "not published" → stop, retry later
+        raise RuntimeError(f" NSE throttled or unreachable for {date_str} — retry later ({e})") from e
 
 # =================================================
 # AUTO MODE MAIN
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+MarketForge | NSE allIndices INTRADAY POLLER (LOW LATENCY)
+
+✔ Persistent keep-alive session via marketforge/net.py (cookies warmed
+  once, no curl spawn; shared limiter slows polling if NSE pushes back)
+✔ Decodes only INDEX / OPEN / HIGH / LOW / LAST / CHANGE / %CHANGE
+  (no pandas on the hot path)
+✔ Snapshots → fixed-size columnar ring buffer (marketforge/ring.py)
+✔ Batched flush → data/raw/indices_intraday/indices_intraday_YYYYMMDD.csv
+✔ EOD finalizer → data/raw/indices/indices_ohlc_eod_YYYYMMDD.csv
+  (same schema as 01_download_indices_ohlc_auto.py → clean / append /
+  watch mode pick it up unchanged)
+✔ Trade date from the payload timestamp (NSE authoritative), not the clock
+✔ Testable offline: --url http://127.0.0.1:8765/api/allIndices against
+  scripts/bench/nse_stub_server.py
+
+Usage:
+    python 01_poll_indices_intraday.py                       # until 15:35, then EOD
+    python 01_poll_indices_intraday.py --interval 0.5 --flush-every 10
+    python 01_poll_indices_intraday.py --url http://127.0.0.1:8765/api/allIndices --polls 20 --eod-now
+"""
+
+from pathlib import Path
+from datetime import datetime, time as dtime
+import argparse
+import csv
+import json
+import math
+import sys
+import time
+
+import numpy as np
+import requests
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from marketforge.settings import ROOT  # noqa: E402
+from marketforge.ring import ColumnRing  # noqa: E402
+from marketforge import net  # noqa: E402
+
+# ==================================================
+# CONFIG
+# ==================================================
+URL = "https://www.nseindia.com/api/allIndices"
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)",
+    "Accept": "application/json",
+    "Referer": "https://www.nseindia.com/",
+}
+
+EOD_AT = dtime(15, 35)
+
+CORE_EQUITY_INDICES = {
+    "NIFTY 50",
+    "NIFTY BANK",
+    "NIFTY NEXT 50",
+    "INDIA VIX",
+}
+
+# JSON field → ring column (everything else in the payload is ignored)
+FIELDS = {
+    "open": "OPEN",
+    "high": "HIGH",
+    "low": "LOW",
+    "last": "LAST",
+    "variation": "CHANGE",
+    "percentChange": "PCT_CHANGE",
+}
+
+SCHEMA = {"TS": "int64", "INDEX_ID": "int32", **{c: "float64" for c in FIELDS.values()}}
+
+INTRADAY_DIR = ROOT / "data" / "raw" / "indices_intraday"
+EOD_DIR = ROOT / "data" / "raw" / "indices"
+
+# ==================================================
+# DECODE (ONLY WHAT WE KEEP)
+# ==================================================
+def num(v) -> float:
+    if isinstance(v, (int, float)):
+        return float(v)
+    try:
+        return float(str(v).replace(",", ""))
+    except ValueError:
+        return math.nan    # "-" / "" on halted or new indices
+
+
+EPOCH = datetime(1970, 1, 1)
+
+
+def now_ms() -> int:
+    """Local (IST) wall clock as epoch ms → flush splits days on local midnight."""
+    return int((datetime.now() - EPOCH).total_seconds() * 1000)
+
+
+def payload_time(payload: dict) -> datetime:
+    try:
+        return datetime.strptime(payload["timestamp"], "%d-%b-%Y %H:%M:%S")
+    except (KeyError, TypeError, ValueError):
+        return datetime.now()
+
+
+class Decoder:
+    """Index name ↔ small int id, so the ring stores no strings."""
+
+    def __init__(self):
+        self.ids = {}
+        self.names = []
+
+    def id_of(self, name: str) -> int:
+        i = self.ids.get(name)
+        if i is None:
+            i = self.ids[name] = len(self.names)
+            self.names.append(name)
+        return i
+
+    def decode(self, payload: dict) -> dict:
+        rows = payload["data"]
+        out = {"INDEX_ID": [self.id_of(r["index"].strip()) for r in rows]}
+        for field, col in FIELDS.items():
+            out[col] = [num(r.get(field)) for r in rows]
+        return out
+
+# ==================================================
+# FLUSH
+# ==================================================
+INTRADAY_COLS = ["TRADE_DATE", "TIME", "INDEX_NAME", *FIELDS.values()]
+
+
+def flush(ring: ColumnRing, dec: Decoder) -> int:
+    if not len(ring):
+        return 0
+
+    batch = ring.drain()
+    ts = batch["TS"].astype("datetime64[ms]")
+    days = ts.astype("datetime64[D]")
+
+    for day in np.unique(days):
+        sel = days == day
+        trade_date = str(day).replace("-", "")
+        out = INTRADAY_DIR / f"indices_intraday_{trade_date}.csv"
+        new_file = not out.exists()
+
+        hhmmss = (ts[sel] - day).astype("timedelta64[s]").astype("int64")
+        hhmmss = (hhmmss // 3600) * 10000 + (hhmmss // 60 % 60) * 100 + hhmmss % 60
+
+        values = [batch[c][sel] for c in FIELDS.values()]
+
+        with open(out, "a", newline="", encoding="utf-8") as f:
+            w = csv.writer(f)
+            if new_file:
+                w.writerow(INTRADAY_COLS)
+            w.writerows(
+                (trade_date, int(t), dec.names[i], *(round(float(v[k]), 2) for v in values))
+                for k, (t, i) in enumerate(zip(hhmmss, batch["INDEX_ID"][sel]))
+            )
+
+    return len(batch["TS"])
+
+# ==================================================
+# EOD FINALIZER
+# ==================================================
+EOD_COLS = ["TRADE_DATE", "INDEX_NAME", "OPEN", "HIGH", "LOW", "CLOSE", "CHANGE", "PCT_CHANGE"]
+
+
+def finalize_eod(payload: dict, dec: Decoder) -> Path | None:
+    """Last snapshot of the day → indices_ohlc_eod_*.csv (downloader schema)."""
+    snap = dec.decode(payload)
+    names = [dec.names[i] for i in snap["INDEX_ID"]]
+
+    core = [k for k, n in enumerate(names) if n in CORE_EQUITY_INDICES]
+    if not core:
+        raise RuntimeError(" No core equity indices found")
+
+    if all(snap[c][k] == 0 for k in core for c in ("OPEN", "HIGH", "LOW")):
+        print(" Core indices not traded today — no EOD file written")
+        return None
+
+    trade_date = payload_time(payload).date()
+    EOD_DIR.mkdir(parents=True, exist_ok=True)
+    out = EOD_DIR / f"indices_ohlc_eod_{trade_date:%Y%m%d}.csv"
+    tmp = out.with_suffix(".tmp")
+
+    with open(tmp, "w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f)
+        w.writerow(EOD_COLS)
+        for k, name in enumerate(names):
+            w.writerow([
+                trade_date.isoformat(), name,
+                snap["OPEN"][k], snap["HIGH"][k], snap["LOW"][k], snap["LAST"][k],
+                snap["CHANGE"][k], snap["PCT_CHANGE"][k],
+            ])
+
+    tmp.replace(out)
+    return out
+
+# ==================================================
+# MAIN LOOP
+# ==================================================
+def poll(args) -> int:
+    INTRADAY_DIR.mkdir(parents=True, exist_ok=True)
+
+    ring = ColumnRing(args.capacity, SCHEMA)
+    dec = Decoder()
+    net.warm(args.url, headers=HEADERS, timeout=10)     # NSE cookies
+
+    eod_at = datetime.combine(datetime.now().date(), dtime.fromisoformat(args.eod_at))
+
+    polls = errors = 0
+    last_payload = None
+    last_flush = time.monotonic()
+    latency = []
+
+    next_tick = time.monotonic()
+
+    while True:
+        t0 = time.perf_counter()
+        try:
+            # one try per tick: the next tick is the retry, the limiter the backoff
+            r = net.get(args.url, headers=HEADERS, timeout=args.timeout, tries=1)
+            if r.status_code == 401:
+                raise net.NetError(f"HTTP {r.status_code}")
+            r.raise_for_status()
+
+            payload = json.loads(r.content)
+            snap = dec.decode(payload)
+
+            n = len(snap["INDEX_ID"])
+            ring.push(TS=np.full(n, now_ms(), dtype="int64"), **snap)
+
+            last_payload = payload
+            polls += 1
+            latency.append(time.perf_counter() - t0)
+
+        except net.NetError as e:
+            errors += 1
+            print(f" Poll error ({errors}): {e}")
+            net.warm(args.url, headers=HEADERS, timeout=10)     # cookies expired?
+
+        except (requests.exceptions.RequestException, ValueError, KeyError) as e:
+            errors += 1
+            print(f" Poll error ({errors}): {e}")
+
+        # ---------- BATCHED FLUSH ----------
+        if len(ring) >= args.batch or time.monotonic() - last_flush >= args.flush_every:
+            flush(ring, dec)
+            last_flush = time.monotonic()
+
+        done = (
+            (args.polls and polls >= args.polls)
+            or (args.eod_now and last_payload is not None)
+            or datetime.now() >= eod_at
+        )
+        if done:
+            break
+
+        # drift-free schedule: ticks stay on the interval grid
+        next_tick += args.interval
+        time.sleep(max(0.0, next_tick - time.monotonic()))
+
+    flush(ring, dec)
+
+    print(f" Polls      : {polls} | errors {errors} | rows {ring.written} | dropped {ring.dropped}")
+    if latency:
+        print(f" Latency    : median {np.median(latency) * 1000:.1f} ms | max {max(latency) * 1000:.1f} ms")
+
+    if last_payload is None:
+        print(" No snapshot received — EOD not written")
+        return 1
+
+    eod = finalize_eod(last_payload, dec)
+    if eod is not None:
+        print(f" EOD saved  : {eod}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="NSE allIndices intraday poller")
+    parser.add_argument("--url", default=URL)
+    parser.add_argument("--interval", type=float, default=1.0, help="seconds between polls")
+    parser.add_argument("--timeout", type=float, default=5.0)
+    parser.add_argument("--capacity", type=int, default=1 << 16, help="ring buffer rows")
+    parser.add_argument("--batch", type=int, default=8192, help="flush when this many rows are buffered")
+    parser.add_argument("--flush-every", type=float, default=30.0, help="flush at least every N seconds")
+    parser.add_argument("--eod-at", default=EOD_AT.strftime("%H:%M"), help="stop + write EOD at HH:MM")
+    parser.add_argument("--polls", type=int, default=0, help="stop after N polls (0 = until --eod-at)")
+    parser.add_argument("--eod-now", action="store_true", help="write EOD after the first snapshot")
+    sys.exit(poll(parser.parse_args()))
@@ -10,11 +10,16 @@ MarketForge | NSE CM Bhavcopy Downloader (ASK DATE)
 ✔ Uses nsearchives.nseindia.com
 ✔ ZIP validation
 ✔ Auto-run safe
+✔ Shared rate limiter / backoff (marketforge/net.py)
 """
 
 from pathlib import Path
 from datetime import datetime
-import requests
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from marketforge import net  # noqa: E402
 
 # =================================================
 # ASK DATE
@@ -68,10 +73,9 @@ if OUT_FILE.exists():
     print(f"⏭ Already exists: {OUT_FILE.name}")
     raise SystemExit
 
-session = requests.Session()
-session.get("https://www.nseindia.com", headers=HEADERS, timeout=10)
+net.warm("https://www.nseindia.com", headers=HEADERS, timeout=10)
 
-resp = session.get(URL, headers=HEADERS, timeout=30)
+resp = net.get(URL, headers=HEADERS, timeout=30)
 
 if resp.status_code != 200 or not is_valid_zip(resp.content):
     raise RuntimeError(" Bhavcopy not available for this date")
@@ -8,16 +8,20 @@ MarketForge | MANUAL / FALLBACK NSE FO ZIP DOWNLOADER
 ✔ Stable NSE archive
 ✔ Manual date input
 ✔ Safe fallback
+✔ Shared rate limiter / backoff (marketforge/net.py)
 """
 
-import requests
 from datetime import datetime, timedelta
 from pathlib import Path
+import sys
 
 # =================================================
 # PATHS (FIXED ROOT)
 # =================================================
 ROOT = Path(__file__).resolve().parents[2]   # H:\MarketForge
+sys.path.insert(0, str(ROOT))
+
+from marketforge import net  # noqa: E402
 SAVE_DIR = ROOT / "data" / "raw" / "futures"
 SAVE_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -52,7 +56,7 @@ def try_download(trade_date: datetime) -> bool:
     print(f" Trying: {url}")
 
     try:
-        r = requests.get(url, headers=HEADERS, timeout=60)
+        r = net.get(url, headers=HEADERS, timeout=60)
 
         if r.status_code == 200 and is_valid_zip(r.content):
             out_file.write_bytes(r.content)
@@ -62,9 +66,9 @@ def try_download(trade_date: datetime) -> bool:
         print(f" Not available: fo{date_str}.zip")
         return False
 
-    except requests.exceptions.RequestException as e:
-        print(f" Network error {date_str}: {e}")
-        return False
+    except net.NetError as e:
+        # throttled / unreachable is NOT "not published" → stop, retry later
+        raise RuntimeError(f" NSE throttled or unreachable for {date_str} — retry later ({e})") from e
 
 # =================================================
 # ASK DATE
@@ -9,14 +9,18 @@ MarketForge | NSE INDEX OHLC (EOD | ASK DATE)
 ✔ Equity-truth date logic
 ✔ Holiday-safe
 ✔ No intraday pollution
+✔ Fetched through marketforge/net.py (shared limiter, no curl spawn)
 """
 
 from pathlib import Path
-import subprocess
-import json
 import pandas as pd
+import sys
 from datetime import datetime, timedelta, time
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from marketforge import net  # noqa: E402
+
 # ==================================================
 # CONFIG
 # ==================================================
@@ -68,20 +72,20 @@ OUT_DIR.mkdir(parents=True, exist_ok=True)
 # ==================================================
 URL = "https://www.nseindia.com/api/allIndices"
 
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)",
+    "Accept": "application/json",
+    "Referer": "https://www.nseindia.com/",
+}
+
 # ==================================================
-# DOWNLOAD (curl = NSE safe)
+# DOWNLOAD (warmed session = NSE safe)
 # ==================================================
-cmd = [
-    "curl",
-    "-s",
-    "-L",
-    "-A", "Mozilla/5.0 (Windows NT 10.0; Win64; x64)",
-    "-e", "https://www.nseindia.com/",
-    URL
-]
+net.warm(URL, headers=HEADERS, timeout=10)
 
-result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-data = json.loads(result.stdout)
+resp = net.get(URL, headers=HEADERS, timeout=30)
+resp.raise_for_status()
+data = resp.json()
 
 df = pd.DataFrame(data["data"])
 
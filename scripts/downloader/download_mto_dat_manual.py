@@ -15,9 +15,9 @@ Features:
 ✔ Required Referer header
 ✔ Saves file AS-IS
 ✔ Clear save-path output
+✔ Shared rate limiter / backoff (marketforge/net.py)
 """
 
-import requests
 from datetime import datetime
 from pathlib import Path
 import sys
@@ -26,6 +26,9 @@ import sys
 # PATHS (PROJECT ROOT SAFE)
 # =================================================
 ROOT = Path(__file__).resolve().parents[2]   # H:\MarketForge
+sys.path.insert(0, str(ROOT))
+
+from marketforge import net  # noqa: E402
 SAVE_DIR = ROOT / "data" / "raw" / "equityDat"
 SAVE_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -73,7 +76,7 @@ def download_mto(trade_date: datetime):
         return
 
     try:
-        resp = requests.get(url, headers=HEADERS, timeout=60)
+        resp = net.get(url, headers=HEADERS, timeout=60)
 
         if resp.status_code == 200 and len(resp.content) > 100_000:
             out_file.write_bytes(resp.content)
@@ -83,8 +86,9 @@ def download_mto(trade_date: datetime):
             print(" Either holiday or file not yet published")
             print("Try after 6:30 PM IST")
 
-    except requests.exceptions.RequestException as e:
-        print(f" Network error: {e}")
+    except net.NetError as e:
+        # throttled / unreachable is NOT "not published" → stop, retry later
+        raise RuntimeError(f" NSE throttled or unreachable for {date_str} — retry later ({e})") from e
 
 # =================================================
 # MAIN
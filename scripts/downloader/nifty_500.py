@@ -6,15 +6,18 @@ MarketForge | NIFTY 500 SYMBOL LIST DOWNLOADER (NSE SAFE)
 
 ✔ Browser headers
 ✔ Session-based
-✔ Retry-safe
+✔ Retry-safe (marketforge/net.py: shared limiter, backoff)
 ✔ Saves clean CSV
 """
 
-import requests
 import pandas as pd
 from io import StringIO
 from pathlib import Path
-import time
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from marketforge import net  # noqa: E402
 
 # --------------------------------------------------
 # OUTPUT PATH
@@ -46,14 +49,10 @@ HEADERS = {
 # --------------------------------------------------
 # DOWNLOAD USING SESSION
 # --------------------------------------------------
-session = requests.Session()
-session.headers.update(HEADERS)
-
 # warm-up request (CRITICAL for NSE)
-session.get("https://www.niftyindices.com", timeout=10)
-time.sleep(1)
+net.warm(URL, headers=HEADERS, timeout=10)
 
-resp = session.get(URL, timeout=15)
+resp = net.get(URL, headers=HEADERS, timeout=15)
 resp.raise_for_status()
 
 # --------------------------------------------------
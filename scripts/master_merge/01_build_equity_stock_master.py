@@ -9,7 +9,8 @@ MarketForge | EQUITY STOCK MASTER BUILDER (FINAL, STABLE)
 ✔ Excludes ETF / GB / SGB / junk
 ✔ One master CSV + Parquet per symbol
 ✔ Append-safe & idempotent
-✔ Date-safe (no warnings)
+✔ TRADE_DATE = YYYYMMDD int (marketforge/dates.py); a master still on
+  the old DATE column stops the run (02_migrate_trade_date_keys.py)
 ✔ Production hardened
 """
 
@@ -17,11 +18,17 @@ from pathlib import Path
 import pandas as pd
 import sys
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from marketforge.settings import ROOT  # noqa: E402
+from marketforge.merge import merge_sorted  # noqa: E402
+from marketforge.io import load_digests, save_digests, write_if_changed  # noqa: E402
+from marketforge import dates  # noqa: E402
+from marketforge import symbols  # noqa: E402
+
 # ==================================================
 # PATHS
 # ==================================================
-ROOT = Path(r"H:\MarketForge")
-
 IN_DIR = ROOT / "data" / "processed" / "equity_daily"
 OUT_DIR = ROOT / "data" / "master" / "Equity_stock_master" / "STOCKS"
 OUT_DIR.mkdir(parents=True, exist_ok=True)
@@ -70,6 +77,7 @@ df = df[
 # RENAME TO MASTER SCHEMA
 # ==================================================
 df = df.rename(columns={
+    "DATE": "TRADE_DATE",
     "TCKRSYMB": "SYMBOL",
     "SCTYSRS": "SERIES",
     "OPNPRIC": "OPEN",
@@ -84,7 +92,7 @@ df = df.rename(columns={
 })
 
 KEEP_COLS = [
-    "DATE",
+    "TRADE_DATE",
     "SYMBOL",
     "SERIES",
     "OPEN",
@@ -104,7 +112,7 @@ df = df[KEEP_COLS]
 # ==================================================
 # TYPE CLEANING (FINAL, WARNING-FREE)
 # ==================================================
-df["DATE"] = pd.to_datetime(df["DATE"], errors="coerce")
+df["TRADE_DATE"] = dates.key(df["TRADE_DATE"])
 
 FLOAT_COLS = [
     "OPEN", "HIGH", "LOW",
@@ -117,7 +125,7 @@ INT_COLS = [
 
 df[FLOAT_COLS] = df[FLOAT_COLS].apply(
     pd.to_numeric, errors="coerce"
-).astype("float32")
+).astype("float64")    # float32 drops paise on ₹1 lakh+ prices (MRF)
 
 df[INT_COLS] = (
     df[INT_COLS]
@@ -126,39 +134,50 @@ df[INT_COLS] = (
     .astype("int64")
 )
 
-df = df.dropna(subset=["SYMBOL", "DATE"])
+df = df.dropna(subset=["SYMBOL", "TRADE_DATE"])
 
 if df.empty:
     print(" No equity rows after filter — aborting")
     sys.exit(0)
 
+df = symbols.tag(df, "TRADE_DATE", isin_col="ISIN")
+symbols.follow_renames(OUT_DIR, suffixes=(".csv", ".parquet"))
+
 print(f" Equity rows after filter: {len(df)}")
 print(f" Symbols found: {df['SYMBOL'].nunique()}")
 
 # ==================================================
 # APPEND PER-SYMBOL MASTER (IDEMPOTENT)
 # ==================================================
+digests = load_digests(OUT_DIR)
+written = 0
+
 for symbol, g in df.groupby("SYMBOL"):
-    g = g.sort_values("DATE")
+    g = g.sort_values("TRADE_DATE")
 
     csv_out = OUT_DIR / f"{symbol}.csv"
     pq_out  = OUT_DIR / f"{symbol}.parquet"
 
     if csv_out.exists():
-        old = pd.read_csv(csv_out, parse_dates=["DATE"])
-        merged = (
-            pd.concat([old, g], ignore_index=True)
-            .drop_duplicates(subset=["DATE"], keep="last")
-            .sort_values("DATE")
-        )
+        old = symbols.carry(pd.read_csv(csv_out), g)
+
+        if "DATE" in old.columns:
+            raise RuntimeError(
+                f" {csv_out.name} still keyed on DATE — run "
+                "scripts/master_merge/02_migrate_trade_date_keys.py first"
+            )
+
+        merged = merge_sorted(old, g, keys=["TRADE_DATE"], sort_keys=["TRADE_DATE"])
     else:
         merged = g
 
-    merged.to_csv(csv_out, index=False)
-    merged.to_parquet(pq_out, index=False)
+    written += write_if_changed(merged, csv_out, digests, parquet_path=pq_out)
+
+save_digests(OUT_DIR, digests)
 
 # ==================================================
 # DONE
 # ==================================================
 print("\nEQUITY STOCK MASTER UPDATED SUCCESSFULLY")
 print(f"Output path: {OUT_DIR}")
+print(f"Files written: {written}")
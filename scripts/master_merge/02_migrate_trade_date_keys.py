@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+MarketForge | ONE-PASS MIGRATION → INTEGER TRADE_DATE KEY
+
+✔ Equity masters: DATE ("2024-01-05" / "2024-01-05 00:00:00")
+  → TRADE_DATE = 20240105 (int), same column position
+✔ Every other master / derived table: TRADE_DATE / EXP_DATE checked,
+  anything not already YYYYMMDD int converted (marketforge/dates.py)
+✔ Files already on the key are read, never rewritten — safe to rerun
+✔ A file with any date that does not parse is NOT written (left as it
+  was, reported, run exits non-zero) — no history is ever blanked
+✔ CSV + Parquet twin replaced atomically, digest entry dropped so the
+  next appender run re-stamps it
+✔ --dry-run → report only
+
+Usage:
+    python 02_migrate_trade_date_keys.py --dry-run
+    python 02_migrate_trade_date_keys.py
+"""
+
+from pathlib import Path
+import argparse
+import sys
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from marketforge.settings import ROOT  # noqa: E402
+from marketforge.masters import MASTERS  # noqa: E402
+from marketforge.io import atomic_to_csv, atomic_to_parquet, load_digests, save_digests  # noqa: E402
+from marketforge import dates  # noqa: E402
+
+MASTER = ROOT / "data" / "master"
+
+# masters + tables keyed on the trade date that are not in MASTERS
+EXTRA_DIRS = [
+    MASTER / "Equity_stock_master" / "STOCKS",
+    MASTER / "Equity_enriched_master",
+    MASTER / "options_analytics",
+    MASTER / "option_greeks",
+]
+
+KEY_COLS = ["TRADE_DATE", "EXP_DATE"]
+
+# ==================================================
+# ONE FILE
+# ==================================================
+def migrate(df: pd.DataFrame) -> pd.DataFrame | None:
+    """Frame on the integer key, or None if it already is."""
+    if "DATE" in df.columns and "TRADE_DATE" not in df.columns:
+        df = df.rename(columns={"DATE": "TRADE_DATE"})
+    elif not any(
+        c in df.columns and not pd.api.types.is_integer_dtype(df[c])
+        for c in KEY_COLS
+    ):
+        return None
+
+    for c in KEY_COLS:
+        if c in df.columns:
+            df[c] = dates.key(df[c])
+    return df
+
+
+def folders() -> list:
+    out = []
+    for spec in MASTERS.values():
+        for _, _, out_dir in spec["sources"]:
+            out.append((out_dir, spec["single"], spec["parquet"]))
+    return out + [(d, None, True) for d in EXTRA_DIRS]
+
+
+def run(dry_run: bool) -> tuple:
+    scanned = changed = refused = 0
+
+    for out_dir, single, parquet in folders():
+        if not out_dir.exists():
+            continue
+
+        files = [out_dir / single] if single else sorted(out_dir.glob("*.csv"))
+        digests = load_digests(out_dir)
+        touched = 0
+
+        for f in files:
+            if not f.exists():
+                continue
+            scanned += 1
+
+            df = migrate(pd.read_csv(f, low_memory=False))
+            if df is None:
+                continue
+
+            bad = sum(int(df[c].isna().sum()) for c in KEY_COLS if c in df.columns)
+            if bad:
+                print(f" {f.relative_to(MASTER)}: {bad} unparseable dates — file left untouched")
+                refused += 1
+                continue
+
+            changed += 1
+            touched += 1
+            if dry_run:
+                continue
+
+            atomic_to_csv(df, f)
+            twin = f.with_suffix(".parquet")
+            if parquet and twin.exists():
+                atomic_to_parquet(df, twin)
+            digests.pop(f.name, None)
+
+        if touched:
+            print(f" {str(out_dir.relative_to(MASTER)):<34} files migrated: {touched}")
+            if not dry_run:
+                save_digests(out_dir, digests)
+
+    return scanned, changed, refused
+
+# ==================================================
+# MAIN
+# ==================================================
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Migrate masters to the integer TRADE_DATE key")
+    parser.add_argument("--dry-run", action="store_true", help="report files that need migrating")
+    args = parser.parse_args()
+
+    print("=====================================")
+    print(" MarketForge | TRADE_DATE KEY MIGRATION")
+    print(f" Masters : {MASTER}")
+    print("=====================================")
+
+    scanned, changed, refused = run(args.dry_run)
+
+    print(f"\n Files scanned : {scanned}")
+    print(f" {'Would migrate' if args.dry_run else 'Migrated'}   : {changed}")
+    print(f" Refused       : {refused}")
+
+    if refused:
+        raise RuntimeError(f" {refused} file(s) have dates that do not parse — fix them and rerun")
+    print(" MIGRATION COMPLETED")
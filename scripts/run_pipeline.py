@@ -0,0 +1,475 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+MarketForge | DAG PIPELINE ORCHESTRATOR
+
+✔ One entry point for CM / FO / MTO / INDICES (+ derived analytics)
+✔ Stage dependencies declared once (STAGES below)
+✔ Independent branches run concurrently (FO clean ‖ MTO download)
+✔ Skips stages whose inputs have not changed since last success
+✔ Failed stage → only its dependents are blocked, other branches finish
+✔ Per-stage wall time, output rows & bytes → logs/pipeline/run_*.json
+✔ Each stage runs under marketforge.metrics → logs/metrics/<stage>.jsonl
+✔ End-to-end time ≈ slowest branch, not the sum of all steps
+
+Usage:
+    python run_pipeline.py
+    python run_pipeline.py --branch fo mto --jobs 4
+    python run_pipeline.py --force        (ignore skip-unchanged)
+    python run_pipeline.py --dry-run      (print the plan only)
+"""
+
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from datetime import datetime
+import argparse
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import time
+
+# ==================================================
+# PATHS
+# ==================================================
+CODE_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(CODE_ROOT))
+
+from marketforge.settings import ROOT  # noqa: E402
+
+SCRIPTS = Path(__file__).resolve().parent
+DATA = ROOT / "data"
+
+RAW = DATA / "raw"
+UNZIP = DATA / "unzip_daily"
+PROC = DATA / "processed"
+MASTER = DATA / "master"
+
+STATE_FILE = DATA / "state" / "pipeline_state.json"
+LOG_DIR = ROOT / "logs" / "pipeline"
+
+# ==================================================
+# DAG
+# ==================================================
+# script  → relative to scripts/
+# after   → stages that must succeed first
+# inputs  → paths fingerprinted for skip-unchanged (None = always run)
+# outputs → paths measured for rows / bytes written
+STAGES = {
+    # ---------- CM ----------
+    "download_cm": {
+        "branch": "cm",
+        "script": "downloader/01_download_cm_bhavcopy_auto.py",
+        "after": [],
+        "inputs": None,
+        "outputs": [RAW / "equity"],
+    },
+    "unzip_cm": {
+        "branch": "cm",
+        "script": "cleaner/02_unzip_cm_bhavcopy_auto.py",
+        "after": ["download_cm"],
+        "inputs": [RAW / "equity"],
+        "outputs": [UNZIP / "equty_daily_unzip"],
+    },
+    "clean_cm": {
+        "branch": "cm",
+        "script": "cleaner/03_clean_cm_bhavcopy_daily_auto.py",
+        "after": ["unzip_cm"],
+        "inputs": [UNZIP / "equty_daily_unzip"],
+        "outputs": [PROC / "equity_daily"],
+    },
+    "append_equity": {
+        "branch": "cm",
+        "script": "append/04_append_equity_stock_master.py",
+        "after": ["clean_cm"],
+        "inputs": [PROC / "equity_daily"],
+        "outputs": [MASTER / "Equity_stock_master"],
+    },
+
+    # ---------- FO ----------
+    "download_fo": {
+        "branch": "fo",
+        "script": "downloader/01_download_fo_zip_auto.py",
+        "after": [],
+        "inputs": None,
+        "outputs": [RAW / "futures"],
+    },
+    "unzip_fo": {
+        "branch": "fo",
+        "script": "cleaner/02_unzip_fo_daily.py",
+        "after": ["download_fo"],
+        "inputs": [RAW / "futures"],
+        "outputs": [UNZIP / "future_daily_unzip"],
+    },
+    "clean_futures": {
+        "branch": "fo",
+        "script": "cleaner/03_clean_futures_daily.py",
+        "after": ["unzip_fo"],
+        "inputs": [UNZIP / "future_daily_unzip"],
+        "outputs": [PROC / "futures_daily"],
+    },
+    "clean_options": {
+        "branch": "fo",
+        "script": "cleaner/03_clean_options_daily.py",
+        "after": ["unzip_fo"],
+        "inputs": [UNZIP / "future_daily_unzip"],
+        "outputs": [PROC / "options_daily"],
+    },
+    "analytics_options": {
+        "branch": "fo",
+        "script": "analytics/05_build_options_analytics.py",
+        "after": ["clean_options"],
+        "inputs": [PROC / "options_daily"],
+        "outputs": [MASTER / "options_analytics"],
+    },
+    "append_futures": {
+        "branch": "fo",
+        "script": "append/04_append_futures_master.py",
+        "after": ["clean_futures"],
+        "inputs": [PROC / "futures_daily"],
+        "outputs": [MASTER / "Futures_master"],
+    },
+    "append_options": {
+        "branch": "fo",
+        "script": "append/04_append_options_master.py",
+        "after": ["clean_options"],
+        "inputs": [PROC / "options_daily"],
+        "outputs": [MASTER / "option_master"],
+    },
+
+    # ---------- MTO ----------
+    "download_mto": {
+        "branch": "mto",
+        "script": "downloader/01_download_mto_dat_auto.py",
+        "after": [],
+        "inputs": None,
+        "outputs": [RAW / "equityDat"],
+    },
+    "clean_mto": {
+        "branch": "mto",
+        "script": "cleaner/03_clean_mto_daily.py",
+        "after": ["download_mto"],
+        "inputs": [RAW / "equityDat"],
+        "outputs": [PROC / "equityDat_daily"],
+    },
+    "append_mto": {
+        "branch": "mto",
+        "script": "append/04_append_equity_mto_master.py",
+        "after": ["clean_mto"],
+        "inputs": [PROC / "equityDat_daily"],
+        "outputs": [MASTER / "EqiutyDat_master"],
+    },
+
+    # ---------- INDICES ----------
+    "download_indices": {
+        "branch": "indices",
+        "script": "downloader/01_download_indices_ohlc_auto.py",
+        "after": [],
+        "inputs": None,
+        "outputs": [RAW / "indices"],
+    },
+    "clean_indices": {
+        "branch": "indices",
+        "script": "cleaner/03_clean_indices_ohlc.py",
+        "after": ["download_indices"],
+        "inputs": [RAW / "indices"],
+        "outputs": [PROC / "indices_daily"],
+    },
+    "append_indices": {
+        "branch": "indices",
+        "script": "append/04_append_indices_ohlc_master.py",
+        "after": ["clean_indices"],
+        "inputs": [PROC / "indices_daily"],
+        "outputs": [MASTER / "Indices_master"],
+    },
+
+    # ---------- CROSS-BRANCH ----------
+    "append_enriched": {
+        "branch": "cm",
+        "script": "append/04_append_equity_enriched_master.py",
+        "after": ["clean_cm", "clean_mto"],
+        "inputs": [PROC / "equity_daily", PROC / "equityDat_daily"],
+        "outputs": [MASTER / "Equity_enriched_master"],
+    },
+    "analytics_greeks": {
+        "branch": "fo",
+        "script": "analytics/06_build_options_greeks.py",
+        "after": ["append_options", "append_futures", "append_indices"],
+        "inputs": [MASTER / "option_master", MASTER / "Futures_master", MASTER / "Indices_master"],
+        "outputs": [MASTER / "option_greeks"],
+    },
+}
+
+BRANCHES = sorted({s["branch"] for s in STAGES.values()})
+
+# ==================================================
+# FILE SNAPSHOTS
+# ==================================================
+def snapshot(paths: list) -> dict:
+    """{file: (size, mtime_ns)} for every file under paths."""
+    snap = {}
+    for p in paths:
+        if p.is_file():
+            files = [p]
+        elif p.is_dir():
+            files = (f for f in p.rglob("*") if f.is_file())
+        else:
+            continue
+
+        for f in files:
+            st = f.stat()
+            snap[str(f)] = (st.st_size, st.st_mtime_ns)
+
+    return snap
+
+
+def fingerprint(paths: list) -> str:
+    h = hashlib.sha1()
+    for name, (size, mtime) in sorted(snapshot(paths).items()):
+        h.update(f"{name}|{size}|{mtime}\n".encode())
+    return h.hexdigest()
+
+
+def count_rows(path: str) -> int:
+    if not path.endswith(".csv"):
+        return 0
+    with open(path, "rb") as f:
+        return max(sum(buf.count(b"\n") for buf in iter(lambda: f.read(1 << 20), b"")) - 1, 0)
+
+
+def output_delta(before: dict, after: dict) -> tuple:
+    changed = [f for f, meta in after.items() if before.get(f) != meta]
+    rows = sum(count_rows(f) for f in changed)
+    size = sum(after[f][0] for f in changed)
+    return len(changed), rows, size
+
+# ==================================================
+# STATE
+# ==================================================
+def load_state() -> dict:
+    if STATE_FILE.exists():
+        return json.loads(STATE_FILE.read_text())
+    return {}
+
+
+def save_state(state: dict) -> None:
+    STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    tmp = STATE_FILE.with_suffix(".tmp")
+    tmp.write_text(json.dumps(state, indent=2, sort_keys=True))
+    tmp.replace(STATE_FILE)
+
+# ==================================================
+# STAGE RUNNER
+# ==================================================
+def wait_child(proc: subprocess.Popen) -> tuple:
+    """Wait for a stage process → (returncode, peak RSS bytes or None)."""
+    if hasattr(os, "wait4"):
+        _, status, usage = os.wait4(proc.pid, 0)
+        proc.returncode = os.waitstatus_to_exitcode(status)
+        peak = usage.ru_maxrss if sys.platform == "darwin" else usage.ru_maxrss * 1024
+        return proc.returncode, peak
+
+    return proc.wait(), None
+
+
+def run_stage(name: str, fp: str | None) -> dict:
+    stage = STAGES[name]
+    script = SCRIPTS / stage["script"]
+
+    log = LOG_DIR / "stages" / f"{name}.log"
+    log.parent.mkdir(parents=True, exist_ok=True)
+
+    before = snapshot(stage["outputs"])
+    start = time.perf_counter()
+
+    # through marketforge.metrics → every stage run writes logs/metrics/<stage>.jsonl
+    path = os.pathsep.join(filter(None, [str(CODE_ROOT), os.environ.get("PYTHONPATH")]))
+
+    with open(log, "w", encoding="utf-8") as out:
+        proc = subprocess.Popen(
+            [sys.executable, "-m", "marketforge.metrics", name, str(script)],
+            cwd=str(script.parent),
+            env={**os.environ, "PYTHONPATH": path},
+            stdout=out,
+            stderr=subprocess.STDOUT,
+        )
+        returncode, peak = wait_child(proc)
+
+    wall = time.perf_counter() - start
+    files, rows, size = output_delta(before, snapshot(stage["outputs"]))
+
+    return {
+        "stage": name,
+        "status": "ok" if returncode == 0 else "failed",
+        "returncode": returncode,
+        "wall_s": round(wall, 3),
+        "peak_rss": peak,
+        "files_out": files,
+        "rows_out": rows,
+        "bytes_out": size,
+        "fingerprint": fp,
+        "log": str(log),
+    }
+
+
+def topo_order(names: list) -> list:
+    """names + all their prerequisites, dependencies first."""
+    order, seen = [], set()
+
+    def visit(n):
+        if n in seen:
+            return
+        seen.add(n)
+        for dep in STAGES[n]["after"]:
+            visit(dep)
+        order.append(n)
+
+    for n in names:
+        visit(n)
+    return order
+
+
+def select(branches: list) -> dict:
+    chosen = {n: s for n, s in STAGES.items() if s["branch"] in branches}
+
+    # pull in cross-branch prerequisites (e.g. greeks need indices)
+    pending = list(chosen)
+    while pending:
+        for dep in STAGES[pending.pop()]["after"]:
+            if dep not in chosen:
+                chosen[dep] = STAGES[dep]
+                pending.append(dep)
+
+    return chosen
+
+
+def run(stages: dict, jobs: int, force: bool, dry_run: bool) -> list:
+    state = load_state()
+    done = {}         # stage → status
+    results = []
+    running = {}
+
+    # prerequisites outside `stages` (e.g. downloads in watch mode) count as met
+    def ready(name):
+        return all(
+            done.get(d) in ("ok", "skipped")
+            for d in stages[name]["after"] if d in stages
+        )
+
+    def blocked(name):
+        return any(done.get(d) in ("failed", "blocked") for d in stages[name]["after"])
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        while len(done) < len(stages):
+            # ---------- SCHEDULE EVERYTHING THAT IS READY ----------
+            for name in stages:
+                if name in done or name in running.values():
+                    continue
+
+                if blocked(name):
+                    done[name] = "blocked"
+                    results.append({"stage": name, "status": "blocked"})
+                    print(f" BLOCKED  {name}")
+                    continue
+
+                if not ready(name):
+                    continue
+
+                inputs = stages[name]["inputs"]
+                fp = fingerprint(inputs) if inputs is not None else None
+
+                if (
+                    not force
+                    and fp is not None
+                    and state.get(name, {}).get("fingerprint") == fp
+                ):
+                    done[name] = "skipped"
+                    results.append({"stage": name, "status": "skipped", "fingerprint": fp})
+                    print(f" SKIP     {name} (inputs unchanged)")
+                    continue
+
+                if dry_run:
+                    done[name] = "ok"
+                    print(f" PLAN     {name} → {stages[name]['script']}")
+                    continue
+
+                print(f" START    {name}")
+                running[pool.submit(run_stage, name, fp)] = name
+
+            if not running:
+                continue
+
+            # ---------- COLLECT ----------
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+
+            for fut in finished:
+                name = running.pop(fut)
+                res = fut.result()
+                results.append(res)
+                done[name] = res["status"]
+
+                print(
+                    f" {res['status'].upper():<8} {name} "
+                    f"| {res['wall_s']:.1f}s | rows {res['rows_out']} "
+                    f"| bytes {res['bytes_out']}"
+                )
+
+                if res["status"] == "ok" and res["fingerprint"] is not None:
+                    state[name] = {
+                        "fingerprint": res["fingerprint"],
+                        "finished": datetime.now().isoformat(timespec="seconds"),
+                    }
+                    save_state(state)
+
+    return results
+
+
+def write_run_record(branches: list, wall: float, results: list) -> Path:
+    LOG_DIR.mkdir(parents=True, exist_ok=True)
+    run_file = LOG_DIR / f"run_{datetime.now():%Y%m%d_%H%M%S}.json"
+    run_file.write_text(json.dumps({
+        "started": datetime.now().isoformat(timespec="seconds"),
+        "branches": branches,
+        "wall_s": round(wall, 3),
+        "stages": results,
+    }, indent=2))
+    return run_file
+
+# ==================================================
+# MAIN
+# ==================================================
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="MarketForge DAG pipeline")
+    parser.add_argument("--branch", nargs="+", choices=BRANCHES, default=BRANCHES)
+    parser.add_argument("--jobs", type=int, default=4)
+    parser.add_argument("--force", action="store_true")
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+
+    stages = select(args.branch)
+
+    print("=====================================")
+    print(" MarketForge | DAG PIPELINE")
+    print(f" Branches : {', '.join(args.branch)}")
+    print(f" Stages   : {len(stages)} | Jobs: {args.jobs}")
+    print("=====================================")
+
+    t0 = time.perf_counter()
+    results = run(stages, args.jobs, args.force, args.dry_run)
+    total = time.perf_counter() - t0
+
+    if not args.dry_run:
+        run_file = write_run_record(args.branch, total, results)
+        print(f"\n Run record : {run_file}")
+
+    failed = [r["stage"] for r in results if r["status"] in ("failed", "blocked")]
+
+    print(f" Wall time  : {total:.1f}s")
+
+    if failed:
+        print(f" FAILED / BLOCKED : {', '.join(failed)}")
+        sys.exit(1)
+
+    print(" PIPELINE COMPLETED SUCCESSFULLY")
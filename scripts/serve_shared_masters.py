@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+MarketForge | SHARED-MEMORY MASTER LOADER (BACKTEST WORKERS)
+
+✔ Reads each requested master ONCE (options: hot + cold tiers) and
+  publishes it as one shared-memory segment (marketforge/shm.py)
+✔ Workers map it by name, zero-copy:
+      with shm.attach(shm.segment_name("options", "NIFTY")) as s:
+          df = s.frame()
+  → RAM stays flat however many workers attach
+✔ Segment lifetime is refcounted: stopping the loader drops only its
+  own hold, the last worker to detach frees the memory
+✔ --list → published segments and their live holders
+
+Usage:
+    python serve_shared_masters.py --dataset options futures --symbol NIFTY BANKNIFTY
+    python serve_shared_masters.py --list
+"""
+
+from pathlib import Path
+from datetime import datetime
+import argparse
+import signal
+import sys
+import time
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from marketforge.masters import MASTERS  # noqa: E402
+from marketforge import shm, tiers  # noqa: E402
+
+
+def log(msg: str) -> None:
+    print(f" {datetime.now():%H:%M:%S} {msg}", flush=True)
+
+# ==================================================
+# LOAD ONE MASTER
+# ==================================================
+def load(dataset: str, symbol: str) -> pd.DataFrame:
+    """Every segment's rows for symbol (tiered masters: both tiers)."""
+    spec = MASTERS[dataset]
+    parts = []
+
+    for _, _, out_dir in spec["sources"]:
+        if spec["tiered"]:
+            if symbol in tiers.names(out_dir):
+                parts.append(tiers.read(out_dir, symbol))
+            continue
+
+        f = out_dir / (spec["single"] or f"{symbol}.csv")
+        if f.exists():
+            parts.append(pd.read_csv(f, low_memory=False))
+
+    if not parts:
+        raise RuntimeError(f" No {dataset} master for {symbol}")
+    return pd.concat(parts, ignore_index=True)
+
+# ==================================================
+# MAIN
+# ==================================================
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Publish masters in shared memory for worker processes")
+    parser.add_argument("--dataset", nargs="+", choices=sorted(MASTERS), default=["options", "futures"])
+    parser.add_argument("--symbol", nargs="+", default=["NIFTY"])
+    parser.add_argument("--list", action="store_true", help="show published segments and exit")
+    args = parser.parse_args()
+
+    if args.list:
+        for name, pids in shm.published().items():
+            print(f" {name:<32} holders: {', '.join(map(str, pids)) or '-'}")
+        sys.exit(0)
+
+    print("=====================================")
+    print(" MarketForge | SHARED-MEMORY LOADER")
+    print(f" Datasets : {', '.join(args.dataset)}")
+    print(f" Symbols  : {', '.join(args.symbol)}")
+    print("=====================================")
+
+    # SIGTERM (service manager stop) → same clean release as Ctrl+C
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+
+    segments = {}
+    try:
+        for dataset in args.dataset:
+            for symbol in args.symbol:
+                name = shm.segment_name(dataset, symbol)
+                t0 = time.perf_counter()
+                df = load(dataset, symbol)
+                segments[name] = shm.publish(name, df)
+                log(
+                    f"{name:<32} {len(df):>10,} rows | "
+                    f"{segments[name].size / 1e6:8.1f} MB | {time.perf_counter() - t0:.1f}s"
+                )
+                del df
+
+        log(f"Serving {len(segments)} segment(s) — Ctrl+C to stop")
+        while True:
+            time.sleep(1)
+
+    except KeyboardInterrupt:
+        log("Stopping")
+    finally:
+        for name, seg in segments.items():
+            freed = shm.release(name, seg)
+            log(f"{name:<32} {'freed' if freed else 'still attached — freed by the last worker'}")
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+MarketForge | WATCH MODE (EVENT-DRIVEN PIPELINE)
+
+✔ Long-running: polls the raw landing folders every --interval seconds
+✔ A file counts as landed once size + mtime are stable for one scan
+  (half-downloaded ZIPs are never picked up)
+✔ New file → only ITS branch chain runs (unzip → clean → append → derived),
+  same DAG, skip-unchanged state & run records as run_pipeline.py
+✔ Bounded queue (--queue): when the runner falls behind, scanning pauses
+  (backpressure) — files are picked up on the next scan, never dropped
+✔ Files queued while a chain runs are coalesced into the next run
+✔ Files already present at start-up are ignored (use --initial to
+  process them once)
+
+Usage:
+    python watch_pipeline.py
+    python watch_pipeline.py --branch fo mto --interval 1 --jobs 4
+    python watch_pipeline.py --once     (exit after the first run)
+
+Note: "latest file" stages (MTO, indices clean) process the newest file;
+older backlog days go through the rebuild / catch-up tools.
+"""
+
+from pathlib import Path
+from datetime import datetime
+import argparse
+import queue
+import sys
+import threading
+import time
+
+SCRIPTS = Path(__file__).resolve().parent
+sys.path.insert(0, str(SCRIPTS))
+
+import run_pipeline as pipeline  # noqa: E402
+
+RAW = pipeline.RAW
+
+# ==================================================
+# WATCHED LANDING FOLDERS (FILES THE DOWNLOADERS WRITE)
+# ==================================================
+WATCH = {
+    "cm": (RAW / "equity", "BhavCopy_NSE_CM*.zip"),
+    "fo": (RAW / "futures", "fo*.zip"),
+    "mto": (RAW / "equityDat", "MTO_*.DAT"),
+    "indices": (RAW / "indices", "indices_ohlc_eod_*.csv"),
+}
+
+
+def log(msg: str) -> None:
+    print(f" {datetime.now():%H:%M:%S} {msg}", flush=True)
+
+
+# ==================================================
+# CHAINS
+# ==================================================
+def downstream(roots: list) -> list:
+    """Every stage that (transitively) depends on `roots`, excluding roots."""
+    found = set()
+    changed = True
+    while changed:
+        changed = False
+        for name, s in pipeline.STAGES.items():
+            if name not in found and any(d in found or d in roots for d in s["after"]):
+                found.add(name)
+                changed = True
+    return [n for n in pipeline.topo_order(sorted(found)) if n in found]
+
+
+def chain(branches: set) -> dict:
+    roots = [n for n, s in pipeline.STAGES.items() if s["branch"] in branches and s["inputs"] is None]
+    return {n: pipeline.STAGES[n] for n in downstream(roots)}
+
+
+# ==================================================
+# SCANNER (PRODUCER)
+# ==================================================
+def listing(branches: list) -> dict:
+    out = {}
+    for b in branches:
+        folder, pattern = WATCH[b]
+        if not folder.is_dir():
+            continue
+        for f in folder.glob(pattern):
+            try:
+                st = f.stat()
+            except FileNotFoundError:
+                continue
+            out[f] = (b, st.st_size, st.st_mtime_ns)
+    return out
+
+
+def scanner(branches: list, q: queue.Queue, interval: float, initial: bool, stop: threading.Event):
+    seen = set() if initial else set(listing(branches))
+    pending = {}    # path → (size, mtime) from the previous scan
+
+    log(f"Watching {len(branches)} folder(s), {len(seen)} existing file(s) ignored")
+
+    while not stop.is_set():
+        now = listing(branches)
+
+        for f, (b, size, mtime) in sorted(now.items(), key=lambda kv: kv[1][2]):
+            if f in seen:
+                continue
+
+            # stable across two scans → download finished
+            if size > 0 and pending.get(f) == (size, mtime):
+                if q.full():
+                    log(f"Queue full ({q.maxsize}) — backpressure, scanning paused")
+                while not stop.is_set():
+                    try:
+                        q.put((b, f), timeout=interval)
+                        break
+                    except queue.Full:
+                        continue
+                seen.add(f)
+                pending.pop(f, None)
+                log(f"LANDED   {b:<8} {f.name}")
+            else:
+                pending[f] = (size, mtime)
+
+        stop.wait(interval)
+
+
+# ==================================================
+# RUNNER (CONSUMER)
+# ==================================================
+def drain(q: queue.Queue, first: tuple) -> list:
+    items = [first]
+    while True:
+        try:
+            items.append(q.get_nowait())
+        except queue.Empty:
+            return items
+
+
+def runner(q: queue.Queue, jobs: int, once: bool, stop: threading.Event):
+    while not stop.is_set():
+        try:
+            first = q.get(timeout=0.5)
+        except queue.Empty:
+            continue
+
+        items = drain(q, first)
+        branches = sorted({b for b, _ in items})
+        stages = chain(set(branches))
+
+        log(f"RUN      {', '.join(branches)} | {len(items)} file(s) | {len(stages)} stage(s)")
+
+        t0 = time.perf_counter()
+        results = pipeline.run(stages, jobs, force=False, dry_run=False)
+        wall = time.perf_counter() - t0
+
+        run_file = pipeline.write_run_record(branches, wall, results)
+        failed = [r["stage"] for r in results if r["status"] in ("failed", "blocked")]
+
+        status = f"FAILED ({', '.join(failed)})" if failed else "OK"
+        log(f"DONE     {', '.join(branches)} | {status} | {wall:.1f}s | {run_file.name}")
+
+        for _ in items:
+            q.task_done()
+
+        if once:
+            stop.set()
+
+
+# ==================================================
+# MAIN
+# ==================================================
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="MarketForge watch mode")
+    parser.add_argument("--branch", nargs="+", choices=sorted(WATCH), default=sorted(WATCH))
+    parser.add_argument("--interval", type=float, default=2.0, help="scan interval, seconds")
+    parser.add_argument("--queue", type=int, default=16, help="max queued files before backpressure")
+    parser.add_argument("--jobs", type=int, default=4)
+    parser.add_argument("--initial", action="store_true", help="also process files already present")
+    parser.add_argument("--once", action="store_true", help="exit after the first run")
+    args = parser.parse_args()
+
+    print("=====================================")
+    print(" MarketForge | WATCH MODE")
+    for b in args.branch:
+        folder, pattern = WATCH[b]
+        print(f" {b:<8}: {folder / pattern}")
+    print(f" Interval : {args.interval}s | Queue: {args.queue} | Jobs: {args.jobs}")
+    print("=====================================")
+
+    q = queue.Queue(maxsize=args.queue)
+    stop = threading.Event()
+
+    scan = threading.Thread(
+        target=scanner,
+        args=(args.branch, q, args.interval, args.initial, stop),
+        daemon=True,
+    )
+    scan.start()
+
+    try:
+        runner(q, args.jobs, args.once, stop)
+    except KeyboardInterrupt:
+        log("Stopping (Ctrl+C)")
+    finally:
+        stop.set()
+        scan.join(timeout=args.interval * 2)